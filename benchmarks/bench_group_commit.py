@@ -0,0 +1,85 @@
+"""Group commit benchmark
+
+Times concurrent task writes committed one transaction each against writes committed in
+batches by the group commit writer:
+
+    python -m benchmarks.bench_group_commit --writes 2000 --threads 32 --synchronous full
+
+The database is a temporary SQLite file unless ``--database-url`` points elsewhere,
+in which case its tables are dropped when the benchmark ends.
+"""
+import argparse
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config.settings import get_settings
+from db.group_commit import GroupCommitWriter
+from db.migrations import downgrade_database
+from db.migrations import upgrade_database
+from db.sqlalchemy_database import create_database_engine
+from repositories.group_commit_tasks_repo import GroupCommitTaskRepository
+from repositories.tasks_repo import SQLAlchemyTaskRepository
+from schema.task_sch import SQLAlchemyTask
+from sqlalchemy.orm import sessionmaker
+
+
+def run_writes(session_factory, writes: int, threads: int, writer=None) -> float:
+    """Add and complete tasks from concurrent threads and return the writes per second"""
+
+    def write(number):
+        with session_factory() as session:
+            if writer is None:
+                repository = SQLAlchemyTaskRepository(session=session, list_id=1)
+            else:
+                repository = GroupCommitTaskRepository(session=session, list_id=1, writer=writer)
+            task = repository.add_task(SQLAlchemyTask(description=f'Task number {number}'))
+            repository.mark_task_as_completed(task_id=task.id)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(write, range(writes // 2)))
+    return writes / (time.perf_counter() - started)
+
+
+def main():
+    """Run the benchmark and print the throughput of both modes"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--writes', type=int, default=2000)
+    parser.add_argument('--threads', type=int, default=32)
+    parser.add_argument('--max-latency', type=float, default=0.002)
+    parser.add_argument('--max-batch-size', type=int, default=64)
+    parser.add_argument('--synchronous', default='normal', choices=('off', 'normal', 'full', 'extra'))
+    parser.add_argument('--database-url')
+    args = parser.parse_args()
+
+    settings = get_settings().model_copy(update={'sqlite_synchronous': args.synchronous, 'pool_size': args.threads + 1})
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = args.database_url or f'sqlite:///{directory}/bench_group_commit.db'
+        engine = create_database_engine(database_url, settings)
+        with engine.connect() as connection:
+            upgrade_database(connection=connection)
+            connection.commit()
+        session_factory = sessionmaker(autoflush=False, bind=engine)
+        with session_factory() as session:
+            SQLAlchemyTaskRepository(session=session, list_id=1).add_task(SQLAlchemyTask(description='First task'))
+
+        single = run_writes(session_factory, args.writes, args.threads)
+        writer = GroupCommitWriter(session_factory, max_latency=args.max_latency, max_batch_size=args.max_batch_size)
+        grouped = run_writes(session_factory, args.writes, args.threads, writer)
+        writer.stop()
+
+        with engine.connect() as connection:
+            downgrade_database('base', connection=connection)
+            connection.commit()
+        engine.dispose()
+
+    stats = writer.stats()
+    print(f'{args.writes} writes from {args.threads} threads, synchronous={args.synchronous}')
+    print(f'{"mode":<16}{"writes/s":>12}')
+    print(f'{"one per commit":<16}{single:>12.0f}')
+    print(f'{"group commit":<16}{grouped:>12.0f}   {stats["writes"] / stats["batches"]:.1f} writes per batch')
+
+
+if __name__ == '__main__':
+    main()
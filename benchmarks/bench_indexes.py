@@ -0,0 +1,190 @@
+"""Task indexes benchmark
+
+Times the task queries of one list in two cases. The ``indexes`` case runs them on a
+list holding every task, without and then with the completion indexes. The ``spread``
+case runs them when the list holds every task, and when the same number of tasks is
+spread over many lists:
+
+    python -m benchmarks.bench_indexes --rows 1000000 --lists 1000
+
+Either case runs alone with ``--case``. The database is a temporary SQLite file unless
+``--database-url`` points elsewhere, in which case its tables are dropped when the
+benchmark ends.
+"""
+import argparse
+import statistics
+import tempfile
+import time
+from typing import Optional
+
+from config.settings import get_settings
+from db.migrations import downgrade_database
+from db.migrations import upgrade_database
+from db.sqlalchemy_database import create_database_engine
+from repositories import iter_chunks
+from repositories.tasks_repo import task_counts_statement
+from repositories.tasks_repo import task_list_statement
+from repositories.tasks_repo import tasks_page_statement
+from schema.task_list_sch import SQLAlchemyTaskList
+from schema.task_sch import SQLAlchemyTask
+from schema.user_sch import SQLAlchemyUser
+from sqlalchemy import delete
+from sqlalchemy import insert
+from sqlalchemy import inspect
+from sqlalchemy import select
+from sqlalchemy import update
+
+
+PAGE_SIZE = 50
+INSERT_ROWS = 10_000
+
+COMPLETION_INDEXES = ('ix_tasks_list_id_completed_id', 'ix_tasks_list_id_completed')
+"""Indexes serving the completion filters of a list, compared against the list index alone"""
+
+
+def task_values(number: int, list_id: int, completed_every: Optional[int] = 4) -> dict:
+    """Get the column values of the benchmark task of a number, every ``completed_every`` one being completed"""
+    completed = completed_every is not None and number % completed_every == 0
+    return {'list_id': list_id, 'description': f'Task number {number}', 'completed': completed}
+
+
+def populate(connection, rows: int, lists: int, completed_every: Optional[int] = 4) -> int:
+    """Insert tasks spread over new lists, one in ``completed_every`` completed, and return the id of the first list"""
+    user_id = connection.execute(insert(SQLAlchemyUser).values(name='bench').returning(SQLAlchemyUser.id)).scalar_one()
+    list_ids = connection.scalars(
+        insert(SQLAlchemyTaskList).returning(SQLAlchemyTaskList.id, sort_by_parameter_order=True),
+        [{'user_id': user_id, 'name': f'List number {number}'} for number in range(lists)],
+    ).all()
+    values = (task_values(number, list_ids[number % lists], completed_every) for number in range(rows))
+    for chunk in iter_chunks(values, 10_000):
+        connection.execute(insert(SQLAlchemyTask), chunk)
+    connection.commit()
+    analyze(connection)
+    return list_ids[0]
+
+
+def analyze(connection):
+    """Refresh the planner statistics"""
+    connection.exec_driver_sql('ANALYZE')
+    connection.commit()
+
+
+def timed(run, repeat: int) -> float:
+    """Get the median duration of a callable in milliseconds"""
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        durations.append((time.perf_counter() - started) * 1000)
+    return statistics.median(durations)
+
+
+def measure(connection, list_id: int, rows: int, repeat: int) -> dict:
+    """Time the read queries of the task views of a list and the writes maintaining the indexes"""
+
+    def read(statement):
+        return lambda: connection.execute(statement).all()
+
+    def rolled_back(statement, parameters=None):
+        def run():
+            connection.execute(statement, parameters)
+            connection.rollback()
+
+        return run
+
+    new_tasks = [
+        {'list_id': list_id, 'description': f'New task number {number}', 'completed': False}
+        for number in range(INSERT_ROWS)
+    ]
+    in_list = SQLAlchemyTask.list_id == list_id
+    first_tasks = select(SQLAlchemyTask.id).where(in_list).order_by(SQLAlchemyTask.id).limit(INSERT_ROWS)
+    queries = {
+        'counts': read(task_counts_statement(list_id)),
+        'first page, all': read(task_list_statement(list_id, limit=PAGE_SIZE + 1)),
+        'first page, active': read(task_list_statement(list_id, completed=False, limit=PAGE_SIZE + 1)),
+        'first page, completed': read(task_list_statement(list_id, completed=True, limit=PAGE_SIZE + 1)),
+        'middle page, completed': read(
+            tasks_page_statement(list_id, completed=True, after_id=rows // 2, limit=PAGE_SIZE + 1)
+        ),
+        f'insert {INSERT_ROWS} tasks': rolled_back(insert(SQLAlchemyTask), new_tasks),
+        f'rename {INSERT_ROWS} tasks': rolled_back(
+            update(SQLAlchemyTask)
+            .where(SQLAlchemyTask.id.in_(first_tasks))
+            .values(description=SQLAlchemyTask.description + '!')
+        ),
+        'clear completed': rolled_back(delete(SQLAlchemyTask).where(in_list, SQLAlchemyTask.completed)),
+    }
+    return {name: timed(run, repeat) for name, run in queries.items()}
+
+
+def run_layout(engine, rows: int, lists: int, repeat: int) -> dict:
+    """Time the queries of the first list on a fresh schema holding the tasks spread over ``lists`` lists"""
+    with engine.connect() as connection:
+        upgrade_database(connection=connection)
+        connection.commit()
+        list_id = populate(connection, rows, lists)
+        timings = measure(connection, list_id, rows, repeat)
+        downgrade_database('base', connection=connection)
+        connection.commit()
+    return timings
+
+
+def run_indexes(engine, rows: int, repeat: int) -> tuple:
+    """Time the queries of a list holding every task without the completion indexes, then with them"""
+    with engine.connect() as connection:
+        upgrade_database(connection=connection)
+        connection.commit()
+        list_id = populate(connection, rows, 1)
+        existing = {index['name'] for index in inspect(connection).get_indexes(SQLAlchemyTask.__tablename__)}
+        indexes = [index for index in SQLAlchemyTask.__table__.indexes if index.name in COMPLETION_INDEXES]
+        indexes = [index for index in indexes if index.name in existing]
+        for index in indexes:
+            index.drop(connection)
+        analyze(connection)
+        without = measure(connection, list_id, rows, repeat)
+        for index in indexes:
+            index.create(connection)
+        analyze(connection)
+        with_indexes = measure(connection, list_id, rows, repeat)
+        downgrade_database('base', connection=connection)
+        connection.commit()
+    return without, with_indexes
+
+
+def print_timings(title: str, before: dict, after: dict):
+    """Print the timings of the queries in two setups and the speedup of the second one"""
+    print(f'{"query":<28}{title}{"speedup":>10}')
+    for name, duration in before.items():
+        print(f'{name:<28}{duration:>12.2f}{after[name]:>14.2f}{duration / after[name]:>9.1f}x')
+
+
+def main():
+    """Run the benchmark cases and print their timings"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--lists', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--case', choices=('indexes', 'spread'), action='append')
+    parser.add_argument('--database-url')
+    args = parser.parse_args()
+    cases = args.case or ['indexes', 'spread']
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = args.database_url or f'sqlite:///{directory}/bench_indexes.db'
+        engine = create_database_engine(database_url, get_settings())
+        if 'indexes' in cases:
+            without, with_indexes = run_indexes(engine, args.rows, args.repeat)
+        if 'spread' in cases:
+            single = run_layout(engine, args.rows, 1, args.repeat)
+            spread = run_layout(engine, args.rows, args.lists, args.repeat)
+        engine.dispose()
+
+    print(f'{args.rows} tasks, median of {args.repeat} runs in milliseconds')
+    if 'indexes' in cases:
+        print_timings(f'{"list index":>12}{"+ completion":>14}', without, with_indexes)
+    if 'spread' in cases:
+        print_timings(f'{"1 list":>12}{f"{args.lists} lists":>14}', single, spread)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+"""HTTP load benchmark
+
+Serves the app with uvicorn on a list of each size of ``--sizes`` and drives it with
+concurrent users, each one loading the page, the task list and the footer status, adding a
+task, finding it, completing it and clearing the completed tasks, so the list keeps its size:
+
+    python -m benchmarks.bench_load --sizes 10,1000,100000,1000000 --output load.json
+
+The p50, p99 and requests per second of every route and of all of them together are printed
+as JSON. Given the report of a previous run, ``--baseline`` exits with an error when a p99 or a
+throughput regressed by more than ``--max-regression``. The database is a temporary SQLite
+file unless ``--database-url`` points elsewhere, in which case its tables are dropped when
+the benchmark ends. Extra settings are given to the app through ``TODO_*`` variables.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import httpx
+from benchmarks.bench_indexes import populate
+from benchmarks.report import find_regressions
+from benchmarks.report import latency_summary
+from config.settings import get_settings
+from db.migrations import downgrade_database
+from db.migrations import upgrade_database
+from db.sqlalchemy_database import create_database_engine
+
+
+TASK_ID_PATTERN = re.compile(r'/tasks/(\d+)/row')
+SERVER_START_TIMEOUT = 30
+
+
+def free_port() -> int:
+    """Get a TCP port nobody listens to"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(database_url: str, list_id: int, port: int, workers: int) -> subprocess.Popen:
+    """Serve the app on the benchmarked list with uvicorn and wait until it answers"""
+    env = {**os.environ, 'TODO_DATABASE_URL': database_url, 'TODO_DEFAULT_LIST_ID': str(list_id)}
+    command = [sys.executable, '-m', 'uvicorn', 'main:create_app', '--factory', '--port', str(port)]
+    command += ['--workers', str(workers), '--no-access-log', '--log-level', 'warning']
+    server = subprocess.Popen(command, cwd=Path(__file__).parents[1], env=env)
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f'http://127.0.0.1:{port}/status').raise_for_status()
+            return server
+        except httpx.TransportError:
+            time.sleep(0.1)
+    server.terminate()
+    raise RuntimeError('The server did not start')
+
+
+async def user_session(client: httpx.AsyncClient, user: int, deadline: float, durations: dict, errors: dict):
+    """Run the scenario of a user over and over until the deadline, timing every request by route"""
+
+    async def call(route: str, method: str, url: str, **kwargs) -> httpx.Response:
+        started = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        durations[route].append(time.perf_counter() - started)
+        if response.status_code >= 400:
+            errors[route] += 1
+        return response
+
+    for iteration in itertools.count():
+        if time.monotonic() >= deadline:
+            return
+        description = f'Load test task u{user}i{iteration}'
+        await call('home', 'GET', '/')
+        await call('tasks', 'GET', '/tasks')
+        await call('status', 'GET', '/status')
+        await call('add', 'POST', '/tasks', data={'description': description})
+        found = await call('search', 'GET', '/tasks/search', params={'q': description})
+        task_ids = TASK_ID_PATTERN.findall(found.text)
+        if task_ids:
+            await call('toggle', 'PUT', f'/tasks/{task_ids[0]}/complete')
+        await call('clear', 'POST', '/tasks/clear')
+
+
+async def drive(base_url: str, users: int, duration: float) -> dict:
+    """Drive the server with concurrent users and summarize the latencies of every route"""
+    durations = defaultdict(list)
+    errors = defaultdict(int)
+    limits = httpx.Limits(max_connections=users)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        started = time.perf_counter()
+        deadline = time.monotonic() + duration
+        await asyncio.gather(*(user_session(client, user, deadline, durations, errors) for user in range(users)))
+        elapsed = time.perf_counter() - started
+
+    report = {
+        route: {**latency_summary(values, elapsed), 'errors': errors[route]} for route, values in durations.items()
+    }
+    report['all'] = {
+        **latency_summary([value for values in durations.values() for value in values], elapsed),
+        'errors': sum(errors.values()),
+    }
+    return report
+
+
+def run_size(database_url: str, size: int, args) -> dict:
+    """Load test the app on a fresh schema holding a list of ``size`` active tasks"""
+    engine = create_database_engine(database_url, get_settings())
+    with engine.connect() as connection:
+        upgrade_database(connection=connection)
+        connection.commit()
+        list_id = populate(connection, size, 1, completed_every=None)
+    try:
+        port = free_port()
+        server = start_server(database_url, list_id, port, args.workers)
+        try:
+            base_url = f'http://127.0.0.1:{port}'
+            asyncio.run(drive(base_url, args.users, args.warmup))
+            return asyncio.run(drive(base_url, args.users, args.duration))
+        finally:
+            server.terminate()
+            server.wait()
+    finally:
+        with engine.connect() as connection:
+            downgrade_database('base', connection=connection)
+            connection.commit()
+        engine.dispose()
+
+
+def main():
+    """Run the load test on every size, then print and compare its report"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='10,1000,100000')
+    parser.add_argument('--users', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--warmup', type=float, default=2)
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--database-url')
+    parser.add_argument('--output')
+    parser.add_argument('--baseline')
+    parser.add_argument('--max-regression', type=float, default=0.2)
+    args = parser.parse_args()
+
+    report = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes.split(','):
+            database_url = args.database_url or f'sqlite:///{directory}/bench_load_{size}.db'
+            report[size] = run_size(database_url, int(size), args)
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        Path(args.output).write_text(output)
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = [
+            f'{size} tasks, {regression}'
+            for size, routes in report.items()
+            for regression in find_regressions(routes, baseline.get(size, {}), args.max_regression)
+        ]
+        if regressions:
+            sys.exit('Regressions:\n' + '\n'.join(regressions))
+
+
+if __name__ == '__main__':
+    main()
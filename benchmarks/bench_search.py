@@ -0,0 +1,106 @@
+"""Task search benchmark
+
+Times full-text searches of the task descriptions against the substring scan they replace:
+
+    python -m benchmarks.bench_search --rows 1000000
+
+The database is a temporary SQLite file unless ``--database-url`` points elsewhere,
+in which case its tables are dropped when the benchmark ends.
+"""
+import argparse
+import random
+import string
+import tempfile
+
+from benchmarks.bench_indexes import timed
+from config.settings import get_settings
+from db.migrations import downgrade_database
+from db.migrations import upgrade_database
+from db.sqlalchemy_database import create_database_engine
+from repositories import iter_chunks
+from repositories.tasks_repo import search_tasks_statement
+from schema.task_sch import SQLAlchemyTask
+from sqlalchemy import insert
+
+
+PAGE_SIZE = 50
+WORDS = 5000
+
+
+def vocabulary() -> list:
+    """Build random words, ordered from the most to the least frequent"""
+    generator = random.Random(0)
+    words = {}
+    while len(words) < WORDS:
+        words[''.join(generator.choices(string.ascii_lowercase, k=generator.randint(4, 9)))] = None
+    return list(words)
+
+
+def queries(words: list) -> dict:
+    """Get the search terms of each timed query, word ``n`` being about ``n`` times rarer than the first one"""
+    return {
+        'rare word': [words[-1]],
+        'common word': [words[0]],
+        'word prefix': [words[1][:3]],
+        'two words': [words[1], words[2]],
+        'no match': ['missing'],
+    }
+
+
+def populate(connection, list_id: int, rows: int, words: list):
+    """Insert tasks of a few words drawn with a skewed frequency into a list, and refresh the planner statistics"""
+    generator = random.Random(0)
+    weights = [1 / (number + 1) for number in range(len(words))]
+    values = (
+        {
+            'list_id': list_id,
+            'description': ' '.join(generator.choices(words, weights, k=4)),
+            'completed': number % 4 == 0,
+        }
+        for number in range(rows)
+    )
+    for chunk in iter_chunks(values, 10_000):
+        connection.execute(insert(SQLAlchemyTask), chunk)
+    connection.commit()
+    connection.exec_driver_sql('ANALYZE')
+    connection.commit()
+
+
+def main():
+    """Run the benchmark and print the timings of both search strategies"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--database-url')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = args.database_url or f'sqlite:///{directory}/bench_search.db'
+        settings = get_settings()
+        engine = create_database_engine(database_url, settings)
+        with engine.connect() as connection:
+            upgrade_database(connection=connection)
+            connection.commit()
+            words = vocabulary()
+            populate(connection, settings.default_list_id, args.rows, words)
+            timings = {}
+            for name, terms in queries(words).items():
+                statements = [
+                    search_tasks_statement(dialect, settings.default_list_id, terms, limit=PAGE_SIZE + 1)
+                    for dialect in ('default', engine.dialect.name)
+                ]
+                timings[name] = [
+                    timed(lambda: connection.execute(statement).all(), args.repeat) for statement in statements
+                ]
+            downgrade_database('base', connection=connection)
+            connection.commit()
+        engine.dispose()
+
+    print(f'{args.rows} tasks, first page of {PAGE_SIZE} results, median of {args.repeat} runs in milliseconds')
+    print(f'{"query":<16}{"substring":>12}{"full-text":>12}{"speedup":>10}')
+    for name, (scan, search) in timings.items():
+        print(f'{name:<16}{scan:>12.2f}{search:>12.2f}{scan / search:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""Fixtures of the micro-benchmarks
+
+Each benchmark runs against a list holding every task of a database of its own, one per
+size of the ``--sizes`` option. The database is a temporary SQLite file unless
+``--database-url`` points elsewhere, in which case its tables are dropped once every
+benchmark of a size has run.
+"""
+from typing import NamedTuple
+
+import pytest
+from benchmarks.bench_indexes import populate
+from benchmarks.bench_indexes import task_values
+from benchmarks.report import latency_summary
+from config.settings import get_settings
+from db.migrations import downgrade_database
+from db.migrations import upgrade_database
+from db.sqlalchemy_database import create_database_engine
+from schema.task_sch import SQLAlchemyTask
+from sqlalchemy import cast
+from sqlalchemy import delete
+from sqlalchemy import Engine
+from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import literal
+from sqlalchemy import or_
+from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy import update
+from sqlalchemy.orm import sessionmaker
+
+
+DEFAULT_SIZES = '10,1000,100000'
+
+
+class Dataset(NamedTuple):
+    """Database holding a list of ``size`` benchmark tasks whose ids start at ``first_id``"""
+
+    engine: Engine
+    list_id: int
+    first_id: int
+    size: int
+
+    @property
+    def last_id(self) -> int:
+        """Id of the last task of the list"""
+        return self.first_id + self.size - 1
+
+
+def pytest_addoption(parser):
+    parser.addoption('--sizes', default=DEFAULT_SIZES, help='comma separated numbers of tasks of the list')
+    parser.addoption('--database-url', help='database to run the benchmarks on instead of a temporary SQLite file')
+
+
+def pytest_generate_tests(metafunc):
+    if 'size' in metafunc.fixturenames:
+        sizes = [int(size) for size in metafunc.config.getoption('sizes').split(',')]
+        metafunc.parametrize('size', sizes, scope='session')
+
+
+def pytest_benchmark_update_json(config, benchmarks, output_json):
+    """Add the p50, p99 and calls per second of every benchmark to the JSON report"""
+    summaries = {bench.fullname: latency_summary(bench.stats.data, bench.stats.total) for bench in benchmarks}
+    for bench in output_json['benchmarks']:
+        bench['summary'] = summaries[bench['fullname']]
+
+
+def restore(dataset: Dataset):
+    """Bring the benchmarked list back to its initial tasks after a benchmark writing to it"""
+    with dataset.engine.connect() as connection:
+        in_list = SQLAlchemyTask.list_id == dataset.list_id
+        connection.execute(delete(SQLAlchemyTask).where(in_list, SQLAlchemyTask.id > dataset.last_id))
+        if connection.scalar(select(func.count()).where(in_list)) != dataset.size:
+            existing = set(connection.scalars(select(SQLAlchemyTask.id).where(in_list)))
+            missing = [task_id for task_id in range(dataset.first_id, dataset.last_id + 1) if task_id not in existing]
+            connection.execute(
+                insert(SQLAlchemyTask),
+                [{**task_values(task_id - dataset.first_id, dataset.list_id), 'id': task_id} for task_id in missing],
+            )
+        number = SQLAlchemyTask.id - dataset.first_id
+        completed = number % 4 == 0
+        description = literal('Task number ').concat(cast(number, String))
+        connection.execute(
+            update(SQLAlchemyTask)
+            .where(in_list, or_(SQLAlchemyTask.completed != completed, SQLAlchemyTask.description != description))
+            .values(completed=completed, description=description)
+        )
+        connection.commit()
+
+
+@pytest.fixture(name='dataset', scope='session')
+def benchmark_dataset(request, size, tmp_path_factory):
+    """Database of a list of ``size`` tasks, one in four of them completed"""
+    database_url = request.config.getoption('database_url')
+    if database_url is None:
+        database_url = f'sqlite:///{tmp_path_factory.mktemp("benchmarks")}/tasks.db'
+    engine = create_database_engine(database_url, get_settings())
+    with engine.connect() as connection:
+        upgrade_database(connection=connection)
+        connection.commit()
+        list_id = populate(connection, size, 1)
+        first_id = connection.scalar(select(func.min(SQLAlchemyTask.id)))
+    yield Dataset(engine=engine, list_id=list_id, first_id=first_id, size=size)
+    with engine.connect() as connection:
+        downgrade_database('base', connection=connection)
+        connection.commit()
+    engine.dispose()
+
+
+@pytest.fixture(name='session')
+def benchmark_session(dataset):
+    """Session of the benchmarked database, whose list is restored once the benchmark is done"""
+    with sessionmaker(autoflush=False, bind=dataset.engine)() as session:
+        yield session
+    restore(dataset)
@@ -0,0 +1,33 @@
+"""Benchmark reports shared by the micro-benchmarks and the load test"""
+import math
+from typing import Sequence
+
+
+def percentile(durations: Sequence[float], fraction: float) -> float:
+    """Get the nearest-rank percentile of unsorted durations"""
+    ordered = sorted(durations)
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+def latency_summary(durations: Sequence[float], elapsed: float) -> dict:
+    """Summarize durations in seconds measured over ``elapsed`` seconds as p50, p99 and requests per second"""
+    return {
+        'requests': len(durations),
+        'p50_ms': round(percentile(durations, 0.5) * 1000, 3),
+        'p99_ms': round(percentile(durations, 0.99) * 1000, 3),
+        'rps': round(len(durations) / elapsed, 1) if elapsed else 0,
+    }
+
+
+def find_regressions(report: dict, baseline: dict, max_regression: float) -> list:
+    """List the summaries of a report whose p99 rose or whose throughput fell by more than ``max_regression``"""
+    regressions = []
+    for name, summary in report.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if summary['p99_ms'] > previous['p99_ms'] * (1 + max_regression):
+            regressions.append(f'{name}: p99 {previous["p99_ms"]} ms -> {summary["p99_ms"]} ms')
+        if summary['rps'] < previous['rps'] * (1 - max_regression):
+            regressions.append(f'{name}: {previous["rps"]} -> {summary["rps"]} req/s')
+    return regressions
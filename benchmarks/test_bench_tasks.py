@@ -0,0 +1,206 @@
+"""Task repository and service micro-benchmarks
+
+Times every method of the SQLAlchemy task repository, and every service on top of it,
+against lists of each size of the ``--sizes`` option:
+
+    python -m pytest benchmarks --sizes 10,1000,100000,1000000 --benchmark-json=micro.json
+
+Every benchmark of the JSON report gets a ``summary`` of its p50, p99 and calls per second.
+"""
+from collections import deque
+from typing import Callable
+from typing import NamedTuple
+from typing import Optional
+
+import pytest
+from benchmarks.bench_indexes import task_values
+from models.task_mdl import Task
+from orm.mappings import SQLAlchemyORM
+from repositories.tasks_repo import SQLAlchemyTaskRepository
+from schema.task_sch import SQLAlchemyTask
+from services.dependencies import load_service_class
+from services.dependencies import service_interfaces
+from sqlalchemy import insert
+
+
+PAGE_SIZE = 50
+BULK_ROWS = 1000
+SETUP_ROUNDS = 10
+"""Rounds of the benchmarks whose every call needs tasks inserted beforehand"""
+
+
+class Case(NamedTuple):
+    """Benchmarked repository method and the service calling it
+
+    The calls get the repository or the service, the middle task id of the list and the
+    keyword arguments returned by ``setup``, which prepares every round when given.
+    """
+
+    repository_call: Callable
+    service: str
+    service_call: Callable
+    setup: Optional[Callable] = None
+
+
+def add_tasks(rows: int, completed: bool):
+    """Build a setup inserting tasks into the benchmarked list and passing the id of the last one"""
+
+    def setup(session, dataset):
+        values = [{'list_id': dataset.list_id, 'description': 'New task', 'completed': completed}] * rows
+        task_ids = session.scalars(insert(SQLAlchemyTask).returning(SQLAlchemyTask.id), values).all()
+        session.commit()
+        return {'task_id': task_ids[-1]}
+
+    return setup
+
+
+def completed_tasks_setup(session, dataset):
+    """Insert a quarter of the list size in completed tasks, the share of the list every round clears"""
+    add_tasks(max(dataset.size // 4, 1), completed=True)(session, dataset)
+    return {}
+
+
+CASES = {
+    'get_tasks': Case(
+        lambda repository, task_id: repository.get_tasks(),
+        'get_tasks_srv.GetTasksService',
+        lambda service, task_id: service.execute(),
+    ),
+    'get_task': Case(
+        lambda repository, task_id: repository.get_task(task_id=task_id),
+        'get_task_srv.GetTaskService',
+        lambda service, task_id: service.execute(task_id=task_id),
+    ),
+    'get_completed_tasks': Case(
+        lambda repository, task_id: repository.get_completed_tasks(),
+        'get_completed_tasks_srv.GetCompletedTasksService',
+        lambda service, task_id: service.execute(),
+    ),
+    'get_not_completed_tasks': Case(
+        lambda repository, task_id: repository.get_not_completed_tasks(),
+        'get_not_completed_tasks_srv.GetNotCompletedTasksService',
+        lambda service, task_id: service.execute(),
+    ),
+    'get_task_list': Case(
+        lambda repository, task_id: repository.get_task_list(limit=PAGE_SIZE + 1),
+        'get_task_list_srv.GetTaskListService',
+        lambda service, task_id: service.execute(limit=PAGE_SIZE + 1),
+    ),
+    'get_tasks_page': Case(
+        lambda repository, task_id: repository.get_tasks_page(after_id=task_id, limit=PAGE_SIZE + 1),
+        'get_tasks_page_srv.GetTasksPageService',
+        lambda service, task_id: service.execute(after_id=task_id, limit=PAGE_SIZE + 1),
+    ),
+    'get_task_counts': Case(
+        lambda repository, task_id: repository.get_task_counts(),
+        'get_task_counts_srv.GetTaskCountsService',
+        lambda service, task_id: service.execute(),
+    ),
+    'get_data_version': Case(
+        lambda repository, task_id: repository.get_data_version(),
+        'get_data_version_srv.GetDataVersionService',
+        lambda service, task_id: service.execute(),
+    ),
+    'iter_tasks': Case(
+        lambda repository, task_id: deque(repository.iter_tasks(), maxlen=0),
+        'stream_tasks_srv.StreamTasksService',
+        lambda service, task_id: deque(service.execute(), maxlen=0),
+    ),
+    'search_tasks': Case(
+        lambda repository, task_id: repository.search_tasks(query='task numb', limit=PAGE_SIZE + 1),
+        'search_tasks_srv.SearchTasksService',
+        lambda service, task_id: service.execute(query='task numb', limit=PAGE_SIZE + 1),
+    ),
+    'add_task': Case(
+        lambda repository, task_id: repository.add_task(task=SQLAlchemyTask(description='New task')),
+        'add_task_srv.AddTaskService',
+        lambda service, task_id: service.execute(task=Task(description='New task')),
+    ),
+    'update_task_description': Case(
+        lambda repository, task_id: repository.update_task_description(
+            task=SQLAlchemyTask(id=task_id, description='Renamed task')
+        ),
+        'update_task_description_srv.UpdateTaskDescriptionService',
+        lambda service, task_id: service.execute(task=Task(id=task_id, description='Renamed task')),
+    ),
+    'mark_task_as_completed': Case(
+        lambda repository, task_id: repository.mark_task_as_completed(task_id=task_id),
+        'mark_task_as_completed_srv.MarkTaskAsCompletedService',
+        lambda service, task_id: service.execute(task_id=task_id),
+    ),
+    'mark_task_as_not_completed': Case(
+        lambda repository, task_id: repository.mark_task_as_not_completed(task_id=task_id),
+        'mark_task_as_not_completed_srv.MarkTaskAsNotCompletedService',
+        lambda service, task_id: service.execute(task_id=task_id),
+    ),
+    'mark_tasks_as_completed': Case(
+        lambda repository, task_id: repository.mark_tasks_as_completed(),
+        'mark_tasks_as_completed_srv.MarkTasksAsCompletedService',
+        lambda service, task_id: service.execute(),
+    ),
+    'mark_tasks_as_not_completed': Case(
+        lambda repository, task_id: repository.mark_tasks_as_not_completed(),
+        'mark_tasks_as_not_completed_srv.MarkTasksAsNotCompletedService',
+        lambda service, task_id: service.execute(),
+    ),
+    'toggle_all': Case(
+        lambda repository, task_id: repository.toggle_all(),
+        'toggle_all_tasks_srv.ToggleAllTasksService',
+        lambda service, task_id: service.execute(),
+    ),
+    'delete_task': Case(
+        lambda repository, task_id: repository.delete_task(task_id=task_id),
+        'delete_task_srv.DeleteTaskService',
+        lambda service, task_id: service.execute(task_id=task_id),
+        setup=add_tasks(1, completed=False),
+    ),
+    'delete_completed_tasks': Case(
+        lambda repository, task_id: repository.delete_completed_tasks(),
+        'delete_completed_tasks_srv.DeleteCompletedTasksService',
+        lambda service, task_id: service.execute(),
+        setup=completed_tasks_setup,
+    ),
+    'bulk_add_tasks': Case(
+        lambda repository, task_id: repository.bulk_add_tasks(
+            task_values(number, repository.list_id) for number in range(BULK_ROWS)
+        ),
+        'bulk_add_tasks_srv.BulkAddTasksService',
+        lambda service, task_id: service.execute(tasks=(Task(description='New task') for _ in range(BULK_ROWS))),
+    ),
+}
+
+
+def run(benchmark, session, dataset, case: Case, call: Callable, target):
+    """Benchmark a call, preparing every round with the setup of the case when it has one"""
+    task_id = dataset.first_id + dataset.size // 2
+    if case.setup is None:
+        benchmark(call, target, task_id)
+        return
+
+    def setup():
+        return (target,), {'task_id': task_id, **case.setup(session, dataset)}
+
+    benchmark.pedantic(call, setup=setup, rounds=SETUP_ROUNDS)
+
+
+@pytest.mark.parametrize('name', CASES)
+def test_repository(benchmark, session, dataset, name):
+    """Benchmark a method of the SQLAlchemy task repository"""
+    benchmark.group = f'repository, {dataset.size} tasks'
+    case = CASES[name]
+    repository = SQLAlchemyTaskRepository(session=session, list_id=dataset.list_id)
+    run(benchmark, session, dataset, case, case.repository_call, repository)
+
+
+@pytest.mark.parametrize('name', CASES)
+def test_service(benchmark, session, dataset, name):
+    """Benchmark the service calling a method of the SQLAlchemy task repository"""
+    benchmark.group = f'service, {dataset.size} tasks'
+    case = CASES[name]
+    service_class = load_service_class(f'services.tasks.{case.service}')
+    dependencies = {
+        'task_repository': SQLAlchemyTaskRepository(session=session, list_id=dataset.list_id),
+        'orm': SQLAlchemyORM(),
+    }
+    service = service_class(**{key: dependencies[key] for key in service_interfaces(service_class)})
+    run(benchmark, session, dataset, case, case.service_call, service)
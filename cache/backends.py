@@ -0,0 +1,97 @@
+"""Cache backends module"""
+import threading
+import time
+from abc import ABC
+from abc import abstractmethod
+from collections import OrderedDict
+from typing import Any
+from typing import Hashable
+from typing import Optional
+
+
+class CacheBackend(ABC):
+    """Key-value store backing a cache"""
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Any:
+        """Get a cached value, or None if it is missing or expired"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Cache a value, for ``ttl`` seconds if given"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def delete(self, key: Hashable):
+        """Remove a cached value"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def clear(self):
+        """Remove all cached values"""
+        raise NotImplementedError()
+
+
+class LRUCacheBackend(CacheBackend):
+    """Thread-safe in-process cache evicting the least recently used entries"""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Get a cached value, or None if it is missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Cache a value, for ``ttl`` seconds if given"""
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        """Remove a cached value"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove all cached values"""
+        with self._lock:
+            self._entries.clear()
+
+
+class FakeCacheBackend(CacheBackend):
+    """Unbounded dictionary cache ignoring expiration, meant for tests"""
+
+    def __init__(self) -> None:
+        self.entries = {}
+
+    def get(self, key: Hashable) -> Any:
+        """Get a cached value, or None if it is missing"""
+        return self.entries.get(key)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Cache a value"""
+        self.entries[key] = value
+
+    def delete(self, key: Hashable):
+        """Remove a cached value"""
+        self.entries.pop(key, None)
+
+    def clear(self):
+        """Remove all cached values"""
+        self.entries.clear()
@@ -0,0 +1,75 @@
+"""Read-through cache module"""
+import threading
+import uuid
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Hashable
+from typing import Iterable
+from typing import Optional
+
+from cache.backends import CacheBackend
+
+
+class ReadThroughCache:
+    """Cache loading missing values on demand, with entries grouped for invalidation
+
+    Entries are keyed by the current version of each of their groups, so invalidating a
+    group just replaces its version: stale entries become unreachable and age out of the
+    backend, and a value loaded concurrently with a write is stored under the old version.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: Optional[float] = None) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._metrics_lock = threading.Lock()
+
+    def _group_version(self, group: str) -> str:
+        version_key = ('version', group)
+        version = self.backend.get(version_key)
+        if version is None:
+            version = uuid.uuid4().hex
+            self.backend.set(version_key, version)
+        return version
+
+    def _versioned_key(self, groups: Iterable[str], key: Hashable) -> Hashable:
+        return (tuple(self._group_version(group) for group in groups), key)
+
+    def _record(self, hit: bool):
+        with self._metrics_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get_or_load(self, groups: Iterable[str], key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Get a cached value, loading and caching it on a miss"""
+        versioned_key = self._versioned_key(groups, key)
+        value = self.backend.get(versioned_key)
+        self._record(hit=value is not None)
+        if value is None:
+            value = loader()
+            self.backend.set(versioned_key, value, ttl=self.ttl)
+        return value
+
+    async def get_or_load_async(self, groups: Iterable[str], key: Hashable, loader: Callable[[], Awaitable]) -> Any:
+        """Get a cached value, awaiting the loader and caching its result on a miss"""
+        versioned_key = self._versioned_key(groups, key)
+        value = self.backend.get(versioned_key)
+        self._record(hit=value is not None)
+        if value is None:
+            value = await loader()
+            self.backend.set(versioned_key, value, ttl=self.ttl)
+        return value
+
+    def invalidate(self, *groups: str):
+        """Make every entry of the given groups stale"""
+        for group in groups:
+            self.backend.set(('version', group), uuid.uuid4().hex)
+
+    def stats(self) -> dict:
+        """Get the hit and miss counters"""
+        with self._metrics_lock:
+            return {'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,54 @@
+"""Application settings module"""
+import os
+from functools import lru_cache
+from typing import Literal
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class Settings(BaseModel):
+    """Application settings, overridable through ``TODO_*`` environment variables"""
+
+    database_url: str = 'sqlite:///./sql_app.db'
+    async_database_url: str = 'sqlite+aiosqlite:///./sql_app.db'
+    use_async: bool = False
+    default_list_id: int = 1
+    user_header: Optional[str] = None
+    page_size: int = 50
+    stream_lists: bool = False
+    cache_ttl: float = 0
+    cache_max_entries: int = 1024
+    events_keepalive: float = 15
+    group_commit: bool = False
+    group_commit_max_latency: float = 0.002
+    group_commit_max_batch_size: int = 64
+    group_commit_timeout: float = 30
+    metrics: bool = False
+    query_count_header: bool = False
+    query_log: bool = False
+    pool_size: int = 5
+    pool_max_overflow: int = 10
+    pool_recycle: int = -1
+    pool_pre_ping: bool = False
+    sqlite_journal_mode: Literal['wal', 'delete', 'truncate', 'persist', 'memory', 'off'] = 'wal'
+    sqlite_synchronous: Literal['off', 'normal', 'full', 'extra'] = 'normal'
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    sqlite_cache_size: int = -64 * 1024
+    sqlite_busy_timeout: int = 5000
+
+    @classmethod
+    def from_env(cls, prefix: str = 'TODO_') -> 'Settings':
+        """Build the settings from the environment"""
+        values = {}
+        for name in cls.model_fields:
+            env_name = f'{prefix}{name.upper()}'
+            if env_name in os.environ:
+                values[name] = os.environ[env_name]
+        return cls(**values)
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Get the process-wide settings"""
+    return Settings.from_env()
@@ -0,0 +1,157 @@
+"""Group commit writer module"""
+import contextvars
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+
+_STOP = object()
+
+
+class GroupCommitWriter:
+    """Background thread committing the writes of concurrent requests in shared transactions
+
+    A write waits up to ``max_latency`` seconds for others to join its batch, which is
+    committed as soon as it holds ``max_batch_size`` writes, so a burst pays for one commit
+    instead of one per write. When a batch fails it is rolled back and its writes are retried
+    in a transaction each, so only the failing write raises to its caller.
+
+    Every write runs in the context of the request that submitted it, so that its queries
+    are counted in the query count and the metrics of that request.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        max_latency: float = 0.002,
+        max_batch_size: int = 64,
+        timeout: float = 30,
+    ) -> None:
+        self.session_factory = session_factory
+        self.max_latency = max_latency
+        self.max_batch_size = max_batch_size
+        self.timeout = timeout
+        self.batches = 0
+        self.writes = 0
+        self._queue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start the writer thread unless it is already running"""
+        with self._lock:
+            self._start()
+
+    def _start(self):
+        if self._stopped:
+            raise RuntimeError('The group commit writer is stopped')
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.run, name='group-commit-writer', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Commit the pending writes and stop the writer thread, rejecting the writes submitted afterwards"""
+        with self._lock:
+            self._stopped = True
+            thread, self._thread = self._thread, None
+            if thread is not None:
+                self._queue.put(_STOP)
+        if thread is not None:
+            thread.join()
+
+    def submit(self, write: Callable[[Session], Any]) -> Any:
+        """Run a write in the next batch and wait up to ``timeout`` seconds for its result once it is committed
+
+        A write timing out is cancelled unless its batch is already running, in which case it
+        may still be committed.
+        """
+        future = Future()
+        with self._lock:
+            self._start()
+            self._queue.put((contextvars.copy_context(), write, future))
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    def run(self):
+        """Collect and commit batches of writes until stopped, failing the writes left when it exits"""
+        batch = []
+        try:
+            stopping = False
+            while not stopping:
+                item = self._queue.get()
+                if item is _STOP:
+                    break
+                batch = [item]
+                deadline = time.monotonic() + self.max_latency
+                while len(batch) < self.max_batch_size:
+                    try:
+                        item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+                batch = [item for item in batch if item[2].set_running_or_notify_cancel()]
+                if batch and not self.commit_batch(batch):
+                    for write in batch:
+                        self.commit_batch([write])
+        finally:
+            with self._lock:
+                self._stopped = True
+                self._thread = None
+            self.fail_pending(batch)
+
+    def fail_pending(self, batch: list):
+        """Fail the unresolved writes of the current batch and of the queue"""
+        error = RuntimeError('The group commit writer stopped before committing the write')
+        pending = list(batch)
+        while True:
+            try:
+                pending.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        for item in pending:
+            if item is not _STOP and not item[2].done():
+                item[2].set_exception(error)
+
+    def commit_batch(self, batch: list) -> bool:
+        """Run a batch of writes in one transaction and resolve their futures once it is committed
+
+        A batch of a single write resolves its future with the error when it fails, a larger
+        one leaves its futures pending and returns ``False``.
+        """
+        session = self.session_factory()
+        try:
+            results = [context.run(write, session) for context, write, _ in batch]
+            session.commit()
+        except Exception as exc:
+            session.rollback()
+            if len(batch) > 1:
+                return False
+            batch[0][2].set_exception(exc)
+            return True
+        finally:
+            session.close()
+        with self._lock:
+            self.batches += 1
+            self.writes += len(batch)
+        for (_, _, future), result in zip(batch, results):
+            future.set_result(result)
+        return True
+
+    def stats(self) -> dict:
+        """Get the committed batch and write counters"""
+        with self._lock:
+            return {'batches': self.batches, 'writes': self.writes}
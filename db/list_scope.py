@@ -0,0 +1,93 @@
+"""Request-scoped task list module"""
+from contextvars import ContextVar
+from typing import Awaitable
+from typing import Callable
+from typing import Optional
+
+from starlette.requests import HTTPConnection
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+
+LIST_COOKIE = 'list_id'
+"""Cookie holding the id of the task list a client works on"""
+
+_list_id_ctx: ContextVar[int] = ContextVar('list_id')
+
+
+class ListAccessError(Exception):
+    """Error raised when a request may not work on any task list"""
+
+    def __init__(self, status_code: int, detail: str) -> None:
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def current_list_id() -> int:
+    """Get the id of the task list bound to the current request"""
+    try:
+        return _list_id_ctx.get()
+    except LookupError as exc:
+        raise RuntimeError('No task list bound. Make sure TaskListMiddleware has been added to the app.') from exc
+
+
+class TaskListMiddleware:
+    """Middleware binding every HTTP request to a task list of its caller, chosen by its ``list_id`` cookie
+
+    The caller is the user named by the ``user_header`` request header, which a trusted
+    authenticating proxy must set and strip from client requests, or the owner of the
+    default list when no header is configured. Requests without a valid cookie work on
+    the first list of their caller, and a cookie naming a list they do not own is rejected.
+    The lists are looked up by ``find_list``, which gets the list id, the user name and
+    the default list id, except for the default list itself when no header is configured.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        default_list_id: int,
+        find_list: Callable[[Optional[int], Optional[str], int], Awaitable[Optional[int]]],
+        user_header: Optional[str] = None,
+    ) -> None:
+        self.app = app
+        self.default_list_id = default_list_id
+        self.find_list = find_list
+        self.user_header = user_header
+
+    async def request_list_id(self, scope: Scope) -> int:
+        """Get the id of the task list a request works on"""
+        connection = HTTPConnection(scope)
+        cookie = connection.cookies.get(LIST_COOKIE, '')
+        list_id = int(cookie) if cookie.isdigit() else None
+        user_name = None
+        if self.user_header is not None:
+            user_name = connection.headers.get(self.user_header)
+            if not user_name:
+                raise ListAccessError(401, 'Not authenticated')
+        elif list_id is None or list_id == self.default_list_id:
+            return self.default_list_id
+
+        found_list_id = await self.find_list(list_id, user_name, self.default_list_id)
+        if found_list_id is None:
+            raise ListAccessError(404, 'Task list not found')
+        return found_list_id
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            list_id = await self.request_list_id(scope)
+        except ListAccessError as exc:
+            await PlainTextResponse(exc.detail, status_code=exc.status_code)(scope, receive, send)
+            return
+        token = _list_id_ctx.set(list_id)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _list_id_ctx.reset(token)
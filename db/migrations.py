@@ -0,0 +1,32 @@
+"""Database schema migrations module"""
+from pathlib import Path
+from typing import Optional
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import Connection
+
+
+ALEMBIC_INI_PATH = Path(__file__).parent.parent / 'alembic.ini'
+
+
+def alembic_config(connection: Optional[Connection] = None) -> Config:
+    """Build the Alembic configuration, running the migrations through a connection when one is given
+
+    Without a connection the migrations open their own on the configured database URL.
+    """
+    config = Config(str(ALEMBIC_INI_PATH))
+    if connection is not None:
+        config.attributes['connection'] = connection
+        config.attributes['configure_logger'] = False
+    return config
+
+
+def upgrade_database(revision: str = 'head', connection: Optional[Connection] = None):
+    """Migrate the database schema up to a revision"""
+    command.upgrade(alembic_config(connection), revision)
+
+
+def downgrade_database(revision: str, connection: Optional[Connection] = None):
+    """Migrate the database schema down to a revision"""
+    command.downgrade(alembic_config(connection), revision)
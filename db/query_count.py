@@ -0,0 +1,134 @@
+"""Query counting module"""
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable
+from typing import Iterator
+from typing import Optional
+
+from sqlalchemy import Engine
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+
+QUERY_COUNT_HEADER = 'Server-Timing'
+"""Response header exposing the queries of a request, shown by the network panel of the browsers"""
+
+MAX_RECORDED_STATEMENTS = 100
+"""Number of statements recorded per count, the queries beyond it being counted only"""
+
+logger = logging.getLogger(__name__)
+
+
+class QueryCount:
+    """Number and total duration in seconds of the queries run while counting, along with their statements"""
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.duration = 0.0
+        self.statements = []
+
+    def server_timing(self) -> str:
+        """Format the count as a ``Server-Timing`` header metric"""
+        noun = 'query' if self.queries == 1 else 'queries'
+        return f'db;desc="{self.queries} {noun}";dur={self.duration * 1000:.3f}'
+
+    def format_statements(self) -> str:
+        """Format the recorded statements one per line, noting those that were only counted"""
+        lines = [' '.join(statement.split()) for statement in self.statements]
+        if self.queries > len(self.statements):
+            lines.append(f'... {self.queries - len(self.statements)} more')
+        return '\n'.join(lines)
+
+
+_query_count_ctx: ContextVar[Optional[QueryCount]] = ContextVar('query_count', default=None)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCount]:
+    """Count the queries run within a block, those of the threads and greenlets it waits on included"""
+    query_count = QueryCount()
+    token = _query_count_ctx.set(query_count)
+    try:
+        yield query_count
+    finally:
+        _query_count_ctx.reset(token)
+
+
+def time_queries(engine: Engine, observe: Optional[Callable[[float], None]] = None):
+    """Time the queries of an engine, adding them to the current query count and reporting them to ``observe``"""
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def start_query_timer(connection, cursor, statement, parameters, context, executemany):
+        connection.info.setdefault('query_started', []).append(time.perf_counter())
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def stop_query_timer(connection, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - connection.info['query_started'].pop()
+        query_count = _query_count_ctx.get()
+        if query_count is not None:
+            query_count.queries += 1
+            query_count.duration += duration
+            if len(query_count.statements) < MAX_RECORDED_STATEMENTS:
+                query_count.statements.append(statement)
+        if observe is not None:
+            observe(duration)
+
+    @event.listens_for(engine, 'handle_error')
+    def drop_query_timer(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get('query_started'):
+            connection.info['query_started'].pop()
+
+
+def enable_statement_log():
+    """Log the statements of the requests, to standard error unless the logging is already configured"""
+    logger.setLevel(logging.INFO)
+    if not logger.hasHandlers():
+        logger.addHandler(logging.StreamHandler())
+
+
+class QueryCountMiddleware:
+    """Middleware counting the queries of every HTTP request in a ``Server-Timing`` response header
+
+    The header is sent before the body, so the queries of a streamed body are not part of it.
+    Meant for debugging, it lets anyone see how much work a route does. With ``log_statements``
+    the statements of every request, those of its body included, are logged once it ends.
+    """
+
+    def __init__(self, app: ASGIApp, header: bool = True, log_statements: bool = False) -> None:
+        self.app = app
+        self.header = header
+        self.log_statements = log_statements
+        if log_statements:
+            enable_statement_log()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        with count_queries() as query_count:
+
+            async def send_with_query_count(message: Message) -> None:
+                if self.header and message['type'] == 'http.response.start':
+                    MutableHeaders(scope=message).append(QUERY_COUNT_HEADER, query_count.server_timing())
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_query_count)
+            finally:
+                if self.log_statements:
+                    logger.info(
+                        '%s %s ran %d queries\n%s',
+                        scope['method'],
+                        scope['path'],
+                        query_count.queries,
+                        query_count.format_statements(),
+                    )
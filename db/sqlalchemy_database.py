@@ -1,12 +1,119 @@
 """SQLAlchemy database connection"""
+from config.settings import Settings
 from sqlalchemy import create_engine
+from sqlalchemy import Engine
+from sqlalchemy import event
+from sqlalchemy import make_url
+from sqlalchemy import URL
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import StaticPool
 
 
-SQLALCHEMY_DATABASE_URL = 'sqlite:///./sql_app.db'
+def is_sqlite_file_database(url: URL) -> bool:
+    """Check whether a database URL points to an SQLite file, as opposed to an in-memory database"""
+    return url.get_backend_name() == 'sqlite' and url.database not in (None, '', ':memory:')
+
+
+def sqlite_pragmas(settings: Settings, read_only: bool = False) -> list:
+    """Build the pragmas applied to every new SQLite connection"""
+    pragmas = [
+        f'PRAGMA busy_timeout = {settings.sqlite_busy_timeout}',
+        'PRAGMA foreign_keys = ON',
+        f'PRAGMA cache_size = {settings.sqlite_cache_size}',
+        f'PRAGMA mmap_size = {settings.sqlite_mmap_size}',
+        f'PRAGMA synchronous = {settings.sqlite_synchronous}',
+    ]
+    if read_only:
+        pragmas.append('PRAGMA query_only = ON')
+    else:
+        pragmas.insert(0, f'PRAGMA journal_mode = {settings.sqlite_journal_mode}')
+    return pragmas
+
+
+def apply_sqlite_pragmas(engine: Engine, pragmas: list):
+    """Run the pragmas on every connection the engine opens, before it is handed to the pool"""
+
+    @event.listens_for(engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def engine_options(url: URL, settings: Settings, is_async: bool) -> dict:
+    """Build the pool and driver options suited to a database URL"""
+    if url.get_backend_name() == 'sqlite' and not is_sqlite_file_database(url):
+        return {'poolclass': StaticPool, 'connect_args': {'check_same_thread': False}}
+
+    options = {
+        'poolclass': AsyncAdaptedQueuePool if is_async else QueuePool,
+        'pool_size': settings.pool_size,
+        'max_overflow': settings.pool_max_overflow,
+        'pool_recycle': settings.pool_recycle,
+        'pool_pre_ping': settings.pool_pre_ping,
+    }
+    if url.get_backend_name() == 'sqlite':
+        options['connect_args'] = {'check_same_thread': False}
+    return options
+
+
+def create_database_engine(database_url: str, settings: Settings, read_only: bool = False) -> Engine:
+    """Create a database engine, tuned with connection pragmas when it is SQLite"""
+    url = make_url(database_url)
+    database_engine = create_engine(url, **engine_options(url, settings, is_async=False))
+    if url.get_backend_name() == 'sqlite':
+        apply_sqlite_pragmas(database_engine, sqlite_pragmas(settings, read_only=read_only))
+    return database_engine
+
+
+def create_async_database_engine(database_url: str, settings: Settings, read_only: bool = False) -> AsyncEngine:
+    """Create an asyncio database engine, tuned with connection pragmas when it is SQLite"""
+    url = make_url(database_url)
+    database_engine = create_async_engine(url, **engine_options(url, settings, is_async=True))
+    if url.get_backend_name() == 'sqlite':
+        apply_sqlite_pragmas(database_engine.sync_engine, sqlite_pragmas(settings, read_only=read_only))
+    return database_engine
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={'check_same_thread': False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
+
+
+def create_session_factories(settings: Settings) -> tuple:
+    """Create the read-write session factory and the one serving reads
+
+    An SQLite file in WAL mode lets readers run alongside the writer, so reads get their own
+    pool of query-only connections. Any other database shares the read-write pool.
+    """
+    engine = create_database_engine(settings.database_url, settings)
+    read_engine = (
+        create_database_engine(settings.database_url, settings, read_only=True)
+        if is_sqlite_file_database(make_url(settings.database_url))
+        else engine
+    )
+    return (
+        sessionmaker(autocommit=False, autoflush=False, bind=engine),
+        sessionmaker(autocommit=False, autoflush=False, bind=read_engine),
+    )
+
+
+def create_async_session_factories(settings: Settings) -> tuple:
+    """Create the asyncio read-write session factory and the one serving reads"""
+    engine = create_async_database_engine(settings.async_database_url, settings)
+    read_engine = (
+        create_async_database_engine(settings.async_database_url, settings, read_only=True)
+        if is_sqlite_file_database(make_url(settings.async_database_url))
+        else engine
+    )
+    return (
+        async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False),
+        async_sessionmaker(bind=read_engine, autoflush=False, expire_on_commit=False),
+    )
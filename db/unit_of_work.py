@@ -0,0 +1,159 @@
+"""Request-scoped unit of work module"""
+from contextvars import ContextVar
+from typing import Callable
+from typing import Optional
+from typing import Type
+from typing import Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+
+SAFE_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+"""HTTP methods served from the read-only session factory"""
+
+_unit_of_work_ctx: ContextVar[Union['UnitOfWork', 'AsyncUnitOfWork']] = ContextVar('unit_of_work')
+
+
+class UnitOfWork:
+    """Database session lifecycle of a single request
+
+    The session is created lazily on first use, so requests that never touch the
+    database never check out a pooled connection.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session]) -> None:
+        self.session_factory = session_factory
+        self._session: Optional[Session] = None
+
+    @property
+    def session(self) -> Session:
+        """Get the request session, creating it on first access"""
+        if self._session is None:
+            self._session = self.session_factory()
+        return self._session
+
+    def complete(self, commit: bool):
+        """Commit or roll back the pending work and return the connection to the pool"""
+        if self._session is None:
+            return
+        try:
+            if commit:
+                self._session.commit()
+            else:
+                self._session.rollback()
+        finally:
+            self._session.close()
+            self._session = None
+
+    async def commit(self):
+        """Commit the pending work without blocking the event loop, keeping the session open"""
+        if self._session is not None:
+            await run_in_threadpool(self._session.commit)
+
+    async def finish(self, commit: bool):
+        """Complete the unit of work without blocking the event loop"""
+        if self._session is not None:
+            await run_in_threadpool(self.complete, commit)
+
+
+class AsyncUnitOfWork:
+    """Asyncio database session lifecycle of a single request"""
+
+    def __init__(self, session_factory: Callable[[], AsyncSession]) -> None:
+        self.session_factory = session_factory
+        self._session: Optional[AsyncSession] = None
+
+    @property
+    def session(self) -> AsyncSession:
+        """Get the request session, creating it on first access"""
+        if self._session is None:
+            self._session = self.session_factory()
+        return self._session
+
+    async def commit(self):
+        """Commit the pending work, keeping the session open"""
+        if self._session is not None:
+            await self._session.commit()
+
+    async def finish(self, commit: bool):
+        """Commit or roll back the pending work and return the connection to the pool"""
+        if self._session is None:
+            return
+        try:
+            if commit:
+                await self._session.commit()
+            else:
+                await self._session.rollback()
+        finally:
+            await self._session.close()
+            self._session = None
+
+
+def current_unit_of_work() -> Union[UnitOfWork, AsyncUnitOfWork]:
+    """Get the unit of work bound to the current request"""
+    try:
+        return _unit_of_work_ctx.get()
+    except LookupError as exc:
+        raise RuntimeError('No unit of work bound. Make sure UnitOfWorkMiddleware has been added to the app.') from exc
+
+
+def current_session() -> Union[Session, AsyncSession]:
+    """Get the database session bound to the current request"""
+    return current_unit_of_work().session
+
+
+class UnitOfWorkMiddleware:
+    """Middleware binding a fresh unit of work to every HTTP request
+
+    Requests with a safe method get their session from ``read_session_factory`` when
+    one is given, so reads never wait on a connection held by a writer. The work of the
+    other requests is committed before their response starts, so a failed commit raises
+    instead of answering with a state that was never stored. Safe requests may stream
+    their body from an open cursor, so they are only completed once it is sent.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        session_factory: Callable[[], Union[Session, AsyncSession]],
+        unit_of_work_class: Type[Union[UnitOfWork, AsyncUnitOfWork]] = UnitOfWork,
+        read_session_factory: Optional[Callable[[], Union[Session, AsyncSession]]] = None,
+    ) -> None:
+        self.app = app
+        self.session_factory = session_factory
+        self.unit_of_work_class = unit_of_work_class
+        self.read_session_factory = read_session_factory or session_factory
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        if scope['method'] in SAFE_METHODS:
+            unit_of_work = self.unit_of_work_class(self.read_session_factory)
+            send_committed = send
+        else:
+            unit_of_work = self.unit_of_work_class(self.session_factory)
+
+            async def send_committed(message: Message) -> None:
+                if message['type'] == 'http.response.start':
+                    await unit_of_work.commit()
+                await send(message)
+
+        token = _unit_of_work_ctx.set(unit_of_work)
+        try:
+            await self.app(scope, receive, send_committed)
+        except BaseException:
+            await unit_of_work.finish(commit=False)
+            raise
+        else:
+            await unit_of_work.finish(commit=True)
+        finally:
+            _unit_of_work_ctx.reset(token)
@@ -0,0 +1,119 @@
+"""Event brokers module"""
+import asyncio
+import threading
+from abc import ABC
+from abc import abstractmethod
+from collections import defaultdict
+from typing import Hashable
+from typing import Optional
+
+from models.task_event_mdl import TaskEvent
+
+
+class Subscription(ABC):
+    """Events of a channel received by a single subscriber"""
+
+    @abstractmethod
+    async def get(self) -> TaskEvent:
+        """Wait for the next event"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def close(self):
+        """Stop receiving events"""
+        raise NotImplementedError()
+
+
+class EventBroker(ABC):
+    """Publish-subscribe channels of task events"""
+
+    @abstractmethod
+    def publish(self, channel: Hashable, event: TaskEvent, origin: Optional[str] = None):
+        """Send an event to the current subscribers of a channel but its ``origin`` one, from any thread"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def subscribe(self, channel: Hashable, subscriber: Optional[str] = None) -> Subscription:
+        """Start receiving the events of a channel, but those ``subscriber`` published, from within the event loop"""
+        raise NotImplementedError()
+
+
+class InProcessSubscription(Subscription):
+    """Queue of the events of a channel, dropping those already pending
+
+    Clients refresh what an event names, so a pending duplicate would only repeat that
+    refresh. A queue falling ``max_pending`` events behind is replaced by a single event of
+    the whole list changing.
+    """
+
+    def __init__(
+        self, broker: 'InProcessEventBroker', channel: Hashable, max_pending: int, subscriber: Optional[str] = None
+    ) -> None:
+        self.broker = broker
+        self.channel = channel
+        self.subscriber = subscriber
+        self.max_pending = max_pending
+        self.loop = asyncio.get_running_loop()
+        self._pending: dict = {}
+        self._ready = asyncio.Event()
+
+    def put(self, event: TaskEvent):
+        """Queue an event, from within the event loop of the subscriber"""
+        if len(self._pending) >= self.max_pending:
+            self._pending.clear()
+            event = TaskEvent()
+        self._pending[event] = None
+        self._ready.set()
+
+    async def get(self) -> TaskEvent:
+        """Wait for the next event"""
+        while not self._pending:
+            self._ready.clear()
+            await self._ready.wait()
+        event = next(iter(self._pending))
+        del self._pending[event]
+        return event
+
+    def close(self):
+        """Stop receiving events"""
+        self.broker.unsubscribe(self)
+
+
+class InProcessEventBroker(EventBroker):
+    """Broker delivering events to the subscribers of the current process only"""
+
+    def __init__(self, max_pending: int = 100) -> None:
+        self.max_pending = max_pending
+        self._subscriptions = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def publish(self, channel: Hashable, event: TaskEvent, origin: Optional[str] = None):
+        """Send an event to the current subscribers of a channel but its ``origin`` one, from any thread"""
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(channel, ()))
+        for subscription in subscriptions:
+            if origin is not None and subscription.subscriber == origin:
+                continue
+            if not subscription.loop.is_closed():
+                subscription.loop.call_soon_threadsafe(subscription.put, event)
+
+    def subscribe(self, channel: Hashable, subscriber: Optional[str] = None) -> InProcessSubscription:
+        """Start receiving the events of a channel, but those ``subscriber`` published, from within the event loop"""
+        subscription = InProcessSubscription(self, channel, self.max_pending, subscriber=subscriber)
+        with self._lock:
+            self._subscriptions[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: InProcessSubscription):
+        """Stop delivering events to a subscription"""
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.channel)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.channel]
+
+    def subscriber_count(self, channel: Hashable) -> int:
+        """Get the number of current subscribers of a channel"""
+        with self._lock:
+            return len(self._subscriptions.get(channel, ()))
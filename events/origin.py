@@ -0,0 +1,84 @@
+"""Event origin module, telling the clients apart so that they are not notified of their own writes"""
+import re
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Hashable
+from typing import Iterator
+from typing import Optional
+
+from events.brokers import EventBroker
+from models.task_event_mdl import TaskEvent
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+
+CLIENT_HEADER = 'X-Client-Id'
+"""Request header holding the id of the page sending the request"""
+
+CLIENT_ID_PATTERN = re.compile(r'[0-9a-f]{32}')
+"""Client ids, anything else being ignored"""
+
+_client_id_ctx: ContextVar[Optional[str]] = ContextVar('client_id', default=None)
+
+_deferred_events_ctx: ContextVar[Optional[dict]] = ContextVar('deferred_events', default=None)
+
+
+def new_client_id() -> str:
+    """Generate the id of a page, sent with its requests and its event stream"""
+    return uuid.uuid4().hex
+
+
+def valid_client_id(client_id: Optional[str]) -> Optional[str]:
+    """Get a client id if it is well formed, ``None`` otherwise"""
+    if client_id is not None and CLIENT_ID_PATTERN.fullmatch(client_id):
+        return client_id
+    return None
+
+
+def current_client_id() -> Optional[str]:
+    """Get the id of the client that sent the current request, if it sent one"""
+    return _client_id_ctx.get()
+
+
+def publish_event(broker: EventBroker, channel: Hashable, event: TaskEvent):
+    """Publish an event on behalf of the client of the current request, or defer it until the events are flushed"""
+    deferred_events = _deferred_events_ctx.get()
+    if deferred_events is not None:
+        deferred_events.setdefault((broker, channel, event), current_client_id())
+        return
+    broker.publish(channel, event, origin=current_client_id())
+
+
+@contextmanager
+def deferred_events() -> Iterator[None]:
+    """Publish each distinct event of a block once, when it ends, instead of every time it happens"""
+    events = {}
+    token = _deferred_events_ctx.set(events)
+    try:
+        yield
+    finally:
+        _deferred_events_ctx.reset(token)
+        for (broker, channel, event), origin in events.items():
+            broker.publish(channel, event, origin=origin)
+
+
+class ClientIdMiddleware:
+    """Middleware binding every HTTP request to the client id of its header"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        token = _client_id_ctx.set(valid_client_id(Headers(scope=scope).get(CLIENT_HEADER)))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _client_id_ctx.reset(token)
@@ -1,305 +1,619 @@
+import asyncio
+import codecs
+import csv
+import io
+import itertools
 import json
+from datetime import timezone
+from email.utils import format_datetime
+from email.utils import parsedate_to_datetime
 from typing import Annotated
 from typing import Any
-
-import sqlalchemy
-import uvicorn
-from db.sqlalchemy_database import Base
-from db.sqlalchemy_database import engine
-from db.sqlalchemy_database import SessionLocal
-from fastapi import Depends
+from typing import AsyncIterator
+from typing import Iterable
+from typing import Literal
+from typing import Optional
+
+from cache.backends import LRUCacheBackend
+from cache.read_through import ReadThroughCache
+from config.settings import get_settings
+from config.settings import Settings
+from db.list_scope import current_list_id
+from events.brokers import EventBroker
+from events.brokers import InProcessEventBroker
+from events.origin import CLIENT_HEADER
+from events.origin import ClientIdMiddleware
+from events.origin import deferred_events
+from events.origin import new_client_id
+from events.origin import valid_client_id
+from fastapi import APIRouter
 from fastapi import FastAPI
 from fastapi import Form
+from fastapi import Query
 from fastapi import Request
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from fastapi.responses import StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi_injector import attach_injector
+from fastapi_injector import Injected
+from fastapi_injector import InjectorMiddleware
+from fastapi_injector import request_scope
 from injector import Injector
 from injector import singleton
+from metrics.timing import MetricsMiddleware
+from metrics.timing import TimedTemplate
+from models.data_version_mdl import DataVersion
+from models.task_event_mdl import TaskEvent
+from models.task_list_mdl import TaskCounts
 from models.task_mdl import Task
-from orm import mappings
-from repositories import tasks_repo
-from schema.task_sch import SQLAlchemyTask
-from services.tasks.add_task_srv import AddTaskService
-from services.tasks.delete_completed_tasks_srv import DeleteCompletedTasksService
-from services.tasks.delete_task_srv import DeleteTaskService
-from services.tasks.get_completed_tasks_srv import GetCompletedTasksService
-from services.tasks.get_not_completed_tasks_srv import GetNotCompletedTasksService
-from services.tasks.get_task_srv import GetTaskService
-from services.tasks.get_tasks_srv import GetTasksService
-from services.tasks.mark_task_as_completed_srv import MarkTaskAsCompletedService
-from services.tasks.mark_task_as_not_completed_srv import MarkTaskAsNotCompletedService
-from services.tasks.mark_tasks_as_completed_srv import MarkTasksAsCompletedService
-from services.tasks.mark_tasks_as_not_completed_srv import MarkTasksAsNotCompletedService
-from services.tasks.update_task_description_srv import UpdateTaskDescriptionService
+from models.task_mdl import TaskRecord
+from repositories import AsyncBaseTasksRepository
+from repositories import BaseTasksRepository
+from repositories import BULK_CHUNK_SIZE
+from repositories import iter_chunks
+from services.dependencies import AwaitableService
+from services.dependencies import use_service
 
 
 templates = Jinja2Templates(directory='templates')
-app = FastAPI()
-app.mount('/static', StaticFiles(directory='static'), name='static')
+async_templates = Jinja2Templates(directory='templates', enable_async=True)
+templates.env.template_class = TimedTemplate
+async_templates.env.template_class = TimedTemplate
+router = APIRouter()
+
+
+STREAM_BUFFER_SIZE = 64
+"""Number of rendered template chunks sent together in a streamed response body message"""
+
+
+async def buffer_chunks(chunks: AsyncIterator[str], size: int = STREAM_BUFFER_SIZE) -> AsyncIterator[str]:
+    """Group rendered template chunks to avoid sending one body message per template node"""
+    buffer = []
+    async for chunk in chunks:
+        buffer.append(chunk)
+        if len(buffer) >= size:
+            yield ''.join(buffer)
+            buffer.clear()
+    if buffer:
+        yield ''.join(buffer)
+
+
+def format_server_sent_event(event: TaskEvent) -> str:
+    """Format a task event as a server-sent event message"""
+    return f'event: {event.name}\ndata: {event.model_dump_json()}\n\n'
+
+
+async def iter_server_sent_events(
+    broker: EventBroker, channel: Any, keepalive: float, subscriber: Optional[str] = None
+) -> AsyncIterator[str]:
+    """Stream the events of a channel as server-sent events, with a comment sent whenever it stays idle
+
+    The comments let proxies keep the connection open and reveal disconnected clients, whose
+    subscription is closed when the response is cancelled. The events published by
+    ``subscriber`` are not streamed back to it.
+    """
+    subscription = broker.subscribe(channel, subscriber=subscriber)
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), keepalive)
+            except asyncio.TimeoutError:
+                yield ': keepalive\n\n'
+            else:
+                yield format_server_sent_event(event)
+    finally:
+        subscription.close()
+
+
+def app_settings(request: Request) -> Settings:
+    """Get the settings of the app serving a request"""
+    return request.app.state.settings
+
+
+def stream_template(name: str, context: dict) -> StreamingResponse:
+    """Render a template incrementally, fetching its lazy task iterables while the response is sent"""
+    if app_settings(context['request']).use_async:
+        chunks = async_templates.get_template(name).generate_async(context)
+        return StreamingResponse(buffer_chunks(chunks), media_type='text/html')
+
+    template_stream = templates.get_template(name).stream(context)
+    template_stream.enable_buffering(STREAM_BUFFER_SIZE)
+    return StreamingResponse(template_stream, media_type='text/html')
+
+
+TaskDataFormat = Literal['jsonl', 'csv']
+"""Formats of the task import and export bodies"""
+
+TASK_EXPORT_MEDIA_TYPES = {'jsonl': 'application/x-ndjson', 'csv': 'text/csv'}
+"""Media type of each task export format"""
+
+TASK_CSV_FIELDS = ('id', 'description', 'completed')
+"""Columns of the task CSV import and export files"""
+
+
+async def iter_body_lines(request: Request) -> AsyncIterator[str]:
+    """Decode a request body into lines as it is received, without reading it whole"""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    pending = ''
+    async for chunk in request.stream():
+        *lines, pending = (pending + decoder.decode(chunk)).split('\n')
+        for line in lines:
+            yield line.removesuffix('\r')
+    pending += decoder.decode(b'', final=True)
+    if pending:
+        yield pending.removesuffix('\r')
+
+
+async def iter_csv_records(lines: AsyncIterator[str]) -> AsyncIterator[dict]:
+    """Parse CSV lines with a header row into records, joining the lines of multi-line quoted fields"""
+    fields = None
+    record = None
+    async for line in lines:
+        record = line if record is None else f'{record}\n{line}'
+        if record.count('"') % 2:
+            continue
+        values = next(csv.reader([record]), [])
+        record = None
+        if fields is None:
+            fields = values
+        elif values:
+            yield dict(zip(fields, values))
+
+
+async def iter_imported_tasks(request: Request, data_format: TaskDataFormat) -> AsyncIterator[Task]:
+    """Parse the tasks of an import request body while it is being received"""
+    lines = iter_body_lines(request)
+    if data_format == 'csv':
+        async for record in iter_csv_records(lines):
+            yield Task.model_validate({field: value for field, value in record.items() if value != ''})
+    else:
+        async for line in lines:
+            if line.strip():
+                yield Task.model_validate_json(line)
 
 
-def load_initial_data():
-    """Load sample data"""
-    session = SessionLocal()
-    with open('data/tasks.json', encoding='utf8') as f:
-        json_data = json.load(f)
-        try:
-            for data in json_data:
-                session.add(SQLAlchemyTask(**data))
-            session.commit()
-        except sqlalchemy.exc.IntegrityError:
-            pass
+def format_exported_task(task: TaskRecord, data_format: TaskDataFormat) -> str:
+    """Format a task as a line of an export file"""
+    if data_format == 'csv':
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow((task.id, task.description, 'true' if task.completed else 'false'))
+        return buffer.getvalue()
+    return json.dumps(task._asdict(), ensure_ascii=False, separators=(',', ':')) + '\n'
 
 
-def setup_app():
-    """Set initial settings for running the app"""
-    Base.metadata.create_all(bind=engine)
-    injector = Injector()
-    injector.binder.bind(
-        tasks_repo.BaseTasksRepository, tasks_repo.SQLAlchemyTaskRepository(session=SessionLocal()), scope=singleton
+def footer_context(completed: Optional[bool], task_counts: TaskCounts) -> dict:
+    """Build the template context of the footer counters and filters"""
+    all_selected = False
+    active_selected = False
+    completed_selected = False
+    match completed:
+        case True:
+            completed_selected = True
+        case False:
+            active_selected = True
+        case _:
+            all_selected = True
+
+    return {
+        'all_selected': all_selected,
+        'active_selected': active_selected,
+        'completed_selected': completed_selected,
+        'items_left': task_counts.active,
+        'completed_tasks': task_counts.completed > 0,
+        'total': task_counts.total,
+    }
+
+
+def task_list_context(
+    completed: Optional[bool], task_counts: TaskCounts, tasks: Iterable, next_cursor: Optional[int] = None
+) -> dict:
+    """Build the template context shared by the task list views, footer and header included"""
+    return {
+        'completed': completed,
+        'tasks': tasks,
+        'next_cursor': next_cursor,
+        **footer_context(completed, task_counts),
+    }
+
+
+def cache_validators(list_id: int, data_version: DataVersion, user_header: Optional[str] = None) -> dict:
+    """Build the conditional request headers of a response rendered from the tasks data of a list
+
+    Data versions are counted per list, so the ETag names the list and the response varies
+    with the cookie choosing it, and with the ``user_header`` naming the user when there is
+    one, which keeps the copy of one list from validating another. The lists belong to
+    their user, so shared caches must not store them.
+    """
+    vary = 'Cookie' if user_header is None else f'Cookie, {user_header}'
+    headers = {'ETag': f'W/"{list_id}-{data_version.version}"', 'Cache-Control': 'private, no-cache', 'Vary': vary}
+    if data_version.updated_at is not None:
+        updated_at = data_version.updated_at
+        if updated_at.tzinfo is None:
+            updated_at = updated_at.replace(tzinfo=timezone.utc)
+        headers['Last-Modified'] = format_datetime(updated_at.astimezone(timezone.utc), usegmt=True)
+    return headers
+
+
+def is_not_modified(request: Request, validators: dict) -> bool:
+    """Check whether the client copy of a response is still current, following RFC 9110 precedence"""
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match is not None:
+        etags = {etag.strip().removeprefix('W/') for etag in if_none_match.split(',')}
+        return '*' in etags or validators['ETag'].removeprefix('W/') in etags
+
+    if_modified_since = request.headers.get('if-modified-since')
+    if if_modified_since is None or 'Last-Modified' not in validators:
+        return False
+    try:
+        return parsedate_to_datetime(if_modified_since) >= parsedate_to_datetime(validators['Last-Modified'])
+    except (TypeError, ValueError):
+        return False
+
+
+@router.get('/')
+async def home_page(
+    request: Request,
+    get_task_list_service: AwaitableService = use_service('services.tasks.get_task_list_srv.GetTaskListService'),
+    get_task_counts_service: AwaitableService = use_service('services.tasks.get_task_counts_srv.GetTaskCountsService'),
+    stream_tasks_service: AwaitableService = use_service('services.tasks.stream_tasks_srv.StreamTasksService'),
+):
+    """Home page route"""
+    context = {'request': request, 'start': True, 'client_header': CLIENT_HEADER, 'client_id': new_client_id()}
+    if app_settings(request).stream_lists:
+        task_counts = await get_task_counts_service.execute()
+        tasks = await stream_tasks_service.execute()
+        return stream_template('index.html', {**context, **task_list_context(None, task_counts, tasks)})
+
+    task_list = await get_task_list_service.execute(limit=app_settings(request).page_size)
+    return templates.TemplateResponse(
+        'index.html', {**context, **task_list_context(None, task_list, task_list.tasks, task_list.next_cursor)}
     )
-    injector.binder.bind(mappings.ORMBase, mappings.SQLAlchemyORM, scope=singleton)
-    attach_injector(app, injector)
 
 
-setup_app()
-load_initial_data()
+async def render_task_list(request: Request, completed: Optional[bool], get_task_list_service: Any):
+    """Render the first page of the tasks matching a completion filter along with out-of-band header and footer"""
+    task_list = await get_task_list_service.execute(completed=completed, limit=app_settings(request).page_size)
+    return templates.TemplateResponse(
+        '/tasks.html',
+        {'request': request, **task_list_context(completed, task_list, task_list.tasks, task_list.next_cursor)},
+    )
 
 
-@app.get('/')
-def home_page(request: Request, get_tasks_service: GetTasksService = Depends()):
-    """Home page route"""
-    tasks = get_tasks_service.execute()
-    items_left = len([task for task in tasks if task.completed is not True])
-    completed_tasks = [task for task in tasks if task.completed is True]
-    data = get_tasks_service.execute() or None
+async def render_task_row(
+    request: Request, completed: Optional[bool], task: Optional[Task], get_task_counts_service: Any
+):
+    """Render a single task row, or nothing once it no longer matches the filter, along with the out-of-band footer"""
+    if task is not None and completed is not None and task.completed != completed:
+        task = None
+    task_counts = await get_task_counts_service.execute()
+    return templates.TemplateResponse(
+        '/task_row.html', {'request': request, 'task': task, **task_list_context(completed, task_counts, [])}
+    )
+
+
+@router.get('/tasks')
+async def get_tasks(
+    request: Request,
+    completed: bool = None,
+    get_task_list_service: AwaitableService = use_service('services.tasks.get_task_list_srv.GetTaskListService'),
+    get_task_counts_service: AwaitableService = use_service('services.tasks.get_task_counts_srv.GetTaskCountsService'),
+    stream_tasks_service: AwaitableService = use_service('services.tasks.stream_tasks_srv.StreamTasksService'),
+    get_data_version_service: AwaitableService = use_service(
+        'services.tasks.get_data_version_srv.GetDataVersionService'
+    ),
+):
+    """Get all tasks"""
+    validators = cache_validators(
+        current_list_id(), await get_data_version_service.execute(), app_settings(request).user_header
+    )
+    if is_not_modified(request, validators):
+        return Response(status_code=304, headers=validators)
+
+    if app_settings(request).stream_lists:
+        task_counts = await get_task_counts_service.execute()
+        tasks = await stream_tasks_service.execute(completed=completed)
+        response = stream_template(
+            '/tasks.html', {'request': request, **task_list_context(completed, task_counts, tasks)}
+        )
+    else:
+        response = await render_task_list(request, completed, get_task_list_service)
+    response.headers.update(validators)
+    return response
+
+
+@router.get('/tasks/page')
+async def get_tasks_page(
+    request: Request,
+    after: int,
+    completed: bool = None,
+    get_tasks_page_service: AwaitableService = use_service('services.tasks.get_tasks_page_srv.GetTasksPageService'),
+):
+    """Get the page of tasks following a cursor"""
+    task_page = await get_tasks_page_service.execute(
+        limit=app_settings(request).page_size, completed=completed, after_id=after
+    )
 
     return templates.TemplateResponse(
-        'index.html',
+        '/task_page.html',
         {
             'request': request,
-            'tasks': tasks,
-            'items_left': items_left,
-            'start': True,
-            'completed': None,
-            'completed_tasks': True if completed_tasks else False,
-            'data': data,
+            'tasks': task_page.tasks,
+            'next_cursor': task_page.next_cursor,
+            'completed': completed,
         },
     )
 
 
-@app.get('/tasks')
-def get_tasks(
+@router.get('/tasks/search')
+async def search_tasks(
     request: Request,
+    q: str = '',
     completed: bool = None,
-    get_completed_tasks_service: GetCompletedTasksService = Depends(),
-    get_not_completed_tasks_service: GetNotCompletedTasksService = Depends(),
-    get_tasks_service: GetTasksService = Depends(),
+    offset: Annotated[int, Query(ge=0)] = 0,
+    search_tasks_service: AwaitableService = use_service('services.tasks.search_tasks_srv.SearchTasksService'),
+    get_tasks_page_service: AwaitableService = use_service('services.tasks.get_tasks_page_srv.GetTasksPageService'),
 ):
-    """Get all tasks"""
-    data = get_tasks_service.execute() or None
-    if completed:
-        tasks = get_completed_tasks_service.execute()
-    elif completed is False:
-        tasks = get_not_completed_tasks_service.execute()
+    """Search tasks by description, best matches first, or list them all when the query is blank"""
+    page_size = app_settings(request).page_size
+    if not q.strip():
+        task_page = await get_tasks_page_service.execute(limit=page_size, completed=completed)
+        template = '/task_page.html'
     else:
-        tasks = get_tasks_service.execute()
-
-    items_left = len([task for task in tasks if task.completed is not True])
+        task_page = await search_tasks_service.execute(query=q, limit=page_size, completed=completed, offset=offset)
+        template = '/search_page.html'
 
     return templates.TemplateResponse(
-        '/tasks.html',
+        template,
         {
             'request': request,
-            'tasks': tasks,
-            'items_left': items_left,
+            'tasks': task_page.tasks,
+            'next_cursor': task_page.next_cursor,
             'completed': completed,
-            'data': data,
+            'query': q,
+            'refresh_events': offset == 0,
         },
     )
 
 
-@app.post('/tasks')
-def add_task(
+@router.post('/tasks/import')
+async def import_tasks(
+    request: Request,
+    data_format: Annotated[TaskDataFormat, Query(alias='format')] = 'jsonl',
+    bulk_add_tasks_service: AwaitableService = use_service('services.tasks.bulk_add_tasks_srv.BulkAddTasksService'),
+):
+    """Import tasks from a JSON Lines or CSV body, inserting them in chunks while the body is received"""
+    imported = 0
+    chunk = []
+    # Clients are notified once the import ends rather than refreshing their list after every chunk
+    with deferred_events():
+        try:
+            async for task in iter_imported_tasks(request, data_format):
+                chunk.append(task)
+                if len(chunk) >= BULK_CHUNK_SIZE:
+                    imported += await bulk_add_tasks_service.execute(tasks=chunk)
+                    chunk = []
+        except (ValueError, csv.Error) as exc:
+            return JSONResponse(
+                {'detail': f'Invalid task after {imported + len(chunk)} tasks: {exc}', 'imported': imported},
+                status_code=422,
+            )
+        if chunk:
+            imported += await bulk_add_tasks_service.execute(tasks=chunk)
+    return {'imported': imported}
+
+
+@router.get('/tasks/export')
+async def export_tasks(
+    request: Request,
+    data_format: Annotated[TaskDataFormat, Query(alias='format')] = 'jsonl',
+    completed: bool = None,
+    stream_tasks_service: AwaitableService = use_service('services.tasks.stream_tasks_srv.StreamTasksService'),
+):
+    """Export tasks as a JSON Lines or CSV file streamed as they are read"""
+    header = [','.join(TASK_CSV_FIELDS) + '\r\n'] if data_format == 'csv' else []
+    tasks = await stream_tasks_service.execute(completed=completed)
+    if app_settings(request).use_async:
+
+        async def lines():
+            for line in header:
+                yield line
+            async for task in tasks:
+                yield format_exported_task(task, data_format)
+
+        content = buffer_chunks(lines())
+    else:
+        lines = itertools.chain(header, (format_exported_task(task, data_format) for task in tasks))
+        content = (''.join(chunk) for chunk in iter_chunks(lines, STREAM_BUFFER_SIZE))
+
+    return StreamingResponse(
+        content,
+        media_type=TASK_EXPORT_MEDIA_TYPES[data_format],
+        headers={'Content-Disposition': f'attachment; filename="tasks.{data_format}"'},
+    )
+
+
+@router.post('/tasks')
+async def add_task(
     request: Request,
     description: Annotated[str, Form()],
     completed: bool = None,
-    get_tasks_service: GetTasksService = Depends(),
-    get_completed_tasks_service: GetCompletedTasksService = Depends(),
-    get_not_completed_tasks_service: GetNotCompletedTasksService = Depends(),
-    add_task_service: AddTaskService = Depends(),
+    get_task_list_service: AwaitableService = use_service('services.tasks.get_task_list_srv.GetTaskListService'),
+    add_task_service: AwaitableService = use_service('services.tasks.add_task_srv.AddTaskService'),
 ):
     """Add a task"""
     task = Task(description=description)
-    add_task_service.execute(task=task)
-    return get_tasks(
-        request=request,
-        completed=completed,
-        get_tasks_service=get_tasks_service,
-        get_completed_tasks_service=get_completed_tasks_service,
-        get_not_completed_tasks_service=get_not_completed_tasks_service,
-    )
+    await add_task_service.execute(task=task)
+    return await render_task_list(request, completed, get_task_list_service)
 
 
-@app.delete('/task/{task_id}')
-def delete_task(
+@router.delete('/task/{task_id}')
+async def delete_task(
     request: Request,
-    task_id: Any,
+    task_id: int,
     completed: bool = None,
-    get_tasks_service: GetTasksService = Depends(),
-    get_completed_tasks_service: GetCompletedTasksService = Depends(),
-    get_not_completed_tasks_service: GetNotCompletedTasksService = Depends(),
-    delete_task_service: DeleteTaskService = Depends(),
+    get_task_counts_service: AwaitableService = use_service('services.tasks.get_task_counts_srv.GetTaskCountsService'),
+    delete_task_service: AwaitableService = use_service('services.tasks.delete_task_srv.DeleteTaskService'),
 ):
     """Delete a task"""
-    delete_task_service.execute(task_id=task_id)
-    return get_tasks(
-        request=request,
-        completed=completed,
-        get_tasks_service=get_tasks_service,
-        get_completed_tasks_service=get_completed_tasks_service,
-        get_not_completed_tasks_service=get_not_completed_tasks_service,
-    )
+    await delete_task_service.execute(task_id=task_id)
+    return await render_task_row(request, completed, None, get_task_counts_service)
 
 
-@app.post('/tasks/clear')
-def clear_completed(
+@router.post('/tasks/clear')
+async def clear_completed(
     request: Request,
     completed: bool = None,
-    get_tasks_service: GetTasksService = Depends(),
-    get_completed_tasks_service: GetCompletedTasksService = Depends(),
-    get_not_completed_tasks_service: GetNotCompletedTasksService = Depends(),
-    delete_completed_tasks_service: DeleteCompletedTasksService = Depends(),
+    get_task_list_service: AwaitableService = use_service('services.tasks.get_task_list_srv.GetTaskListService'),
+    delete_completed_tasks_service: AwaitableService = use_service(
+        'services.tasks.delete_completed_tasks_srv.DeleteCompletedTasksService'
+    ),
 ):
     """Delete completed tasks"""
-    delete_completed_tasks_service.execute()
-    return get_tasks(
-        request=request,
-        completed=completed,
-        get_tasks_service=get_tasks_service,
-        get_completed_tasks_service=get_completed_tasks_service,
-        get_not_completed_tasks_service=get_not_completed_tasks_service,
-    )
+    await delete_completed_tasks_service.execute()
+    return await render_task_list(request, completed, get_task_list_service)
 
 
-@app.put('/tasks/{task_id}/complete')
-def mark_task_as_completed(
+@router.put('/tasks/{task_id}/complete')
+async def mark_task_as_completed(
     request: Request,
-    task_id: Any,
+    task_id: int,
     completed: bool = None,
-    get_tasks_service: GetTasksService = Depends(),
-    get_completed_tasks_service: GetCompletedTasksService = Depends(),
-    get_not_completed_tasks_service: GetNotCompletedTasksService = Depends(),
-    mark_task_as_completed_service: MarkTaskAsCompletedService = Depends(),
+    get_task_counts_service: AwaitableService = use_service('services.tasks.get_task_counts_srv.GetTaskCountsService'),
+    mark_task_as_completed_service: AwaitableService = use_service(
+        'services.tasks.mark_task_as_completed_srv.MarkTaskAsCompletedService'
+    ),
 ):
     """Mark a task as completed"""
-    mark_task_as_completed_service.execute(task_id=task_id)
-    return get_tasks(
-        request=request,
-        completed=completed,
-        get_tasks_service=get_tasks_service,
-        get_completed_tasks_service=get_completed_tasks_service,
-        get_not_completed_tasks_service=get_not_completed_tasks_service,
-    )
+    task = await mark_task_as_completed_service.execute(task_id=task_id)
+    return await render_task_row(request, completed, task, get_task_counts_service)
 
 
-@app.put('/tasks/{task_id}/uncomplete')
-def mark_task_as_not_completed(
+@router.put('/tasks/{task_id}/uncomplete')
+async def mark_task_as_not_completed(
     request: Request,
-    task_id: Any,
+    task_id: int,
     completed: bool = None,
-    get_tasks_service: GetTasksService = Depends(),
-    get_completed_tasks_service: GetCompletedTasksService = Depends(),
-    get_not_completed_tasks_service: GetNotCompletedTasksService = Depends(),
-    mark_task_as_not_completed_service: MarkTaskAsNotCompletedService = Depends(),
+    get_task_counts_service: AwaitableService = use_service('services.tasks.get_task_counts_srv.GetTaskCountsService'),
+    mark_task_as_not_completed_service: AwaitableService = use_service(
+        'services.tasks.mark_task_as_not_completed_srv.MarkTaskAsNotCompletedService'
+    ),
 ):
-    """Mark a task as completed"""
-    mark_task_as_not_completed_service.execute(task_id=task_id)
-    return get_tasks(
-        request=request,
-        completed=completed,
-        get_tasks_service=get_tasks_service,
-        get_completed_tasks_service=get_completed_tasks_service,
-        get_not_completed_tasks_service=get_not_completed_tasks_service,
-    )
+    """Mark a task as not completed"""
+    task = await mark_task_as_not_completed_service.execute(task_id=task_id)
+    return await render_task_row(request, completed, task, get_task_counts_service)
 
 
-@app.get('/status')
-def get_status(request: Request, completed: bool = None, get_tasks_service: GetTasksService = Depends()):
+@router.get('/status')
+async def get_status(
+    request: Request,
+    completed: bool = None,
+    get_task_counts_service: AwaitableService = use_service('services.tasks.get_task_counts_srv.GetTaskCountsService'),
+    get_data_version_service: AwaitableService = use_service(
+        'services.tasks.get_data_version_srv.GetDataVersionService'
+    ),
+):
     """Get tasks status information"""
-    all_selected = False
-    active_selected = False
-    completed_selected = False
-    match completed:
-        case True:
-            completed_selected = True
-        case False:
-            active_selected = True
-        case _:
-            all_selected = True
+    validators = cache_validators(
+        current_list_id(), await get_data_version_service.execute(), app_settings(request).user_header
+    )
+    if is_not_modified(request, validators):
+        return Response(status_code=304, headers=validators)
 
-    tasks = get_tasks_service.execute()
-    items_left = len([task for task in tasks if task.completed is not True])
-    completed_tasks = [task for task in tasks if task.completed is True]
+    task_counts = await get_task_counts_service.execute()
 
     return templates.TemplateResponse(
-        '/footer.html',
-        {
-            'request': request,
-            'all_selected': all_selected,
-            'active_selected': active_selected,
-            'completed_selected': completed_selected,
-            'items_left': items_left,
-            'completed_tasks': True if completed_tasks else False,
-            'tasks': tasks,
-        },
+        '/footer.html', {'request': request, **footer_context(completed, task_counts)}, headers=validators
     )
 
 
-@app.get('/header')
-def get_header(request: Request, completed: bool = None):
+@router.get('/header')
+async def get_header(
+    request: Request,
+    completed: bool = None,
+    get_data_version_service: AwaitableService = use_service(
+        'services.tasks.get_data_version_srv.GetDataVersionService'
+    ),
+):
     """Get header"""
+    validators = cache_validators(
+        current_list_id(), await get_data_version_service.execute(), app_settings(request).user_header
+    )
+    if is_not_modified(request, validators):
+        return Response(status_code=304, headers=validators)
+
     return templates.TemplateResponse(
         '/header.html',
         {
             'request': request,
             'completed': completed,
         },
+        headers=validators,
     )
 
 
-@app.post('/tasks/toggle')
-def toggle_all_tasks(
+@router.post('/tasks/toggle')
+async def toggle_all_tasks(
     request: Request,
     completed: bool = None,
-    get_tasks_service: GetTasksService = Depends(),
-    get_completed_tasks_service: GetCompletedTasksService = Depends(),
-    get_not_completed_tasks_service: GetNotCompletedTasksService = Depends(),
-    mark_tasks_as_not_completed_service: MarkTasksAsNotCompletedService = Depends(),
-    mark_tasks_as_completed_service: MarkTasksAsCompletedService = Depends(),
+    get_task_list_service: AwaitableService = use_service('services.tasks.get_task_list_srv.GetTaskListService'),
+    toggle_all_tasks_service: AwaitableService = use_service(
+        'services.tasks.toggle_all_tasks_srv.ToggleAllTasksService'
+    ),
 ):
     """Toggle all tasks' statuses"""
-    tasks = get_tasks_service.execute()
-    completed_tasks = [task for task in tasks if task.completed is True]
-    if len(completed_tasks) == len(tasks):
-        mark_tasks_as_not_completed_service.execute()
-    else:
-        mark_tasks_as_completed_service.execute()
-
-    return get_tasks(
-        request=request,
-        completed=completed,
-        get_tasks_service=get_tasks_service,
-        get_completed_tasks_service=get_completed_tasks_service,
-        get_not_completed_tasks_service=get_not_completed_tasks_service,
+    await toggle_all_tasks_service.execute()
+
+    return await render_task_list(request, completed, get_task_list_service)
+
+
+@router.get('/tasks/{task_id}/row')
+async def get_task_row(
+    request: Request,
+    task_id: int,
+    completed: bool = None,
+    get_task_service: AwaitableService = use_service('services.tasks.get_task_srv.GetTaskService'),
+    get_task_counts_service: AwaitableService = use_service('services.tasks.get_task_counts_srv.GetTaskCountsService'),
+):
+    """Get a task row, fetched by the clients notified of a change to the task"""
+    task = await get_task_service.execute(task_id=task_id)
+    return await render_task_row(request, completed, task, get_task_counts_service)
+
+
+@router.get('/events')
+async def get_task_events(request: Request, client: Optional[str] = None, broker: EventBroker = Injected(EventBroker)):
+    """Push the changes to the tasks of the request list made by other clients as server-sent events"""
+    from db.unit_of_work import current_unit_of_work
+
+    # The stream never ends, so the connection that looked up the list goes back to the pool before it starts
+    await current_unit_of_work().finish(commit=True)
+    return StreamingResponse(
+        iter_server_sent_events(
+            broker, current_list_id(), app_settings(request).events_keepalive, subscriber=valid_client_id(client)
+        ),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
     )
 
 
-@app.get('/tasks/{task_id}')
-def get_task(request: Request, task_id: Any, get_task_service: GetTaskService = Depends()):
+@router.get('/metrics')
+async def get_metrics(request: Request):
+    """Get the app metrics in the Prometheus text format"""
+    metrics = request.app.state.metrics
+    if metrics is None:
+        return Response(status_code=404)
+    return Response(metrics.render(), media_type=metrics.content_type)
+
+
+@router.get('/tasks/{task_id}')
+async def get_task(
+    request: Request,
+    task_id: int,
+    get_task_service: AwaitableService = use_service('services.tasks.get_task_srv.GetTaskService'),
+):
     """Get a task"""
-    task = get_task_service.execute(task_id=task_id)
+    task = await get_task_service.execute(task_id=task_id)
     return templates.TemplateResponse(
         '/task_input.html',
         {
@@ -309,15 +623,19 @@ def get_task(request: Request, task_id: Any, get_task_service: GetTaskService =
     )
 
 
-@app.post('/tasks/{task_id}')
-def update_task_description(
+@router.post('/tasks/{task_id}')
+async def update_task_description(
     request: Request,
-    task_id: Any,
+    task_id: int,
     description: Annotated[str, Form()],
-    update_task_service: UpdateTaskDescriptionService = Depends(),
+    update_task_service: AwaitableService = use_service(
+        'services.tasks.update_task_description_srv.UpdateTaskDescriptionService'
+    ),
 ):
-    """Update a task description"""
-    task = update_task_service.execute(Task(id=task_id, description=description))
+    """Update a task description, unless the task is not in the request list"""
+    task = await update_task_service.execute(Task(id=task_id, description=description))
+    if task is None:
+        return Response(status_code=404)
     return templates.TemplateResponse(
         '/task_label.html',
         {
@@ -327,5 +645,116 @@ def update_task_description(
     )
 
 
+def create_app(settings: Optional[Settings] = None) -> FastAPI:
+    """Build the app for a set of settings, those of the environment by default
+
+    Building it neither connects to the database nor imports the services, which are
+    resolved by the first request needing them.
+    """
+    # The database modules pull in SQLAlchemy, so they are only imported once an app is built
+    from db.group_commit import GroupCommitWriter
+    from db.list_scope import TaskListMiddleware
+    from db.query_count import QueryCountMiddleware
+    from db.query_count import time_queries
+    from db.sqlalchemy_database import create_async_session_factories
+    from db.sqlalchemy_database import create_session_factories
+    from db.unit_of_work import AsyncUnitOfWork
+    from db.unit_of_work import UnitOfWorkMiddleware
+    from metrics.prometheus import Metrics
+    from metrics.prometheus import stats_samples
+    from orm import mappings
+    from repositories import providers
+    from repositories.task_lists_repo import find_caller_list
+
+    settings = settings or get_settings()
+    app = FastAPI()
+    app.state.settings = settings
+    app.mount('/static', StaticFiles(directory='static'), name='static')
+    app.include_router(router)
+
+    injector = Injector()
+    injector.binder.bind(mappings.ORMBase, mappings.SQLAlchemyORM, scope=singleton)
+    broker = InProcessEventBroker()
+    injector.binder.bind(EventBroker, to=broker)
+    tasks_cache = None
+    if settings.cache_ttl > 0:
+        tasks_cache = ReadThroughCache(LRUCacheBackend(max_entries=settings.cache_max_entries), ttl=settings.cache_ttl)
+        injector.binder.bind(ReadThroughCache, to=tasks_cache)
+    metrics = Metrics() if settings.metrics else None
+    app.state.metrics = metrics
+    writer = None
+    # Added before the unit of work so that the lists are looked up on the request session
+    app.add_middleware(
+        TaskListMiddleware,
+        default_list_id=settings.default_list_id,
+        find_list=find_caller_list,
+        user_header=settings.user_header,
+    )
+    if settings.use_async:
+        session_factory, read_session_factory = create_async_session_factories(settings)
+        injector.binder.bind(
+            AsyncBaseTasksRepository,
+            to=lambda: providers.provide_async_tasks_repository(cache=tasks_cache, broker=broker, metrics=metrics),
+            scope=request_scope,
+        )
+        app.add_middleware(
+            UnitOfWorkMiddleware,
+            session_factory=session_factory,
+            unit_of_work_class=AsyncUnitOfWork,
+            read_session_factory=read_session_factory,
+        )
+    else:
+        session_factory, read_session_factory = create_session_factories(settings)
+        if settings.group_commit:
+            writer = GroupCommitWriter(
+                session_factory,
+                max_latency=settings.group_commit_max_latency,
+                max_batch_size=settings.group_commit_max_batch_size,
+                timeout=settings.group_commit_timeout,
+            )
+            app.add_event_handler('shutdown', writer.stop)
+        injector.binder.bind(
+            BaseTasksRepository,
+            to=lambda: providers.provide_tasks_repository(
+                cache=tasks_cache, broker=broker, writer=writer, metrics=metrics
+            ),
+            scope=request_scope,
+        )
+        app.add_middleware(
+            UnitOfWorkMiddleware, session_factory=session_factory, read_session_factory=read_session_factory
+        )
+    app.add_middleware(InjectorMiddleware, injector=injector)
+    app.add_middleware(ClientIdMiddleware)
+    # The listeners of the asyncio engines are those of their synchronous engine
+    engines = {
+        pool: getattr(factory.kw['bind'], 'sync_engine', factory.kw['bind'])
+        for pool, factory in (('write', session_factory), ('read', read_session_factory))
+    }
+    if engines['read'] is engines['write']:
+        del engines['read']
+    if metrics is not None or settings.query_count_header or settings.query_log:
+        for engine in engines.values():
+            time_queries(engine, metrics.observe_query if metrics is not None else None)
+    if settings.query_count_header or settings.query_log:
+        app.add_middleware(QueryCountMiddleware, header=settings.query_count_header, log_statements=settings.query_log)
+    if metrics is not None:
+        for pool, engine in engines.items():
+            metrics.add_pool(engine, pool)
+        if tasks_cache is not None:
+            metrics.add_stats(
+                'cache_lookups', 'Task cache lookups by result', ['result'], stats_samples(tasks_cache.stats)
+            )
+        if writer is not None:
+            metrics.add_stats(
+                'group_commit_committed', 'Batches and writes committed together', ['unit'], stats_samples(writer.stats)
+            )
+        # Added last so that it is the outermost middleware and times the whole request
+        app.add_middleware(MetricsMiddleware, metrics=metrics)
+    attach_injector(app, injector)
+    return app
+
+
 if __name__ == '__main__':
-    uvicorn.run(app, host='localhost', port=8000)
+    import uvicorn
+
+    uvicorn.run('main:create_app', factory=True, host='localhost', port=8000)
@@ -0,0 +1,81 @@
+"""Database management commands, run once per deployment instead of on every app startup
+
+    python manage.py migrate
+    python manage.py seed
+    python manage.py add-list alice Groceries
+"""
+import argparse
+import json
+from typing import Iterator
+
+from config.settings import get_settings
+from db.migrations import upgrade_database
+from db.sqlalchemy_database import create_database_engine
+from repositories import tasks_repo
+from schema.task_list_sch import SQLAlchemyTaskList
+from schema.task_sch import SQLAlchemyTask
+from schema.user_sch import SQLAlchemyUser
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+
+SAMPLE_DATA_PATH = 'data/tasks.json'
+
+
+def iter_sample_tasks(path: str) -> Iterator[dict]:
+    """Iterate over the column values of the sample tasks"""
+    with open(path, encoding='utf8') as f:
+        # Ids are left to the database so that its id sequence, if any, stays ahead of them
+        for data in json.load(f):
+            yield {'description': data['description'], 'completed': data['completed']}
+
+
+def load_sample_data(session: Session, list_id: int, path: str = SAMPLE_DATA_PATH) -> int:
+    """Add the sample tasks to an empty task list and return how many were added"""
+    if session.scalar(select(SQLAlchemyTask.id).where(SQLAlchemyTask.list_id == list_id).limit(1)) is not None:
+        return 0
+    return tasks_repo.SQLAlchemyTaskRepository(session=session, list_id=list_id).bulk_add_tasks(iter_sample_tasks(path))
+
+
+def add_task_list(session: Session, user_name: str, list_name: str) -> int:
+    """Add a task list to a user, adding the user too when new, and return the id of the list"""
+    user_id = session.scalar(select(SQLAlchemyUser.id).where(SQLAlchemyUser.name == user_name))
+    if user_id is None:
+        user = SQLAlchemyUser(name=user_name)
+        session.add(user)
+        session.flush()
+        user_id = user.id
+    task_list = SQLAlchemyTaskList(user_id=user_id, name=list_name)
+    session.add(task_list)
+    session.commit()
+    return task_list.id
+
+
+def main():
+    """Run a management command"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command', required=True)
+    migrate_parser = commands.add_parser('migrate', help='migrate the database schema up to a revision')
+    migrate_parser.add_argument('revision', nargs='?', default='head')
+    seed_parser = commands.add_parser('seed', help='add the sample tasks to the default list when it has none')
+    seed_parser.add_argument('--path', default=SAMPLE_DATA_PATH)
+    add_list_parser = commands.add_parser('add-list', help='add a task list to a user and print its id')
+    add_list_parser.add_argument('user')
+    add_list_parser.add_argument('name')
+    args = parser.parse_args()
+
+    if args.command == 'migrate':
+        upgrade_database(args.revision)
+    else:
+        settings = get_settings()
+        engine = create_database_engine(settings.database_url, settings)
+        with Session(engine) as session:
+            if args.command == 'seed':
+                print(f'Added {load_sample_data(session, settings.default_list_id, args.path)} sample tasks')
+            else:
+                print(f'Added task list {add_task_list(session, args.user, args.name)}')
+        engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
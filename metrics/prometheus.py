@@ -0,0 +1,175 @@
+"""Prometheus metrics module"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Sequence
+
+from prometheus_client import CollectorRegistry
+from prometheus_client import CONTENT_TYPE_LATEST
+from prometheus_client import generate_latest
+from prometheus_client import Histogram
+from prometheus_client.core import CounterMetricFamily
+from prometheus_client.core import GaugeMetricFamily
+from sqlalchemy import Engine
+
+
+FAST_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+"""Histogram buckets in seconds of the queries and template renders, most of them well under a millisecond"""
+
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 4, 5, 10, 25, 100)
+"""Histogram buckets of the number of queries run by a repository method call"""
+
+UNTRACKED_OPERATION = 'other'
+"""Operation label of the queries run outside a repository method call"""
+
+
+class Operation:
+    """Repository method call whose queries are being counted"""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.queries = 0
+
+
+_operation_ctx: ContextVar[Optional[Operation]] = ContextVar('operation', default=None)
+
+
+class Metrics:
+    """Metrics of an app, exposed in the Prometheus text format"""
+
+    content_type = CONTENT_TYPE_LATEST
+    """Media type of the rendered metrics"""
+
+    def __init__(self) -> None:
+        self.registry = CollectorRegistry()
+        self.engines = {}
+        self.request_duration = Histogram(
+            'http_request_duration_seconds',
+            'HTTP request latency by method, route and status',
+            ['method', 'route', 'status'],
+            registry=self.registry,
+        )
+        self.query_duration = Histogram(
+            'db_query_duration_seconds',
+            'Database query duration by repository method',
+            ['operation'],
+            buckets=FAST_BUCKETS,
+            registry=self.registry,
+        )
+        self.operation_queries = Histogram(
+            'db_queries_per_operation',
+            'Number of database queries run by a repository method call',
+            ['operation'],
+            buckets=QUERY_COUNT_BUCKETS,
+            registry=self.registry,
+        )
+        self.template_duration = Histogram(
+            'template_render_seconds',
+            'Template render time by template',
+            ['template'],
+            buckets=FAST_BUCKETS,
+            registry=self.registry,
+        )
+        self.add_stats(
+            'db_pool_connections',
+            'Connections of the database pools by state',
+            ['pool', 'state'],
+            self.pool_samples,
+            GaugeMetricFamily,
+        )
+
+    def observe_request(self, method: str, route: str, status: int, duration: float):
+        """Record the latency of an HTTP request"""
+        self.request_duration.labels(method, route, str(status)).observe(duration)
+
+    def observe_template(self, name: str, duration: float):
+        """Record the render time of a template"""
+        self.template_duration.labels(name).observe(duration)
+
+    def observe_query(self, duration: float):
+        """Record the duration of a query, counting it in the repository method call running it"""
+        operation = _operation_ctx.get()
+        if operation is not None:
+            operation.queries += 1
+        self.query_duration.labels(UNTRACKED_OPERATION if operation is None else operation.name).observe(duration)
+
+    @contextmanager
+    def operation(self, name: str) -> Iterator[Operation]:
+        """Count the queries run by a repository method call"""
+        operation = Operation(name)
+        token = _operation_ctx.set(operation)
+        try:
+            yield operation
+        finally:
+            _operation_ctx.reset(token)
+            self.operation_queries.labels(name).observe(operation.queries)
+
+    def add_stats(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str],
+        samples: Callable[[], Iterable[tuple]],
+        family: type = CounterMetricFamily,
+    ):
+        """Expose the ``(label values, value)`` samples returned by a callable whenever the metrics are collected"""
+        self.registry.register(StatsCollector(name, documentation, labels, samples, family))
+
+    def add_pool(self, engine: Engine, pool: str):
+        """Expose the state of the connection pool of an engine under the ``pool`` label"""
+        self.engines[pool] = engine
+
+    def pool_samples(self) -> Iterator[tuple]:
+        """Get the connections of every instrumented pool by state"""
+        for pool, engine in self.engines.items():
+            for state, value in pool_stats(engine).items():
+                yield (pool, state), value
+
+    def render(self) -> bytes:
+        """Render the current metrics in the Prometheus text format"""
+        return generate_latest(self.registry)
+
+
+class StatsCollector:
+    """Collector of the samples returned by a callable"""
+
+    def __init__(
+        self, name: str, documentation: str, labels: Sequence[str], samples: Callable[[], Iterable[tuple]], family: type
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.samples = samples
+        self.family = family
+
+    def collect(self):
+        metric = self.family(self.name, self.documentation, labels=self.labels)
+        for label_values, value in self.samples():
+            metric.add_metric(label_values, value)
+        yield metric
+
+
+def pool_stats(engine: Engine) -> dict:
+    """Get the connections of an engine pool by state, nothing for the pools that do not keep count"""
+    pool = engine.pool
+    if not hasattr(pool, 'checkedout'):
+        return {}
+    return {
+        'size': pool.size(),
+        'checked_in': pool.checkedin(),
+        'checked_out': pool.checkedout(),
+        'overflow': max(pool.overflow(), 0),
+    }
+
+
+def stats_samples(stats: Callable[[], dict]) -> Callable[[], Iterator[tuple]]:
+    """Turn a callable returning counters by name into one returning samples labelled by those names"""
+
+    def samples():
+        for name, value in stats().items():
+            yield (name,), value
+
+    return samples
@@ -0,0 +1,126 @@
+"""Request and template timing module, kept free of the metrics client so it loads with the app module"""
+import time
+from contextvars import ContextVar
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from jinja2 import Template
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+
+if TYPE_CHECKING:
+    from metrics.prometheus import Metrics
+
+
+_metrics_ctx: ContextVar[Optional['Metrics']] = ContextVar('metrics', default=None)
+
+
+def current_metrics() -> Optional['Metrics']:
+    """Get the metrics of the app serving the current request, if it records any"""
+    return _metrics_ctx.get()
+
+
+def route_label(scope: Scope) -> str:
+    """Get the path template of the route that served a request, so that its metrics do not depend on ids"""
+    route = scope.get('route')
+    if route is not None:
+        return route.path
+    if 'endpoint' in scope:
+        return f'{scope.get("root_path", "")}/*'
+    return 'unmatched'
+
+
+class MetricsMiddleware:
+    """Middleware timing every HTTP request by method, route and status
+
+    The metrics are bound to the request so that the templates it renders are timed too.
+    Streamed responses are timed until their last chunk is sent.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: 'Metrics') -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        token = _metrics_ctx.set(self.metrics)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.metrics.observe_request(scope['method'], route_label(scope), status, time.perf_counter() - started)
+            _metrics_ctx.reset(token)
+
+
+class TimedTemplate(Template):
+    """Template recording its render time in the metrics of the current request
+
+    Streamed renders only count the time spent producing chunks, not the time waiting for
+    the client to receive them. Included templates are part of the time of their parent.
+    """
+
+    def _observe(self, duration: float):
+        metrics = current_metrics()
+        if metrics is not None:
+            metrics.observe_template(self.name, duration)
+
+    def render(self, *args, **kwargs) -> str:
+        started = time.perf_counter()
+        try:
+            return super().render(*args, **kwargs)
+        finally:
+            self._observe(time.perf_counter() - started)
+
+    async def render_async(self, *args, **kwargs) -> str:
+        started = time.perf_counter()
+        try:
+            return await super().render_async(*args, **kwargs)
+        finally:
+            self._observe(time.perf_counter() - started)
+
+    def generate(self, *args, **kwargs):
+        chunks = super().generate(*args, **kwargs)
+        elapsed = 0.0
+        try:
+            while True:
+                started = time.perf_counter()
+                try:
+                    chunk = next(chunks)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed += time.perf_counter() - started
+                yield chunk
+        finally:
+            self._observe(elapsed)
+
+    async def generate_async(self, *args, **kwargs):
+        chunks = super().generate_async(*args, **kwargs)
+        elapsed = 0.0
+        try:
+            while True:
+                started = time.perf_counter()
+                try:
+                    chunk = await chunks.__anext__()
+                except StopAsyncIteration:
+                    return
+                finally:
+                    elapsed += time.perf_counter() - started
+                yield chunk
+        finally:
+            self._observe(elapsed)
@@ -0,0 +1,52 @@
+"""Alembic migrations environment"""
+from logging.config import fileConfig
+
+import schema.data_version_sch  # noqa: F401
+import schema.task_sch  # noqa: F401
+from alembic import context
+from config.settings import get_settings
+from db.sqlalchemy_database import Base
+from db.sqlalchemy_database import create_database_engine
+
+
+config = context.config
+if config.config_file_name is not None and config.attributes.get('configure_logger', True):
+    fileConfig(config.config_file_name)
+
+
+def database_url() -> str:
+    """Get the URL of the migrated database"""
+    return config.get_main_option('sqlalchemy.url') or get_settings().database_url
+
+
+def run_migrations_offline():
+    """Emit the migrations SQL without connecting to the database"""
+    context.configure(url=database_url(), target_metadata=Base.metadata, literal_binds=True)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_on(connection):
+    """Run the migrations through an open connection"""
+    context.configure(connection=connection, target_metadata=Base.metadata, render_as_batch=True)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    """Run the migrations on the connection given by the caller, or on a new one"""
+    connection = config.attributes.get('connection')
+    if connection is not None:
+        run_migrations_on(connection)
+        return
+
+    engine = create_database_engine(database_url(), get_settings())
+    with engine.connect() as connection:
+        run_migrations_on(connection)
+    engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,44 @@
+"""Initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+
+Databases created by ``Base.metadata.create_all`` before migrations existed already
+hold these tables, so only the missing ones are created.
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('tasks'):
+        op.create_table(
+            'tasks',
+            sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+            sa.Column('description', sa.String(), nullable=True),
+            sa.Column('completed', sa.Boolean(), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+        )
+        op.create_index('ix_tasks_id', 'tasks', ['id'])
+        op.create_index('ix_tasks_description', 'tasks', ['description'])
+    if not inspector.has_table('data_versions'):
+        op.create_table(
+            'data_versions',
+            sa.Column('name', sa.String(), nullable=False),
+            sa.Column('version', sa.Integer(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+            sa.PrimaryKeyConstraint('name'),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('data_versions')
+    op.drop_table('tasks')
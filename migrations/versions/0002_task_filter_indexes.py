@@ -0,0 +1,47 @@
+"""Index the completion filters instead of the descriptions
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+
+``ix_tasks_description`` is never used by a query and ``ix_tasks_id`` duplicates the
+primary key, yet both are maintained on every write. ``(completed, id)`` serves the
+filtered pages in id order, and on backends with partial indexes the completed rows
+also get their own index, which counts and clears them without scanning the
+active ones.
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+PARTIAL_INDEX_DIALECTS = ('sqlite', 'postgresql')
+
+
+def index_names(table_name: str) -> set:
+    """Get the names of the indexes of a table"""
+    return {index['name'] for index in sa.inspect(op.get_bind()).get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    existing = index_names('tasks')
+    for name in ('ix_tasks_description', 'ix_tasks_id'):
+        if name in existing:
+            op.drop_index(name, table_name='tasks')
+    if 'ix_tasks_completed_id' not in existing:
+        op.create_index('ix_tasks_completed_id', 'tasks', ['completed', 'id'])
+    if 'ix_tasks_completed' not in existing and op.get_bind().dialect.name in PARTIAL_INDEX_DIALECTS:
+        completed = sa.column('completed', sa.Boolean()) == sa.true()
+        op.create_index('ix_tasks_completed', 'tasks', ['id'], sqlite_where=completed, postgresql_where=completed)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name in PARTIAL_INDEX_DIALECTS:
+        op.drop_index('ix_tasks_completed', table_name='tasks')
+    op.drop_index('ix_tasks_completed_id', table_name='tasks')
+    op.create_index('ix_tasks_id', 'tasks', ['id'])
+    op.create_index('ix_tasks_description', 'tasks', ['description'])
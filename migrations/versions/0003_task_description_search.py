@@ -0,0 +1,59 @@
+"""Index the task descriptions for full-text search
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+
+SQLite gets an external content FTS5 table over the descriptions, filled from the
+existing tasks and kept in sync by triggers. PostgreSQL gets a stored ``tsvector``
+column generated from them, under a GIN index. Adding it rewrites the tasks table.
+"""
+from alembic import op
+
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+FTS_TRIGGERS = ('tasks_fts_insert', 'tasks_fts_delete', 'tasks_fts_update')
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE tasks_fts USING fts5("
+            "description, content='tasks', content_rowid='id', tokenize='porter unicode61', prefix='2 3')"
+        )
+        op.execute(
+            'CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN '
+            'INSERT INTO tasks_fts(rowid, description) VALUES (new.id, new.description); END'
+        )
+        op.execute(
+            'CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN '
+            "INSERT INTO tasks_fts(tasks_fts, rowid, description) VALUES ('delete', old.id, old.description); END"
+        )
+        op.execute(
+            'CREATE TRIGGER tasks_fts_update AFTER UPDATE OF description ON tasks BEGIN '
+            "INSERT INTO tasks_fts(tasks_fts, rowid, description) VALUES ('delete', old.id, old.description); "
+            'INSERT INTO tasks_fts(rowid, description) VALUES (new.id, new.description); END'
+        )
+        op.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')")
+    elif dialect == 'postgresql':
+        op.execute(
+            'ALTER TABLE tasks ADD COLUMN search_vector tsvector GENERATED ALWAYS AS '
+            "(to_tsvector('english', coalesce(description, ''))) STORED"
+        )
+        op.create_index('ix_tasks_search_vector', 'tasks', ['search_vector'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        for trigger in FTS_TRIGGERS:
+            op.execute(f'DROP TRIGGER {trigger}')
+        op.execute('DROP TABLE tasks_fts')
+    elif dialect == 'postgresql':
+        op.drop_index('ix_tasks_search_vector', table_name='tasks')
+        op.drop_column('tasks', 'search_vector')
@@ -0,0 +1,120 @@
+"""Scope the tasks by list
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+
+Tasks now belong to a list owned by a user. The existing tasks are moved to a default
+list of a default user, the first of each table and so the ``default_list_id`` of the
+settings, and their data version becomes the one of that list. The completion indexes
+are replaced by indexes leading on the list.
+
+SQLite rebuilds the tasks table to make the new column required, which drops the
+triggers syncing the search table, so they are created again afterwards.
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+PARTIAL_INDEX_DIALECTS = ('sqlite', 'postgresql')
+
+FTS_TRIGGERS = (
+    'CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN '
+    'INSERT INTO tasks_fts(rowid, description) VALUES (new.id, new.description); END',
+    'CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN '
+    "INSERT INTO tasks_fts(tasks_fts, rowid, description) VALUES ('delete', old.id, old.description); END",
+    'CREATE TRIGGER tasks_fts_update AFTER UPDATE OF description ON tasks BEGIN '
+    "INSERT INTO tasks_fts(tasks_fts, rowid, description) VALUES ('delete', old.id, old.description); "
+    'INSERT INTO tasks_fts(rowid, description) VALUES (new.id, new.description); END',
+)
+
+
+def create_fts_triggers():
+    """Create the triggers syncing the SQLite search table again once the tasks table is rebuilt"""
+    if op.get_bind().dialect.name == 'sqlite':
+        for trigger in FTS_TRIGGERS:
+            op.execute(trigger)
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    op.create_table(
+        'users',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name'),
+    )
+    op.create_table(
+        'task_lists',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_task_lists_user_id', 'task_lists', ['user_id'])
+
+    users = sa.table('users', sa.column('id', sa.Integer()), sa.column('name', sa.String()))
+    task_lists = sa.table(
+        'task_lists', sa.column('id', sa.Integer()), sa.column('user_id', sa.Integer()), sa.column('name', sa.String())
+    )
+    user_id = connection.execute(sa.insert(users).values(name='default').returning(users.c.id)).scalar_one()
+    list_id = connection.execute(
+        sa.insert(task_lists).values(user_id=user_id, name='Tasks').returning(task_lists.c.id)
+    ).scalar_one()
+
+    if connection.dialect.name in PARTIAL_INDEX_DIALECTS:
+        op.drop_index('ix_tasks_completed', table_name='tasks')
+    op.drop_index('ix_tasks_completed_id', table_name='tasks')
+    op.add_column('tasks', sa.Column('list_id', sa.Integer(), nullable=True))
+    op.execute(sa.text('UPDATE tasks SET list_id = :list_id').bindparams(list_id=list_id))
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.alter_column('list_id', existing_type=sa.Integer(), nullable=False)
+        batch_op.create_foreign_key('tasks_list_id_fkey', 'task_lists', ['list_id'], ['id'], ondelete='CASCADE')
+    create_fts_triggers()
+
+    op.create_index('ix_tasks_list_id_id', 'tasks', ['list_id', 'id'])
+    op.create_index('ix_tasks_list_id_completed_id', 'tasks', ['list_id', 'completed', 'id'])
+    if connection.dialect.name in PARTIAL_INDEX_DIALECTS:
+        completed = sa.column('completed', sa.Boolean()) == sa.true()
+        op.create_index(
+            'ix_tasks_list_id_completed',
+            'tasks',
+            ['list_id', 'id'],
+            sqlite_where=completed,
+            postgresql_where=completed,
+        )
+    op.execute(
+        sa.text("UPDATE data_versions SET name = :name WHERE name = 'tasks'").bindparams(name=f'tasks:{list_id}')
+    )
+
+
+def downgrade() -> None:
+    connection = op.get_bind()
+    list_id = connection.scalar(sa.text('SELECT min(id) FROM task_lists'))
+    op.execute(
+        sa.text("UPDATE data_versions SET name = 'tasks' WHERE name = :name").bindparams(name=f'tasks:{list_id}')
+    )
+    op.execute("DELETE FROM data_versions WHERE name LIKE 'tasks:%'")
+    if connection.dialect.name in PARTIAL_INDEX_DIALECTS:
+        op.drop_index('ix_tasks_list_id_completed', table_name='tasks')
+    op.drop_index('ix_tasks_list_id_completed_id', table_name='tasks')
+    op.drop_index('ix_tasks_list_id_id', table_name='tasks')
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.drop_constraint('tasks_list_id_fkey', type_='foreignkey')
+        batch_op.drop_column('list_id')
+    create_fts_triggers()
+
+    op.create_index('ix_tasks_completed_id', 'tasks', ['completed', 'id'])
+    if connection.dialect.name in PARTIAL_INDEX_DIALECTS:
+        completed = sa.column('completed', sa.Boolean()) == sa.true()
+        op.create_index('ix_tasks_completed', 'tasks', ['id'], sqlite_where=completed, postgresql_where=completed)
+    op.drop_index('ix_task_lists_user_id', table_name='task_lists')
+    op.drop_table('task_lists')
+    op.drop_table('users')
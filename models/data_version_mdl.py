@@ -0,0 +1,13 @@
+"""Data version model properties and definition module"""
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class DataVersion(BaseModel):
+    """Monotonic version of the tasks data, changing on every write"""
+
+    version: int = 0
+    updated_at: Optional[datetime] = None
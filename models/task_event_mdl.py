@@ -0,0 +1,24 @@
+"""Task event model properties and definition module"""
+
+from typing import Optional
+
+from pydantic import BaseModel
+from pydantic import ConfigDict
+
+
+TASKS_CHANGED = 'tasks'
+"""Name of the events of changes to the tasks of a list as a whole, like additions or bulk updates"""
+
+
+class TaskEvent(BaseModel):
+    """A change to the tasks of a list, named after the server-sent event pushed to its clients"""
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str = TASKS_CHANGED
+    task_id: Optional[int] = None
+
+    @classmethod
+    def task_changed(cls, task_id: int) -> 'TaskEvent':
+        """Build the event of a change to a single task"""
+        return cls(name=f'task-{task_id}', task_id=task_id)
@@ -0,0 +1,33 @@
+"""Task list view model properties and definition module"""
+
+from typing import List
+from typing import Optional
+
+from models.task_mdl import TaskRecord
+from pydantic import BaseModel
+
+
+class TaskCounts(BaseModel):
+    """Aggregate counts over all the user tasks"""
+
+    total: int = 0
+    completed: int = 0
+
+    @property
+    def active(self) -> int:
+        """Number of tasks left to complete"""
+        return self.total - self.completed
+
+
+class TaskPage(BaseModel):
+    """A page of tasks along with the cursor of the following page, if any
+
+    Built by the read services with ``model_construct``, its task records are not validated again.
+    """
+
+    tasks: List[TaskRecord] = []
+    next_cursor: Optional[int] = None
+
+
+class TaskList(TaskCounts, TaskPage):
+    """The first page of a filtered list of tasks along with the aggregate counts over all tasks"""
@@ -1,5 +1,6 @@
 """Task model properties and definition module"""
 
+from typing import NamedTuple
 from typing import Optional
 
 from pydantic import BaseModel
@@ -11,3 +12,11 @@ class Task(BaseModel):
     id: Optional[int] = None
     description: str
     completed: bool = False
+
+
+class TaskRecord(NamedTuple):
+    """A task read for display, built from its stored columns without validation"""
+
+    id: int
+    description: str
+    completed: bool
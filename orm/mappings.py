@@ -4,6 +4,7 @@ from abc import abstractmethod
 from typing import Any
 
 from models.task_mdl import Task
+from models.task_mdl import TaskRecord
 from schema.task_sch import SQLAlchemyTask
 
 
@@ -12,11 +13,21 @@ def map_task_model_to_sqlalchemy_task(task: Task) -> SQLAlchemyTask:
     return SQLAlchemyTask(description=task.description, completed=task.completed, id=task.id)
 
 
+def map_task_model_to_sqlalchemy_values(task: Task) -> dict:
+    """Map from a task model to the SQLAlchemy column values of a new row"""
+    return {'description': task.description, 'completed': task.completed}
+
+
 def map_sqlalchemy_task_to_task_model(task: SQLAlchemyTask) -> Task:
     """Map from a SQLAlchemy row object to a task model"""
     return Task(description=task.description, completed=task.completed, id=task.id)
 
 
+def map_sqlalchemy_row_to_task_record(task: Any) -> TaskRecord:
+    """Map from the columns of a SQLAlchemy row, or a row object, to a task record"""
+    return TaskRecord(task.id, task.description, task.completed)
+
+
 class ORMBase(ABC):
     """ORM Base class"""
 
@@ -25,11 +36,21 @@ class ORMBase(ABC):
         """Convert to a Task model object"""
         raise NotImplementedError()
 
+    @abstractmethod
+    def to_task_record(self, schema_task: Any) -> TaskRecord:
+        """Convert to a Task record, read for display without validation"""
+        raise NotImplementedError()
+
     @abstractmethod
     def to_schema_db_task(self, task: Task) -> Any:
         """Convert to a schema database equivalent object"""
         raise NotImplementedError()
 
+    @abstractmethod
+    def to_schema_db_values(self, task: Task) -> Any:
+        """Convert to the schema database column values of a new row"""
+        raise NotImplementedError()
+
 
 class SQLAlchemyORM(ORMBase):
     """SQLAlchemy ORM class"""
@@ -38,6 +59,14 @@ class SQLAlchemyORM(ORMBase):
         """Convert SQLAlchemyTask to Task"""
         return map_sqlalchemy_task_to_task_model(schema_task)
 
+    def to_task_record(self, schema_task: Any) -> TaskRecord:
+        """Convert SQLAlchemy task columns to TaskRecord"""
+        return map_sqlalchemy_row_to_task_record(schema_task)
+
     def to_schema_db_task(self, task: Task) -> SQLAlchemyTask:
         """Convert Task to SQLAlchemyTask"""
         return map_task_model_to_sqlalchemy_task(task)
+
+    def to_schema_db_values(self, task: Task) -> dict:
+        """Convert Task to SQLAlchemyTask column values"""
+        return map_task_model_to_sqlalchemy_values(task)
@@ -2,14 +2,32 @@
 
 from abc import ABC
 from abc import abstractmethod
+from itertools import islice
 from typing import Any
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
 
 from models.task_mdl import Task
 
 
+BULK_CHUNK_SIZE = 1000
+"""Number of rows inserted per transaction by bulk task additions"""
+
+
+def iter_chunks(rows: Iterable, size: int) -> Iterator[list]:
+    """Split rows into lists of at most ``size`` items without materializing them all"""
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
 class BaseTasksRepository(ABC):
     """Task opertations repository"""
 
+    list_id: int
+    """Id of the list whose tasks are read and written by the repository"""
+
     @abstractmethod
     def get_tasks(self):
         """Get all tasks"""
@@ -35,6 +53,16 @@ class BaseTasksRepository(ABC):
         """Delete a task"""
         raise NotImplementedError()
 
+    @abstractmethod
+    def delete_completed_tasks(self):
+        """Delete all completed tasks and return how many were deleted"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def bulk_add_tasks(self, tasks: Iterable[dict], chunk_size: int = BULK_CHUNK_SIZE):
+        """Insert tasks column values in chunked transactions and return how many were added"""
+        raise NotImplementedError()
+
     @abstractmethod
     def mark_task_as_completed(self, task_id: Any):
         """Mark a task as completed"""
@@ -55,6 +83,11 @@ class BaseTasksRepository(ABC):
         """Mark all task as not completed"""
         raise NotImplementedError()
 
+    @abstractmethod
+    def toggle_all(self):
+        """Complete the active tasks, or reopen them all when none is active, and return how many changed"""
+        raise NotImplementedError()
+
     @abstractmethod
     def get_completed_tasks(self):
         """Get all completed tasks"""
@@ -64,3 +97,146 @@ class BaseTasksRepository(ABC):
     def get_not_completed_tasks(self):
         """Get all not completed tasks"""
         raise NotImplementedError()
+
+    @abstractmethod
+    def get_task_list(self, completed: Optional[bool] = None, limit: Optional[int] = None):
+        """Get the first tasks matching a completion filter along with the overall total and completed counts"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_tasks_page(
+        self, completed: Optional[bool] = None, after_id: Optional[int] = None, limit: Optional[int] = None
+    ):
+        """Get the tasks matching a completion filter that follow the ``after_id`` cursor"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_task_counts(self):
+        """Get the overall total and completed counts"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_data_version(self):
+        """Get the tasks data version, incremented on every write, and the time it last changed"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def iter_tasks(self, completed: Optional[bool] = None):
+        """Iterate over the tasks matching a completion filter without loading them all at once"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def search_tasks(self, query: str, completed: Optional[bool] = None, limit: Optional[int] = None, offset: int = 0):
+        """Get the tasks whose description matches every word of a query, best ranked first"""
+        raise NotImplementedError()
+
+
+class AsyncBaseTasksRepository(ABC):
+    """Asyncio task operations repository"""
+
+    list_id: int
+    """Id of the list whose tasks are read and written by the repository"""
+
+    @abstractmethod
+    async def get_tasks(self):
+        """Get all tasks"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_task(self, task_id: Any):
+        """Get a task"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def update_task_description(self, task: Task):
+        """Update a task description"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def add_task(self, task: Task):
+        """Add a new task"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def delete_task(self, task_id: Any):
+        """Delete a task"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def delete_completed_tasks(self):
+        """Delete all completed tasks and return how many were deleted"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def bulk_add_tasks(self, tasks: Iterable[dict], chunk_size: int = BULK_CHUNK_SIZE):
+        """Insert tasks column values in chunked transactions and return how many were added"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def mark_task_as_completed(self, task_id: Any):
+        """Mark a task as completed"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def mark_tasks_as_completed(self):
+        """Mark all tasks as completed"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def mark_task_as_not_completed(self, task_id: Any):
+        """Mark a task as not completed"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def mark_tasks_as_not_completed(self):
+        """Mark all task as not completed"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def toggle_all(self):
+        """Complete the active tasks, or reopen them all when none is active, and return how many changed"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_completed_tasks(self):
+        """Get all completed tasks"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_not_completed_tasks(self):
+        """Get all not completed tasks"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_task_list(self, completed: Optional[bool] = None, limit: Optional[int] = None):
+        """Get the first tasks matching a completion filter along with the overall total and completed counts"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_tasks_page(
+        self, completed: Optional[bool] = None, after_id: Optional[int] = None, limit: Optional[int] = None
+    ):
+        """Get the tasks matching a completion filter that follow the ``after_id`` cursor"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_task_counts(self):
+        """Get the overall total and completed counts"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_data_version(self):
+        """Get the tasks data version, incremented on every write, and the time it last changed"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def iter_tasks(self, completed: Optional[bool] = None):
+        """Iterate over the tasks matching a completion filter without loading them all at once"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def search_tasks(
+        self, query: str, completed: Optional[bool] = None, limit: Optional[int] = None, offset: int = 0
+    ):
+        """Get the tasks whose description matches every word of a query, best ranked first"""
+        raise NotImplementedError()
@@ -0,0 +1,337 @@
+"""Caching task repositories implementations"""
+from typing import Any
+from typing import Iterable
+from typing import Optional
+
+from cache.read_through import ReadThroughCache
+from schema.task_sch import SQLAlchemyTask
+
+from . import AsyncBaseTasksRepository
+from . import BaseTasksRepository
+from . import BULK_CHUNK_SIZE
+
+
+TASK_LISTS = 'task_lists'
+"""Cache group of the results holding task rows"""
+
+TASK_COUNTS = 'task_counts'
+"""Cache group of the results holding task counts"""
+
+
+def list_cache_groups(list_id: int) -> tuple:
+    """Get the names of the task lists and task counts cache groups of a list"""
+    return tuple(f'{group}:{list_id}' for group in (TASK_LISTS, TASK_COUNTS))
+
+
+def detach_tasks(tasks) -> list:
+    """Copy the task rows of a result into a list, their plain column values safely outliving their session"""
+    return list(tasks)
+
+
+def detach_task_list(task_list) -> tuple:
+    """Copy the rows of a task list result into a list, keeping its counts"""
+    tasks, total, completed = task_list
+    return detach_tasks(tasks), total, completed
+
+
+class CachedTaskRepository(BaseTasksRepository):
+    """Read-through caching decorator of a task repository
+
+    List and count results are cached per filter and invalidated by the write methods, in
+    cache groups of their own for each list. Those groups only see the writes of their own
+    process, so once a request reads the data version, which is never cached, its results
+    are cached under that version too, and the responses it validates never show older ones.
+    """
+
+    def __init__(self, task_repository: BaseTasksRepository, cache: ReadThroughCache) -> None:
+        self.task_repository = task_repository
+        self.cache = cache
+        self.list_id = task_repository.list_id
+        self.task_lists, self.task_counts = list_cache_groups(task_repository.list_id)
+        self.data_version = None
+
+    def cache_key(self, *key) -> tuple:
+        """Build the cache key of a result, along with the data version read by the request if any"""
+        return (*key, self.data_version)
+
+    def get_tasks(self):
+        """Get all tasks"""
+        return self.cache.get_or_load(
+            (self.task_lists,), self.cache_key('get_tasks'), lambda: detach_tasks(self.task_repository.get_tasks())
+        )
+
+    def get_task(self, task_id: Any):
+        """Get a task"""
+        return self.task_repository.get_task(task_id=task_id)
+
+    def add_task(self, task: SQLAlchemyTask):
+        """Add a new task"""
+        result = self.task_repository.add_task(task=task)
+        self.cache.invalidate(self.task_lists, self.task_counts)
+        return result
+
+    def update_task_description(self, task: SQLAlchemyTask):
+        """Update a task description"""
+        result = self.task_repository.update_task_description(task=task)
+        self.cache.invalidate(self.task_lists)
+        return result
+
+    def mark_task_as_completed(self, task_id: Any):
+        """Mark a task as completed"""
+        result = self.task_repository.mark_task_as_completed(task_id=task_id)
+        self.cache.invalidate(self.task_lists, self.task_counts)
+        return result
+
+    def mark_tasks_as_completed(self):
+        """Mark all tasks as completed"""
+        result = self.task_repository.mark_tasks_as_completed()
+        self.cache.invalidate(self.task_lists, self.task_counts)
+        return result
+
+    def mark_task_as_not_completed(self, task_id: Any):
+        """Mark a task as not completed"""
+        result = self.task_repository.mark_task_as_not_completed(task_id=task_id)
+        self.cache.invalidate(self.task_lists, self.task_counts)
+        return result
+
+    def mark_tasks_as_not_completed(self):
+        """Mark all task as not completed"""
+        result = self.task_repository.mark_tasks_as_not_completed()
+        self.cache.invalidate(self.task_lists, self.task_counts)
+        return result
+
+    def toggle_all(self):
+        """Complete the active tasks, or reopen them all when none is active, and return how many changed"""
+        result = self.task_repository.toggle_all()
+        self.cache.invalidate(self.task_lists, self.task_counts)
+        return result
+
+    def get_completed_tasks(self):
+        """Get all completed tasks"""
+        return self.cache.get_or_load(
+            (self.task_lists,),
+            self.cache_key('get_completed_tasks'),
+            lambda: detach_tasks(self.task_repository.get_completed_tasks()),
+        )
+
+    def get_not_completed_tasks(self):
+        """Get all not completed tasks"""
+        return self.cache.get_or_load(
+            (self.task_lists,),
+            self.cache_key('get_not_completed_tasks'),
+            lambda: detach_tasks(self.task_repository.get_not_completed_tasks()),
+        )
+
+    def delete_task(self, task_id: Any):
+        """Delete a task"""
+        result = self.task_repository.delete_task(task_id=task_id)
+        self.cache.invalidate(self.task_lists, self.task_counts)
+        return result
+
+    def delete_completed_tasks(self):
+        """Delete all completed tasks and return how many were deleted"""
+        result = self.task_repository.delete_completed_tasks()
+        self.cache.invalidate(self.task_lists, self.task_counts)
+        return result
+
+    def bulk_add_tasks(self, tasks: Iterable[dict], chunk_size: int = BULK_CHUNK_SIZE):
+        """Insert tasks column values in chunked transactions and return how many were added"""
+        try:
+            return self.task_repository.bulk_add_tasks(tasks=tasks, chunk_size=chunk_size)
+        finally:
+            self.cache.invalidate(self.task_lists, self.task_counts)
+
+    def get_task_list(self, completed: Optional[bool] = None, limit: Optional[int] = None):
+        """Get the first tasks matching a completion filter along with the overall total and completed counts"""
+        return self.cache.get_or_load(
+            (self.task_lists, self.task_counts),
+            self.cache_key('get_task_list', completed, limit),
+            lambda: detach_task_list(self.task_repository.get_task_list(completed=completed, limit=limit)),
+        )
+
+    def get_tasks_page(
+        self, completed: Optional[bool] = None, after_id: Optional[int] = None, limit: Optional[int] = None
+    ):
+        """Get the tasks matching a completion filter that follow the ``after_id`` cursor"""
+        return self.cache.get_or_load(
+            (self.task_lists,),
+            self.cache_key('get_tasks_page', completed, after_id, limit),
+            lambda: detach_tasks(
+                self.task_repository.get_tasks_page(completed=completed, after_id=after_id, limit=limit)
+            ),
+        )
+
+    def get_task_counts(self):
+        """Get the overall total and completed counts"""
+        return self.cache.get_or_load(
+            (self.task_counts,), self.cache_key('get_task_counts'), self.task_repository.get_task_counts
+        )
+
+    def get_data_version(self):
+        """Get the tasks data version, incremented on every write, and the time it last changed
+
+        It is never cached, since the version validates the responses of every worker
+        process and reading it is a single primary key lookup.
+        """
+        version, updated_at = self.task_repository.get_data_version()
+        self.data_version = version
+        return version, updated_at
+
+    def iter_tasks(self, completed: Optional[bool] = None):
+        """Iterate over the tasks matching a completion filter without loading them all at once"""
+        return self.task_repository.iter_tasks(completed=completed)
+
+    def search_tasks(self, query: str, completed: Optional[bool] = None, limit: Optional[int] = None, offset: int = 0):
+        """Get the tasks whose description matches every word of a query, left uncached as queries rarely repeat"""
+        return self.task_repository.search_tasks(query=query, completed=completed, limit=limit, offset=offset)
+
+
+class AsyncCachedTaskRepository(AsyncBaseTasksRepository):
+    """Asyncio read-through caching decorator of a task repository, keyed as ``CachedTaskRepository`` is"""
+
+    def __init__(self, task_repository: AsyncBaseTasksRepository, cache: ReadThroughCache) -> None:
+        self.task_repository = task_repository
+        self.cache = cache
+        self.list_id = task_repository.list_id
+        self.task_lists, self.task_counts = list_cache_groups(task_repository.list_id)
+        self.data_version = None
+
+    def cache_key(self, *key) -> tuple:
+        """Build the cache key of a result, along with the data version read by the request if any"""
+        return (*key, self.data_version)
+
+    async def get_tasks(self):
+        """Get all tasks"""
+
+        async def load():
+            return detach_tasks(await self.task_repository.get_tasks())
+
+        return await self.cache.get_or_load_async((self.task_lists,), self.cache_key('get_tasks'), load)
+
+    async def get_task(self, task_id: Any):
+        """Get a task"""
+        return await self.task_repository.get_task(task_id=task_id)
+
+    async def add_task(self, task: SQLAlchemyTask):
+        """Add a new task"""
+        result = await self.task_repository.add_task(task=task)
+        self.cache.invalidate(self.task_lists, self.task_counts)
+        return result
+
+    async def update_task_description(self, task: SQLAlchemyTask):
+        """Update a task description"""
+        result = await self.task_repository.update_task_description(task=task)
+        self.cache.invalidate(self.task_lists)
+        return result
+
+    async def mark_task_as_completed(self, task_id: Any):
+        """Mark a task as completed"""
+        result = await self.task_repository.mark_task_as_completed(task_id=task_id)
+        self.cache.invalidate(self.task_lists, self.task_counts)
+        return result
+
+    async def mark_tasks_as_completed(self):
+        """Mark all tasks as completed"""
+        result = await self.task_repository.mark_tasks_as_completed()
+        self.cache.invalidate(self.task_lists, self.task_counts)
+        return result
+
+    async def mark_task_as_not_completed(self, task_id: Any):
+        """Mark a task as not completed"""
+        result = await self.task_repository.mark_task_as_not_completed(task_id=task_id)
+        self.cache.invalidate(self.task_lists, self.task_counts)
+        return result
+
+    async def mark_tasks_as_not_completed(self):
+        """Mark all task as not completed"""
+        result = await self.task_repository.mark_tasks_as_not_completed()
+        self.cache.invalidate(self.task_lists, self.task_counts)
+        return result
+
+    async def toggle_all(self):
+        """Complete the active tasks, or reopen them all when none is active, and return how many changed"""
+        result = await self.task_repository.toggle_all()
+        self.cache.invalidate(self.task_lists, self.task_counts)
+        return result
+
+    async def get_completed_tasks(self):
+        """Get all completed tasks"""
+
+        async def load():
+            return detach_tasks(await self.task_repository.get_completed_tasks())
+
+        return await self.cache.get_or_load_async((self.task_lists,), self.cache_key('get_completed_tasks'), load)
+
+    async def get_not_completed_tasks(self):
+        """Get all not completed tasks"""
+
+        async def load():
+            return detach_tasks(await self.task_repository.get_not_completed_tasks())
+
+        return await self.cache.get_or_load_async((self.task_lists,), self.cache_key('get_not_completed_tasks'), load)
+
+    async def delete_task(self, task_id: Any):
+        """Delete a task"""
+        result = await self.task_repository.delete_task(task_id=task_id)
+        self.cache.invalidate(self.task_lists, self.task_counts)
+        return result
+
+    async def delete_completed_tasks(self):
+        """Delete all completed tasks and return how many were deleted"""
+        result = await self.task_repository.delete_completed_tasks()
+        self.cache.invalidate(self.task_lists, self.task_counts)
+        return result
+
+    async def bulk_add_tasks(self, tasks: Iterable[dict], chunk_size: int = BULK_CHUNK_SIZE):
+        """Insert tasks column values in chunked transactions and return how many were added"""
+        try:
+            return await self.task_repository.bulk_add_tasks(tasks=tasks, chunk_size=chunk_size)
+        finally:
+            self.cache.invalidate(self.task_lists, self.task_counts)
+
+    async def get_task_list(self, completed: Optional[bool] = None, limit: Optional[int] = None):
+        """Get the first tasks matching a completion filter along with the overall total and completed counts"""
+
+        async def load():
+            return detach_task_list(await self.task_repository.get_task_list(completed=completed, limit=limit))
+
+        return await self.cache.get_or_load_async(
+            (self.task_lists, self.task_counts), self.cache_key('get_task_list', completed, limit), load
+        )
+
+    async def get_tasks_page(
+        self, completed: Optional[bool] = None, after_id: Optional[int] = None, limit: Optional[int] = None
+    ):
+        """Get the tasks matching a completion filter that follow the ``after_id`` cursor"""
+
+        async def load():
+            return detach_tasks(
+                await self.task_repository.get_tasks_page(completed=completed, after_id=after_id, limit=limit)
+            )
+
+        return await self.cache.get_or_load_async(
+            (self.task_lists,), self.cache_key('get_tasks_page', completed, after_id, limit), load
+        )
+
+    async def get_task_counts(self):
+        """Get the overall total and completed counts"""
+        return await self.cache.get_or_load_async(
+            (self.task_counts,), self.cache_key('get_task_counts'), self.task_repository.get_task_counts
+        )
+
+    async def get_data_version(self):
+        """Get the tasks data version, incremented on every write, and the time it last changed, never cached"""
+        version, updated_at = await self.task_repository.get_data_version()
+        self.data_version = version
+        return version, updated_at
+
+    async def iter_tasks(self, completed: Optional[bool] = None):
+        """Iterate over the tasks matching a completion filter without loading them all at once"""
+        async for task in self.task_repository.iter_tasks(completed=completed):
+            yield task
+
+    async def search_tasks(
+        self, query: str, completed: Optional[bool] = None, limit: Optional[int] = None, offset: int = 0
+    ):
+        """Get the tasks whose description matches every word of a query, left uncached as queries rarely repeat"""
+        return await self.task_repository.search_tasks(query=query, completed=completed, limit=limit, offset=offset)
@@ -0,0 +1,72 @@
+"""Group commit task repositories implementations"""
+from typing import Any
+
+from db.group_commit import GroupCommitWriter
+from schema.task_sch import SQLAlchemyTask
+
+from .tasks_repo import SQLAlchemyTaskRepository
+
+
+class BatchedTaskRepository(SQLAlchemyTaskRepository):
+    """SQLAlchemy task repository leaving the commit of its writes to the batch they run in"""
+
+    def commit(self):
+        """Flush the write so the following ones of the batch see it"""
+        self.session.flush()
+
+
+class GroupCommitTaskRepository(SQLAlchemyTaskRepository):
+    """SQLAlchemy task repository handing its single task and whole list writes to a group commit writer
+
+    Reads keep using the request session, whose transaction is ended before every write so
+    that it holds no lock the writer could wait on and the following reads see the write.
+    Bulk additions already commit whole chunks and run on the request session.
+    """
+
+    def __init__(self, session, list_id: int, writer: GroupCommitWriter) -> None:
+        super().__init__(session=session, list_id=list_id)
+        self.writer = writer
+
+    def submit(self, method: str, **kwargs) -> Any:
+        """Run a write of the repository list in the next batch of the writer"""
+        self.session.commit()
+        list_id = self.list_id
+        return self.writer.submit(
+            lambda session: getattr(BatchedTaskRepository(session=session, list_id=list_id), method)(**kwargs)
+        )
+
+    def add_task(self, task: SQLAlchemyTask):
+        """Add a new task"""
+        return self.submit('add_task', task=task)
+
+    def update_task_description(self, task: SQLAlchemyTask):
+        """Update a task description"""
+        return self.submit('update_task_description', task=task)
+
+    def mark_task_as_completed(self, task_id: Any):
+        """Mark a task as completed"""
+        return self.submit('mark_task_as_completed', task_id=task_id)
+
+    def mark_tasks_as_completed(self):
+        """Mark all tasks as completed"""
+        return self.submit('mark_tasks_as_completed')
+
+    def mark_task_as_not_completed(self, task_id: Any):
+        """Mark a task as not completed"""
+        return self.submit('mark_task_as_not_completed', task_id=task_id)
+
+    def mark_tasks_as_not_completed(self):
+        """Mark all task as not completed"""
+        return self.submit('mark_tasks_as_not_completed')
+
+    def toggle_all(self):
+        """Complete the active tasks, or reopen them all when none is active, and return how many changed"""
+        return self.submit('toggle_all')
+
+    def delete_task(self, task_id: Any):
+        """Delete a task"""
+        return self.submit('delete_task', task_id=task_id)
+
+    def delete_completed_tasks(self):
+        """Delete all completed tasks and return how many were deleted"""
+        return self.submit('delete_completed_tasks')
@@ -0,0 +1,251 @@
+"""Metered task repositories implementations"""
+from typing import Any
+from typing import Iterable
+from typing import Optional
+
+from metrics.prometheus import Metrics
+from schema.task_sch import SQLAlchemyTask
+
+from . import AsyncBaseTasksRepository
+from . import BaseTasksRepository
+from . import BULK_CHUNK_SIZE
+
+
+class MeteredTaskRepository(BaseTasksRepository):
+    """Decorator of a task repository counting the queries run by every method call
+
+    Each call is a metrics operation named after its method, which labels the duration of
+    its queries and records how many it ran, so that a method running one query per task
+    stands out. The tasks iterated over are counted while each one is fetched.
+    """
+
+    def __init__(self, task_repository: BaseTasksRepository, metrics: Metrics) -> None:
+        self.task_repository = task_repository
+        self.metrics = metrics
+        self.list_id = task_repository.list_id
+
+    def get_tasks(self):
+        """Get all tasks"""
+        with self.metrics.operation('get_tasks'):
+            return self.task_repository.get_tasks()
+
+    def get_task(self, task_id: Any):
+        """Get a task"""
+        with self.metrics.operation('get_task'):
+            return self.task_repository.get_task(task_id=task_id)
+
+    def add_task(self, task: SQLAlchemyTask):
+        """Add a new task"""
+        with self.metrics.operation('add_task'):
+            return self.task_repository.add_task(task=task)
+
+    def update_task_description(self, task: SQLAlchemyTask):
+        """Update a task description"""
+        with self.metrics.operation('update_task_description'):
+            return self.task_repository.update_task_description(task=task)
+
+    def mark_task_as_completed(self, task_id: Any):
+        """Mark a task as completed"""
+        with self.metrics.operation('mark_task_as_completed'):
+            return self.task_repository.mark_task_as_completed(task_id=task_id)
+
+    def mark_tasks_as_completed(self):
+        """Mark all tasks as completed"""
+        with self.metrics.operation('mark_tasks_as_completed'):
+            return self.task_repository.mark_tasks_as_completed()
+
+    def mark_task_as_not_completed(self, task_id: Any):
+        """Mark a task as not completed"""
+        with self.metrics.operation('mark_task_as_not_completed'):
+            return self.task_repository.mark_task_as_not_completed(task_id=task_id)
+
+    def mark_tasks_as_not_completed(self):
+        """Mark all task as not completed"""
+        with self.metrics.operation('mark_tasks_as_not_completed'):
+            return self.task_repository.mark_tasks_as_not_completed()
+
+    def toggle_all(self):
+        """Complete the active tasks, or reopen them all when none is active, and return how many changed"""
+        with self.metrics.operation('toggle_all'):
+            return self.task_repository.toggle_all()
+
+    def get_completed_tasks(self):
+        """Get all completed tasks"""
+        with self.metrics.operation('get_completed_tasks'):
+            return self.task_repository.get_completed_tasks()
+
+    def get_not_completed_tasks(self):
+        """Get all not completed tasks"""
+        with self.metrics.operation('get_not_completed_tasks'):
+            return self.task_repository.get_not_completed_tasks()
+
+    def delete_task(self, task_id: Any):
+        """Delete a task"""
+        with self.metrics.operation('delete_task'):
+            return self.task_repository.delete_task(task_id=task_id)
+
+    def delete_completed_tasks(self):
+        """Delete all completed tasks and return how many were deleted"""
+        with self.metrics.operation('delete_completed_tasks'):
+            return self.task_repository.delete_completed_tasks()
+
+    def bulk_add_tasks(self, tasks: Iterable[dict], chunk_size: int = BULK_CHUNK_SIZE):
+        """Insert tasks column values in chunked transactions and return how many were added"""
+        with self.metrics.operation('bulk_add_tasks'):
+            return self.task_repository.bulk_add_tasks(tasks=tasks, chunk_size=chunk_size)
+
+    def get_task_list(self, completed: Optional[bool] = None, limit: Optional[int] = None):
+        """Get the first tasks matching a completion filter along with the overall total and completed counts"""
+        with self.metrics.operation('get_task_list'):
+            return self.task_repository.get_task_list(completed=completed, limit=limit)
+
+    def get_tasks_page(
+        self, completed: Optional[bool] = None, after_id: Optional[int] = None, limit: Optional[int] = None
+    ):
+        """Get the tasks matching a completion filter that follow the ``after_id`` cursor"""
+        with self.metrics.operation('get_tasks_page'):
+            return self.task_repository.get_tasks_page(completed=completed, after_id=after_id, limit=limit)
+
+    def get_task_counts(self):
+        """Get the overall total and completed counts"""
+        with self.metrics.operation('get_task_counts'):
+            return self.task_repository.get_task_counts()
+
+    def get_data_version(self):
+        """Get the tasks data version, incremented on every write, and the time it last changed"""
+        with self.metrics.operation('get_data_version'):
+            return self.task_repository.get_data_version()
+
+    def iter_tasks(self, completed: Optional[bool] = None):
+        """Iterate over the tasks matching a completion filter without loading them all at once"""
+        tasks = iter(self.task_repository.iter_tasks(completed=completed))
+        while True:
+            with self.metrics.operation('iter_tasks'):
+                task = next(tasks, None)
+            if task is None:
+                return
+            yield task
+
+    def search_tasks(self, query: str, completed: Optional[bool] = None, limit: Optional[int] = None, offset: int = 0):
+        """Get the tasks whose description matches every word of a query, best ranked first"""
+        with self.metrics.operation('search_tasks'):
+            return self.task_repository.search_tasks(query=query, completed=completed, limit=limit, offset=offset)
+
+
+class AsyncMeteredTaskRepository(AsyncBaseTasksRepository):
+    """Asyncio decorator of a task repository counting the queries run by every method call"""
+
+    def __init__(self, task_repository: AsyncBaseTasksRepository, metrics: Metrics) -> None:
+        self.task_repository = task_repository
+        self.metrics = metrics
+        self.list_id = task_repository.list_id
+
+    async def get_tasks(self):
+        """Get all tasks"""
+        with self.metrics.operation('get_tasks'):
+            return await self.task_repository.get_tasks()
+
+    async def get_task(self, task_id: Any):
+        """Get a task"""
+        with self.metrics.operation('get_task'):
+            return await self.task_repository.get_task(task_id=task_id)
+
+    async def add_task(self, task: SQLAlchemyTask):
+        """Add a new task"""
+        with self.metrics.operation('add_task'):
+            return await self.task_repository.add_task(task=task)
+
+    async def update_task_description(self, task: SQLAlchemyTask):
+        """Update a task description"""
+        with self.metrics.operation('update_task_description'):
+            return await self.task_repository.update_task_description(task=task)
+
+    async def mark_task_as_completed(self, task_id: Any):
+        """Mark a task as completed"""
+        with self.metrics.operation('mark_task_as_completed'):
+            return await self.task_repository.mark_task_as_completed(task_id=task_id)
+
+    async def mark_tasks_as_completed(self):
+        """Mark all tasks as completed"""
+        with self.metrics.operation('mark_tasks_as_completed'):
+            return await self.task_repository.mark_tasks_as_completed()
+
+    async def mark_task_as_not_completed(self, task_id: Any):
+        """Mark a task as not completed"""
+        with self.metrics.operation('mark_task_as_not_completed'):
+            return await self.task_repository.mark_task_as_not_completed(task_id=task_id)
+
+    async def mark_tasks_as_not_completed(self):
+        """Mark all task as not completed"""
+        with self.metrics.operation('mark_tasks_as_not_completed'):
+            return await self.task_repository.mark_tasks_as_not_completed()
+
+    async def toggle_all(self):
+        """Complete the active tasks, or reopen them all when none is active, and return how many changed"""
+        with self.metrics.operation('toggle_all'):
+            return await self.task_repository.toggle_all()
+
+    async def get_completed_tasks(self):
+        """Get all completed tasks"""
+        with self.metrics.operation('get_completed_tasks'):
+            return await self.task_repository.get_completed_tasks()
+
+    async def get_not_completed_tasks(self):
+        """Get all not completed tasks"""
+        with self.metrics.operation('get_not_completed_tasks'):
+            return await self.task_repository.get_not_completed_tasks()
+
+    async def delete_task(self, task_id: Any):
+        """Delete a task"""
+        with self.metrics.operation('delete_task'):
+            return await self.task_repository.delete_task(task_id=task_id)
+
+    async def delete_completed_tasks(self):
+        """Delete all completed tasks and return how many were deleted"""
+        with self.metrics.operation('delete_completed_tasks'):
+            return await self.task_repository.delete_completed_tasks()
+
+    async def bulk_add_tasks(self, tasks: Iterable[dict], chunk_size: int = BULK_CHUNK_SIZE):
+        """Insert tasks column values in chunked transactions and return how many were added"""
+        with self.metrics.operation('bulk_add_tasks'):
+            return await self.task_repository.bulk_add_tasks(tasks=tasks, chunk_size=chunk_size)
+
+    async def get_task_list(self, completed: Optional[bool] = None, limit: Optional[int] = None):
+        """Get the first tasks matching a completion filter along with the overall total and completed counts"""
+        with self.metrics.operation('get_task_list'):
+            return await self.task_repository.get_task_list(completed=completed, limit=limit)
+
+    async def get_tasks_page(
+        self, completed: Optional[bool] = None, after_id: Optional[int] = None, limit: Optional[int] = None
+    ):
+        """Get the tasks matching a completion filter that follow the ``after_id`` cursor"""
+        with self.metrics.operation('get_tasks_page'):
+            return await self.task_repository.get_tasks_page(completed=completed, after_id=after_id, limit=limit)
+
+    async def get_task_counts(self):
+        """Get the overall total and completed counts"""
+        with self.metrics.operation('get_task_counts'):
+            return await self.task_repository.get_task_counts()
+
+    async def get_data_version(self):
+        """Get the tasks data version, incremented on every write, and the time it last changed"""
+        with self.metrics.operation('get_data_version'):
+            return await self.task_repository.get_data_version()
+
+    async def iter_tasks(self, completed: Optional[bool] = None):
+        """Iterate over the tasks matching a completion filter without loading them all at once"""
+        tasks = self.task_repository.iter_tasks(completed=completed)
+        while True:
+            with self.metrics.operation('iter_tasks'):
+                try:
+                    task = await tasks.__anext__()
+                except StopAsyncIteration:
+                    return
+            yield task
+
+    async def search_tasks(
+        self, query: str, completed: Optional[bool] = None, limit: Optional[int] = None, offset: int = 0
+    ):
+        """Get the tasks whose description matches every word of a query, best ranked first"""
+        with self.metrics.operation('search_tasks'):
+            return await self.task_repository.search_tasks(query=query, completed=completed, limit=limit, offset=offset)
@@ -0,0 +1,60 @@
+"""Task repositories providers, bound to the injector by the app factory"""
+from typing import Optional
+
+from cache.read_through import ReadThroughCache
+from db.group_commit import GroupCommitWriter
+from db.list_scope import current_list_id
+from db.unit_of_work import current_session
+from events.brokers import EventBroker
+from metrics.prometheus import Metrics
+
+from . import AsyncBaseTasksRepository
+from . import BaseTasksRepository
+from . import cached_tasks_repo
+from . import group_commit_tasks_repo
+from . import metered_tasks_repo
+from . import publishing_tasks_repo
+from . import tasks_repo
+
+
+def provide_tasks_repository(
+    cache: Optional[ReadThroughCache] = None,
+    broker: Optional[EventBroker] = None,
+    writer: Optional[GroupCommitWriter] = None,
+    metrics: Optional[Metrics] = None,
+) -> BaseTasksRepository:
+    """Build a task repository bound to the current request session and task list
+
+    Writes are committed in batches by ``writer`` when one is given. Only the queries reaching
+    the database are metered, not the cache hits. Events are published once the cache is
+    invalidated, so the clients they reach never refresh from stale entries.
+    """
+    if writer is not None:
+        repository = group_commit_tasks_repo.GroupCommitTaskRepository(
+            session=current_session(), list_id=current_list_id(), writer=writer
+        )
+    else:
+        repository = tasks_repo.SQLAlchemyTaskRepository(session=current_session(), list_id=current_list_id())
+    if metrics is not None:
+        repository = metered_tasks_repo.MeteredTaskRepository(task_repository=repository, metrics=metrics)
+    if cache is not None:
+        repository = cached_tasks_repo.CachedTaskRepository(task_repository=repository, cache=cache)
+    if broker is not None:
+        repository = publishing_tasks_repo.PublishingTaskRepository(task_repository=repository, broker=broker)
+    return repository
+
+
+def provide_async_tasks_repository(
+    cache: Optional[ReadThroughCache] = None,
+    broker: Optional[EventBroker] = None,
+    metrics: Optional[Metrics] = None,
+) -> AsyncBaseTasksRepository:
+    """Build an asyncio task repository bound to the current request session and task list"""
+    repository = tasks_repo.AsyncSQLAlchemyTaskRepository(session=current_session(), list_id=current_list_id())
+    if metrics is not None:
+        repository = metered_tasks_repo.AsyncMeteredTaskRepository(task_repository=repository, metrics=metrics)
+    if cache is not None:
+        repository = cached_tasks_repo.AsyncCachedTaskRepository(task_repository=repository, cache=cache)
+    if broker is not None:
+        repository = publishing_tasks_repo.AsyncPublishingTaskRepository(task_repository=repository, broker=broker)
+    return repository
@@ -0,0 +1,253 @@
+"""Event publishing task repositories implementations"""
+from typing import Any
+from typing import Iterable
+from typing import Optional
+
+from events.brokers import EventBroker
+from events.origin import publish_event
+from models.task_event_mdl import TaskEvent
+from schema.task_sch import SQLAlchemyTask
+
+from . import AsyncBaseTasksRepository
+from . import BaseTasksRepository
+from . import BULK_CHUNK_SIZE
+
+
+class PublishingTaskRepository(BaseTasksRepository):
+    """Decorator of a task repository publishing an event to the channel of its list after every write
+
+    Writes to a single task publish an event naming it, so clients only refresh its row,
+    while writes to many tasks publish the change of the whole list. The client making
+    the write is not notified, since the response to its request already shows it.
+    """
+
+    def __init__(self, task_repository: BaseTasksRepository, broker: EventBroker) -> None:
+        self.task_repository = task_repository
+        self.broker = broker
+        self.list_id = task_repository.list_id
+
+    def publish(self, event: TaskEvent):
+        """Publish an event of the repository list on behalf of the client of the current request"""
+        publish_event(self.broker, self.list_id, event)
+
+    def get_tasks(self):
+        """Get all tasks"""
+        return self.task_repository.get_tasks()
+
+    def get_task(self, task_id: Any):
+        """Get a task"""
+        return self.task_repository.get_task(task_id=task_id)
+
+    def add_task(self, task: SQLAlchemyTask):
+        """Add a new task"""
+        result = self.task_repository.add_task(task=task)
+        self.publish(TaskEvent())
+        return result
+
+    def update_task_description(self, task: SQLAlchemyTask):
+        """Update a task description"""
+        result = self.task_repository.update_task_description(task=task)
+        self.publish(TaskEvent.task_changed(task.id))
+        return result
+
+    def mark_task_as_completed(self, task_id: Any):
+        """Mark a task as completed"""
+        result = self.task_repository.mark_task_as_completed(task_id=task_id)
+        self.publish(TaskEvent.task_changed(task_id))
+        return result
+
+    def mark_tasks_as_completed(self):
+        """Mark all tasks as completed"""
+        result = self.task_repository.mark_tasks_as_completed()
+        self.publish(TaskEvent())
+        return result
+
+    def mark_task_as_not_completed(self, task_id: Any):
+        """Mark a task as not completed"""
+        result = self.task_repository.mark_task_as_not_completed(task_id=task_id)
+        self.publish(TaskEvent.task_changed(task_id))
+        return result
+
+    def mark_tasks_as_not_completed(self):
+        """Mark all task as not completed"""
+        result = self.task_repository.mark_tasks_as_not_completed()
+        self.publish(TaskEvent())
+        return result
+
+    def toggle_all(self):
+        """Complete the active tasks, or reopen them all when none is active, and return how many changed"""
+        result = self.task_repository.toggle_all()
+        self.publish(TaskEvent())
+        return result
+
+    def get_completed_tasks(self):
+        """Get all completed tasks"""
+        return self.task_repository.get_completed_tasks()
+
+    def get_not_completed_tasks(self):
+        """Get all not completed tasks"""
+        return self.task_repository.get_not_completed_tasks()
+
+    def delete_task(self, task_id: Any):
+        """Delete a task"""
+        result = self.task_repository.delete_task(task_id=task_id)
+        self.publish(TaskEvent.task_changed(task_id))
+        return result
+
+    def delete_completed_tasks(self):
+        """Delete all completed tasks and return how many were deleted"""
+        result = self.task_repository.delete_completed_tasks()
+        self.publish(TaskEvent())
+        return result
+
+    def bulk_add_tasks(self, tasks: Iterable[dict], chunk_size: int = BULK_CHUNK_SIZE):
+        """Insert tasks column values in chunked transactions and return how many were added"""
+        try:
+            return self.task_repository.bulk_add_tasks(tasks=tasks, chunk_size=chunk_size)
+        finally:
+            self.publish(TaskEvent())
+
+    def get_task_list(self, completed: Optional[bool] = None, limit: Optional[int] = None):
+        """Get the first tasks matching a completion filter along with the overall total and completed counts"""
+        return self.task_repository.get_task_list(completed=completed, limit=limit)
+
+    def get_tasks_page(
+        self, completed: Optional[bool] = None, after_id: Optional[int] = None, limit: Optional[int] = None
+    ):
+        """Get the tasks matching a completion filter that follow the ``after_id`` cursor"""
+        return self.task_repository.get_tasks_page(completed=completed, after_id=after_id, limit=limit)
+
+    def get_task_counts(self):
+        """Get the overall total and completed counts"""
+        return self.task_repository.get_task_counts()
+
+    def get_data_version(self):
+        """Get the tasks data version, incremented on every write, and the time it last changed"""
+        return self.task_repository.get_data_version()
+
+    def iter_tasks(self, completed: Optional[bool] = None):
+        """Iterate over the tasks matching a completion filter without loading them all at once"""
+        return self.task_repository.iter_tasks(completed=completed)
+
+    def search_tasks(self, query: str, completed: Optional[bool] = None, limit: Optional[int] = None, offset: int = 0):
+        """Get the tasks whose description matches every word of a query, best ranked first"""
+        return self.task_repository.search_tasks(query=query, completed=completed, limit=limit, offset=offset)
+
+
+class AsyncPublishingTaskRepository(AsyncBaseTasksRepository):
+    """Asyncio decorator of a task repository publishing an event to the channel of its list after every write"""
+
+    def __init__(self, task_repository: AsyncBaseTasksRepository, broker: EventBroker) -> None:
+        self.task_repository = task_repository
+        self.broker = broker
+        self.list_id = task_repository.list_id
+
+    def publish(self, event: TaskEvent):
+        """Publish an event of the repository list on behalf of the client of the current request"""
+        publish_event(self.broker, self.list_id, event)
+
+    async def get_tasks(self):
+        """Get all tasks"""
+        return await self.task_repository.get_tasks()
+
+    async def get_task(self, task_id: Any):
+        """Get a task"""
+        return await self.task_repository.get_task(task_id=task_id)
+
+    async def add_task(self, task: SQLAlchemyTask):
+        """Add a new task"""
+        result = await self.task_repository.add_task(task=task)
+        self.publish(TaskEvent())
+        return result
+
+    async def update_task_description(self, task: SQLAlchemyTask):
+        """Update a task description"""
+        result = await self.task_repository.update_task_description(task=task)
+        self.publish(TaskEvent.task_changed(task.id))
+        return result
+
+    async def mark_task_as_completed(self, task_id: Any):
+        """Mark a task as completed"""
+        result = await self.task_repository.mark_task_as_completed(task_id=task_id)
+        self.publish(TaskEvent.task_changed(task_id))
+        return result
+
+    async def mark_tasks_as_completed(self):
+        """Mark all tasks as completed"""
+        result = await self.task_repository.mark_tasks_as_completed()
+        self.publish(TaskEvent())
+        return result
+
+    async def mark_task_as_not_completed(self, task_id: Any):
+        """Mark a task as not completed"""
+        result = await self.task_repository.mark_task_as_not_completed(task_id=task_id)
+        self.publish(TaskEvent.task_changed(task_id))
+        return result
+
+    async def mark_tasks_as_not_completed(self):
+        """Mark all task as not completed"""
+        result = await self.task_repository.mark_tasks_as_not_completed()
+        self.publish(TaskEvent())
+        return result
+
+    async def toggle_all(self):
+        """Complete the active tasks, or reopen them all when none is active, and return how many changed"""
+        result = await self.task_repository.toggle_all()
+        self.publish(TaskEvent())
+        return result
+
+    async def get_completed_tasks(self):
+        """Get all completed tasks"""
+        return await self.task_repository.get_completed_tasks()
+
+    async def get_not_completed_tasks(self):
+        """Get all not completed tasks"""
+        return await self.task_repository.get_not_completed_tasks()
+
+    async def delete_task(self, task_id: Any):
+        """Delete a task"""
+        result = await self.task_repository.delete_task(task_id=task_id)
+        self.publish(TaskEvent.task_changed(task_id))
+        return result
+
+    async def delete_completed_tasks(self):
+        """Delete all completed tasks and return how many were deleted"""
+        result = await self.task_repository.delete_completed_tasks()
+        self.publish(TaskEvent())
+        return result
+
+    async def bulk_add_tasks(self, tasks: Iterable[dict], chunk_size: int = BULK_CHUNK_SIZE):
+        """Insert tasks column values in chunked transactions and return how many were added"""
+        try:
+            return await self.task_repository.bulk_add_tasks(tasks=tasks, chunk_size=chunk_size)
+        finally:
+            self.publish(TaskEvent())
+
+    async def get_task_list(self, completed: Optional[bool] = None, limit: Optional[int] = None):
+        """Get the first tasks matching a completion filter along with the overall total and completed counts"""
+        return await self.task_repository.get_task_list(completed=completed, limit=limit)
+
+    async def get_tasks_page(
+        self, completed: Optional[bool] = None, after_id: Optional[int] = None, limit: Optional[int] = None
+    ):
+        """Get the tasks matching a completion filter that follow the ``after_id`` cursor"""
+        return await self.task_repository.get_tasks_page(completed=completed, after_id=after_id, limit=limit)
+
+    async def get_task_counts(self):
+        """Get the overall total and completed counts"""
+        return await self.task_repository.get_task_counts()
+
+    async def get_data_version(self):
+        """Get the tasks data version, incremented on every write, and the time it last changed"""
+        return await self.task_repository.get_data_version()
+
+    async def iter_tasks(self, completed: Optional[bool] = None):
+        """Iterate over the tasks matching a completion filter without loading them all at once"""
+        async for task in self.task_repository.iter_tasks(completed=completed):
+            yield task
+
+    async def search_tasks(
+        self, query: str, completed: Optional[bool] = None, limit: Optional[int] = None, offset: int = 0
+    ):
+        """Get the tasks whose description matches every word of a query, best ranked first"""
+        return await self.task_repository.search_tasks(query=query, completed=completed, limit=limit, offset=offset)
@@ -0,0 +1,36 @@
+"""Task list lookups implementations"""
+from typing import Optional
+
+from db.unit_of_work import current_session
+from schema.task_list_sch import SQLAlchemyTaskList
+from schema.user_sch import SQLAlchemyUser
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from starlette.concurrency import run_in_threadpool
+
+
+def caller_list_statement(list_id: Optional[int], user_name: Optional[str], default_list_id: int):
+    """Build the statement getting the id of a list owned by the caller, their first list when no id is given
+
+    The caller is the user named ``user_name``, or the owner of the default list when no
+    user is named.
+    """
+    if user_name is not None:
+        statement = select(SQLAlchemyTaskList.id).join(SQLAlchemyUser).where(SQLAlchemyUser.name == user_name)
+    else:
+        default_list = aliased(SQLAlchemyTaskList)
+        owner_id = select(default_list.user_id).where(default_list.id == default_list_id).scalar_subquery()
+        statement = select(SQLAlchemyTaskList.id).where(SQLAlchemyTaskList.user_id == owner_id)
+    if list_id is not None:
+        return statement.where(SQLAlchemyTaskList.id == list_id)
+    return statement.order_by(SQLAlchemyTaskList.id).limit(1)
+
+
+async def find_caller_list(list_id: Optional[int], user_name: Optional[str], default_list_id: int) -> Optional[int]:
+    """Get the id of a list owned by the caller on the session of the current request, if they own it"""
+    session = current_session()
+    statement = caller_list_statement(list_id, user_name, default_list_id)
+    if isinstance(session, AsyncSession):
+        return await session.scalar(statement)
+    return await run_in_threadpool(session.scalar, statement)
@@ -1,75 +1,578 @@
 """Task repositories implementations"""
+import re
+from datetime import datetime
+from datetime import timezone
 from typing import Any
+from typing import Iterable
+from typing import Optional
 
+from schema.data_version_sch import SQLAlchemyDataVersion
 from schema.task_sch import SQLAlchemyTask
+from schema.task_sch import TASKS_FTS_TABLE
+from schema.task_sch import TASKS_SEARCH_VECTOR
+from schema.task_sch import TEXT_SEARCH_CONFIGURATION
+from sqlalchemy import column
+from sqlalchemy import delete
+from sqlalchemy import false
+from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import literal_column
 from sqlalchemy import not_
+from sqlalchemy import select
+from sqlalchemy import table
+from sqlalchemy import true
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm import Bundle
 
+from . import AsyncBaseTasksRepository
 from . import BaseTasksRepository
+from . import BULK_CHUNK_SIZE
+from . import iter_chunks
+
+
+YIELD_PER = 500
+"""Number of rows fetched per round-trip when iterating over large results"""
+
+TASKS_DATA_VERSION = 'tasks'
+"""Prefix of the name of the data version bumped on every write to the tasks of a list"""
+
+SEARCH_TERM_PATTERN = re.compile(r'\w+')
+"""Words of a search query, anything else being dropped rather than read as search syntax"""
+
+MIN_PREFIX_LENGTH = 2
+"""Length from which the last search term matches as a prefix, shorter prefixes matching too many words"""
+
+SEARCH_CANDIDATES = 1000
+"""Number of most recent matching tasks ranked by a search"""
+
+TS_RANK_NORMALIZATION = 1
+"""PostgreSQL rank normalization favouring short descriptions, as BM25 does on SQLite"""
+
+
+def data_version_name(list_id: int) -> str:
+    """Get the name of the data version of the tasks of a list"""
+    return f'{TASKS_DATA_VERSION}:{list_id}'
+
+
+UPSERT_INSERTS = {'sqlite': sqlite.insert, 'postgresql': postgresql.insert}
+"""Insert constructs supporting ``ON CONFLICT DO UPDATE`` by dialect name"""
+
+
+def bump_data_version_statement(dialect_name: str, list_id: int, updated_at: datetime):
+    """Build the statement incrementing the data version of the tasks of a list, creating it on the first write
+
+    A single upsert lets concurrent first writes to a list serialize on the primary key
+    instead of both inserting the version and one of them failing. Dialects without an
+    upsert get the update of an existing version only, see ``insert_data_version_statement``.
+    """
+    if dialect_name not in UPSERT_INSERTS:
+        return (
+            update(SQLAlchemyDataVersion)
+            .where(SQLAlchemyDataVersion.name == data_version_name(list_id))
+            .values(version=SQLAlchemyDataVersion.version + 1, updated_at=updated_at)
+        )
+    statement = UPSERT_INSERTS[dialect_name](SQLAlchemyDataVersion).values(
+        name=data_version_name(list_id), version=1, updated_at=updated_at
+    )
+    return statement.on_conflict_do_update(
+        index_elements=[SQLAlchemyDataVersion.name],
+        set_={'version': SQLAlchemyDataVersion.version + 1, 'updated_at': statement.excluded.updated_at},
+    )
+
+
+def insert_data_version_statement(list_id: int, updated_at: datetime):
+    """Build the statement creating the data version of the tasks of a list on its first write
+
+    Only run on the dialects without an upsert, once updating the version matched no row.
+    """
+    return insert(SQLAlchemyDataVersion).values(name=data_version_name(list_id), version=1, updated_at=updated_at)
+
+
+def task_counts_statement(list_id: int):
+    """Build the statement computing the total and completed task counts of a list in a single round-trip
+
+    Each count is its own subquery so that the completed one can be answered from the
+    partial index of the completed tasks instead of scanning every row of the list.
+    """
+    in_list = SQLAlchemyTask.list_id == list_id
+    return select(
+        select(func.count()).where(in_list).scalar_subquery().label('total'),
+        select(func.count()).where(in_list, SQLAlchemyTask.completed).scalar_subquery().label('completed'),
+    )
+
+
+TASK_COLUMNS = (SQLAlchemyTask.id, SQLAlchemyTask.description, SQLAlchemyTask.completed)
+"""Columns of the tasks returned by the reads and the writes, fetched as plain rows rather than ORM objects"""
+
+
+def add_task_statement(task: SQLAlchemyTask, list_id: int):
+    """Build the statement inserting a task into a list and returning the stored row"""
+    values = {column.key: getattr(task, column.key) for column in TASK_COLUMNS}
+    values = {key: value for key, value in values.items() if value is not None}
+    return insert(SQLAlchemyTask).values(**values, list_id=list_id).returning(*TASK_COLUMNS)
+
+
+def update_task_statement(task_id: Any, list_id: int, **values):
+    """Build the statement updating a task of a list and returning the stored row"""
+    return (
+        update(SQLAlchemyTask)
+        .where(SQLAlchemyTask.id == task_id, SQLAlchemyTask.list_id == list_id)
+        .values(**values)
+        .returning(*TASK_COLUMNS)
+    )
+
+
+def toggle_all_statement(list_id: int):
+    """Build the statement completing the active tasks of a list, or reopening them all when none is active
+
+    The ``EXISTS`` check of an active task is evaluated once for the whole statement, so
+    the decision and the update are atomic, and only the rows whose state changes are written.
+    Tasks stored without a completion state, which only writes made outside the app leave,
+    count as active here as they do in the counts and the bulk marks. The completion filters
+    compare the column directly to keep using its indexes, so the active filter leaves them out.
+    """
+    active = aliased(SQLAlchemyTask)
+    any_active = (
+        select(active.id).where(active.list_id == list_id, not_(func.coalesce(active.completed, false()))).exists()
+    )
+    return (
+        update(SQLAlchemyTask)
+        .where(SQLAlchemyTask.list_id == list_id, func.coalesce(SQLAlchemyTask.completed, false()) == not_(any_active))
+        .values(completed=any_active)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def task_from_row(row) -> Optional[SQLAlchemyTask]:
+    """Build a transient task from a returned row, which stays usable once the transaction is committed"""
+    if row is None:
+        return None
+    return SQLAlchemyTask(id=row.id, description=row.description, completed=row.completed)
+
+
+def task_list_statement(list_id: int, completed: Optional[bool] = None, limit: Optional[int] = None):
+    """Build the statement fetching the filtered tasks along with the overall counts
+
+    The counts are computed once in a subquery and outer joined to the filtered rows,
+    so a single round-trip returns one row even when no task matches the filter. The
+    rows are limited before the join, which lets them be read in index order instead
+    of sorting every matching task.
+    """
+    counts = task_counts_statement(list_id).subquery()
+    page = tasks_page_statement(list_id, completed=completed, limit=limit).subquery()
+    task = Bundle('task', *(page.c[column.key] for column in TASK_COLUMNS))
+    return (
+        select(task, counts.c.total, counts.c.completed).select_from(counts).outerjoin(page, true()).order_by(page.c.id)
+    )
+
+
+def tasks_page_statement(
+    list_id: int, completed: Optional[bool] = None, after_id: Optional[int] = None, limit: Optional[int] = None
+):
+    """Build the keyset pagination statement fetching the filtered tasks of a list that follow ``after_id``"""
+    statement = select(*TASK_COLUMNS).where(SQLAlchemyTask.list_id == list_id).order_by(SQLAlchemyTask.id).limit(limit)
+    if completed is not None:
+        statement = statement.where(SQLAlchemyTask.completed == completed)
+    if after_id is not None:
+        statement = statement.where(SQLAlchemyTask.id > after_id)
+    return statement
+
+
+def search_tasks_statement(
+    dialect_name: str,
+    list_id: int,
+    terms: list,
+    completed: Optional[bool] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+):
+    """Build the statement fetching the tasks of a list matching every search term, best ranked first
+
+    The last term matches as a word prefix once it is ``MIN_PREFIX_LENGTH`` characters
+    long, so results narrow down while the query is typed. SQLite ranks the matches of
+    its FTS5 table with BM25 and PostgreSQL those of the indexed ``tsvector`` column with
+    ``ts_rank``. Only the ``SEARCH_CANDIDATES`` most recent matches are ranked, which
+    bounds the cost of common words. Other databases scan the descriptions in id order.
+    """
+    filters = [SQLAlchemyTask.list_id == list_id]
+    if completed is not None:
+        filters.append(SQLAlchemyTask.completed == completed)
+    is_prefix = len(terms[-1]) >= MIN_PREFIX_LENGTH
+    if dialect_name == 'sqlite':
+        query = ' '.join(f'"{term}"' for term in terms) + ('*' if is_prefix else '')
+        fts = table(TASKS_FTS_TABLE, column('rowid'), column('rank'))
+        candidates = (
+            select(*TASK_COLUMNS, fts.c.rank)
+            .join(fts, fts.c.rowid == SQLAlchemyTask.id)
+            .where(literal_column(TASKS_FTS_TABLE).op('MATCH')(query), *filters)
+            .order_by(fts.c.rowid.desc())
+            .limit(SEARCH_CANDIDATES)
+            .subquery()
+        )
+        rank = candidates.c.rank
+    elif dialect_name == 'postgresql':
+        query = func.to_tsquery(
+            literal_column(f"'{TEXT_SEARCH_CONFIGURATION}'"), ' & '.join(terms) + (':*' if is_prefix else '')
+        )
+        search_vector = literal_column(f'{SQLAlchemyTask.__tablename__}.{TASKS_SEARCH_VECTOR}')
+        candidates = (
+            select(*TASK_COLUMNS, search_vector.label(TASKS_SEARCH_VECTOR))
+            .where(search_vector.op('@@')(query), *filters)
+            .order_by(SQLAlchemyTask.id.desc())
+            .limit(SEARCH_CANDIDATES)
+            .subquery()
+        )
+        rank = func.ts_rank(candidates.c[TASKS_SEARCH_VECTOR], query, TS_RANK_NORMALIZATION).desc()
+    else:
+        statement = (
+            select(*TASK_COLUMNS)
+            .where(*(SQLAlchemyTask.description.icontains(term, autoescape=True) for term in terms), *filters)
+            .order_by(SQLAlchemyTask.id)
+        )
+        return statement.limit(limit).offset(offset)
+
+    task_columns = (candidates.c[column.key] for column in TASK_COLUMNS)
+    return select(*task_columns).order_by(rank, candidates.c.id).limit(limit).offset(offset)
+
+
+def split_task_list_rows(rows):
+    """Split the task list statement rows into tasks, total and completed counts"""
+    tasks = [row[0] for row in rows if row[0].id is not None]
+    total, completed = rows[0][1], rows[0][2]
+    return tasks, total, completed
 
 
 class SQLAlchemyTaskRepository(BaseTasksRepository):
-    """SQLAlchemy task repository implementation"""
+    """SQLAlchemy task repository implementation, scoped to the tasks of a list"""
 
-    def __init__(self, session) -> None:
+    def __init__(self, session, list_id: int) -> None:
         self.session = session
+        self.list_id = list_id
+
+    @property
+    def in_list(self):
+        """Criterion matching the tasks of the repository list"""
+        return SQLAlchemyTask.list_id == self.list_id
+
+    def bump_data_version(self):
+        """Increment the tasks data version within the current transaction"""
+        dialect_name = self.session.get_bind().dialect.name
+        updated_at = datetime.now(timezone.utc)
+        result = self.session.execute(bump_data_version_statement(dialect_name, self.list_id, updated_at))
+        if dialect_name not in UPSERT_INSERTS and not result.rowcount:
+            self.session.execute(insert_data_version_statement(self.list_id, updated_at))
+
+    def commit(self):
+        """Commit the transaction of a write"""
+        self.session.commit()
+
+    def get_data_version(self):
+        """Get the tasks data version and the time it last changed"""
+        data_version = self.session.get(SQLAlchemyDataVersion, data_version_name(self.list_id), populate_existing=True)
+        if data_version is None:
+            return 0, None
+        return data_version.version, data_version.updated_at
 
     def get_tasks(self):
         """Get all tasks"""
-        return self.session.query(SQLAlchemyTask).all()
+        return self.session.execute(select(*TASK_COLUMNS).where(self.in_list)).all()
 
     def get_task(self, task_id: Any):
-        return self.session.query(SQLAlchemyTask).filter(SQLAlchemyTask.id == task_id).first()
+        """Get a task"""
+        return self.session.execute(select(*TASK_COLUMNS).where(self.in_list, SQLAlchemyTask.id == task_id)).first()
 
     def add_task(self, task: SQLAlchemyTask):
         """Add a new task"""
-        self.session.add(task)
-        self.session.commit()
-        return task
+        row = self.session.execute(add_task_statement(task, self.list_id)).one()
+        self.bump_data_version()
+        self.commit()
+        return task_from_row(row)
 
     def update_task_description(self, task: SQLAlchemyTask):
         """Update a task description"""
-        self.session.query(SQLAlchemyTask).filter(SQLAlchemyTask.id == task.id).update(
-            {SQLAlchemyTask.description: task.description}
-        )
-        self.session.commit()
-        return True
+        row = self.session.execute(
+            update_task_statement(task.id, self.list_id, description=task.description)
+        ).one_or_none()
+        if row is not None:
+            self.bump_data_version()
+        self.commit()
+        return task_from_row(row)
 
     def mark_task_as_completed(self, task_id: Any):
         """Mark a task as completed"""
-        self.session.query(SQLAlchemyTask).filter(SQLAlchemyTask.id == task_id).update({SQLAlchemyTask.completed: True})
-        self.session.commit()
-        return True
+        row = self.session.execute(update_task_statement(task_id, self.list_id, completed=True)).one_or_none()
+        if row is not None:
+            self.bump_data_version()
+        self.commit()
+        return task_from_row(row)
 
     def mark_tasks_as_completed(self):
         """Mark all tasks as completed"""
-        self.session.query(SQLAlchemyTask).update({SQLAlchemyTask.completed: True})
-        self.session.commit()
+        statement = update(SQLAlchemyTask).where(self.in_list, SQLAlchemyTask.completed.is_not(True))
+        if self.session.execute(statement.values(completed=True)).rowcount:
+            self.bump_data_version()
+        self.commit()
         return True
 
     def mark_task_as_not_completed(self, task_id: Any):
         """Mark a task as not completed"""
-        self.session.query(SQLAlchemyTask).filter(SQLAlchemyTask.id == task_id).update(
-            {SQLAlchemyTask.completed: False}
-        )
-        self.session.commit()
-        return True
+        row = self.session.execute(update_task_statement(task_id, self.list_id, completed=False)).one_or_none()
+        if row is not None:
+            self.bump_data_version()
+        self.commit()
+        return task_from_row(row)
 
     def mark_tasks_as_not_completed(self):
         """Mark all task as not completed"""
-        self.session.query(SQLAlchemyTask).update({SQLAlchemyTask.completed: False})
-        self.session.commit()
+        statement = update(SQLAlchemyTask).where(self.in_list, SQLAlchemyTask.completed.is_not(False))
+        if self.session.execute(statement.values(completed=False)).rowcount:
+            self.bump_data_version()
+        self.commit()
         return True
 
+    def toggle_all(self):
+        """Complete the active tasks, or reopen them all when none is active, and return how many changed"""
+        updated = self.session.execute(toggle_all_statement(self.list_id)).rowcount
+        if updated:
+            self.bump_data_version()
+        self.commit()
+        return updated
+
     def get_completed_tasks(self):
         """Get all completed tasks"""
-        return self.session.query(SQLAlchemyTask).filter(SQLAlchemyTask.completed).all()
+        return self.session.execute(select(*TASK_COLUMNS).where(self.in_list, SQLAlchemyTask.completed)).all()
 
     def get_not_completed_tasks(self):
         """Get all not completed tasks"""
-        return self.session.query(SQLAlchemyTask).filter(not_(SQLAlchemyTask.completed)).all()
+        return self.session.execute(select(*TASK_COLUMNS).where(self.in_list, not_(SQLAlchemyTask.completed))).all()
 
     def delete_task(self, task_id: Any):
         """Delete a task"""
-        self.session.query(SQLAlchemyTask).filter(SQLAlchemyTask.id == task_id).delete()
-        self.session.commit()
+        if self.session.execute(delete(SQLAlchemyTask).where(self.in_list, SQLAlchemyTask.id == task_id)).rowcount:
+            self.bump_data_version()
+        self.commit()
         return True
+
+    def delete_completed_tasks(self):
+        """Delete all completed tasks and return how many were deleted"""
+        deleted = self.session.execute(delete(SQLAlchemyTask).where(self.in_list, SQLAlchemyTask.completed)).rowcount
+        if deleted:
+            self.bump_data_version()
+        self.commit()
+        return deleted
+
+    def bulk_add_tasks(self, tasks: Iterable[dict], chunk_size: int = BULK_CHUNK_SIZE):
+        """Insert tasks column values in chunked transactions and return how many were added"""
+        added = 0
+        for chunk in iter_chunks(tasks, chunk_size):
+            self.session.execute(insert(SQLAlchemyTask), [{**task, 'list_id': self.list_id} for task in chunk])
+            self.bump_data_version()
+            self.session.commit()
+            added += len(chunk)
+        return added
+
+    def get_task_list(self, completed: Optional[bool] = None, limit: Optional[int] = None):
+        """Get the first tasks matching a completion filter along with the overall total and completed counts"""
+        rows = self.session.execute(task_list_statement(self.list_id, completed=completed, limit=limit)).all()
+        return split_task_list_rows(rows)
+
+    def get_tasks_page(
+        self, completed: Optional[bool] = None, after_id: Optional[int] = None, limit: Optional[int] = None
+    ):
+        """Get the tasks matching a completion filter that follow the ``after_id`` cursor"""
+        return self.session.execute(
+            tasks_page_statement(self.list_id, completed=completed, after_id=after_id, limit=limit)
+        ).all()
+
+    def get_task_counts(self):
+        """Get the overall total and completed counts"""
+        return tuple(self.session.execute(task_counts_statement(self.list_id)).one())
+
+    def iter_tasks(self, completed: Optional[bool] = None):
+        """Iterate over the tasks matching a completion filter without loading them all at once"""
+        statement = tasks_page_statement(self.list_id, completed=completed).execution_options(yield_per=YIELD_PER)
+        yield from self.session.execute(statement)
+
+    def search_tasks(self, query: str, completed: Optional[bool] = None, limit: Optional[int] = None, offset: int = 0):
+        """Get the tasks whose description matches every word of a query, best ranked first"""
+        terms = SEARCH_TERM_PATTERN.findall(query)
+        if not terms:
+            return []
+        dialect_name = self.session.get_bind().dialect.name
+        statement = search_tasks_statement(
+            dialect_name, self.list_id, terms, completed=completed, limit=limit, offset=offset
+        )
+        return self.session.execute(statement).all()
+
+
+class AsyncSQLAlchemyTaskRepository(AsyncBaseTasksRepository):
+    """SQLAlchemy asyncio task repository implementation, scoped to the tasks of a list"""
+
+    def __init__(self, session: AsyncSession, list_id: int) -> None:
+        self.session = session
+        self.list_id = list_id
+
+    @property
+    def in_list(self):
+        """Criterion matching the tasks of the repository list"""
+        return SQLAlchemyTask.list_id == self.list_id
+
+    async def bump_data_version(self):
+        """Increment the tasks data version within the current transaction"""
+        dialect_name = self.session.get_bind().dialect.name
+        updated_at = datetime.now(timezone.utc)
+        result = await self.session.execute(bump_data_version_statement(dialect_name, self.list_id, updated_at))
+        if dialect_name not in UPSERT_INSERTS and not result.rowcount:
+            await self.session.execute(insert_data_version_statement(self.list_id, updated_at))
+
+    async def get_data_version(self):
+        """Get the tasks data version and the time it last changed"""
+        data_version = await self.session.get(
+            SQLAlchemyDataVersion, data_version_name(self.list_id), populate_existing=True
+        )
+        if data_version is None:
+            return 0, None
+        return data_version.version, data_version.updated_at
+
+    async def get_tasks(self):
+        """Get all tasks"""
+        return (await self.session.execute(select(*TASK_COLUMNS).where(self.in_list))).all()
+
+    async def get_task(self, task_id: Any):
+        """Get a task"""
+        statement = select(*TASK_COLUMNS).where(self.in_list, SQLAlchemyTask.id == task_id)
+        return (await self.session.execute(statement)).first()
+
+    async def add_task(self, task: SQLAlchemyTask):
+        """Add a new task"""
+        row = (await self.session.execute(add_task_statement(task, self.list_id))).one()
+        await self.bump_data_version()
+        await self.session.commit()
+        return task_from_row(row)
+
+    async def update_task_description(self, task: SQLAlchemyTask):
+        """Update a task description"""
+        row = (
+            await self.session.execute(update_task_statement(task.id, self.list_id, description=task.description))
+        ).one_or_none()
+        if row is not None:
+            await self.bump_data_version()
+        await self.session.commit()
+        return task_from_row(row)
+
+    async def mark_task_as_completed(self, task_id: Any):
+        """Mark a task as completed"""
+        row = (await self.session.execute(update_task_statement(task_id, self.list_id, completed=True))).one_or_none()
+        if row is not None:
+            await self.bump_data_version()
+        await self.session.commit()
+        return task_from_row(row)
+
+    async def mark_tasks_as_completed(self):
+        """Mark all tasks as completed"""
+        statement = update(SQLAlchemyTask).where(self.in_list, SQLAlchemyTask.completed.is_not(True))
+        if (await self.session.execute(statement.values(completed=True))).rowcount:
+            await self.bump_data_version()
+        await self.session.commit()
+        return True
+
+    async def mark_task_as_not_completed(self, task_id: Any):
+        """Mark a task as not completed"""
+        row = (await self.session.execute(update_task_statement(task_id, self.list_id, completed=False))).one_or_none()
+        if row is not None:
+            await self.bump_data_version()
+        await self.session.commit()
+        return task_from_row(row)
+
+    async def mark_tasks_as_not_completed(self):
+        """Mark all task as not completed"""
+        statement = update(SQLAlchemyTask).where(self.in_list, SQLAlchemyTask.completed.is_not(False))
+        if (await self.session.execute(statement.values(completed=False))).rowcount:
+            await self.bump_data_version()
+        await self.session.commit()
+        return True
+
+    async def toggle_all(self):
+        """Complete the active tasks, or reopen them all when none is active, and return how many changed"""
+        updated = (await self.session.execute(toggle_all_statement(self.list_id))).rowcount
+        if updated:
+            await self.bump_data_version()
+        await self.session.commit()
+        return updated
+
+    async def get_completed_tasks(self):
+        """Get all completed tasks"""
+        return (await self.session.execute(select(*TASK_COLUMNS).where(self.in_list, SQLAlchemyTask.completed))).all()
+
+    async def get_not_completed_tasks(self):
+        """Get all not completed tasks"""
+        return (
+            await self.session.execute(select(*TASK_COLUMNS).where(self.in_list, not_(SQLAlchemyTask.completed)))
+        ).all()
+
+    async def delete_task(self, task_id: Any):
+        """Delete a task"""
+        statement = delete(SQLAlchemyTask).where(self.in_list, SQLAlchemyTask.id == task_id)
+        if (await self.session.execute(statement)).rowcount:
+            await self.bump_data_version()
+        await self.session.commit()
+        return True
+
+    async def delete_completed_tasks(self):
+        """Delete all completed tasks and return how many were deleted"""
+        deleted = (
+            await self.session.execute(delete(SQLAlchemyTask).where(self.in_list, SQLAlchemyTask.completed))
+        ).rowcount
+        if deleted:
+            await self.bump_data_version()
+        await self.session.commit()
+        return deleted
+
+    async def bulk_add_tasks(self, tasks: Iterable[dict], chunk_size: int = BULK_CHUNK_SIZE):
+        """Insert tasks column values in chunked transactions and return how many were added"""
+        added = 0
+        for chunk in iter_chunks(tasks, chunk_size):
+            await self.session.execute(insert(SQLAlchemyTask), [{**task, 'list_id': self.list_id} for task in chunk])
+            await self.bump_data_version()
+            await self.session.commit()
+            added += len(chunk)
+        return added
+
+    async def get_task_list(self, completed: Optional[bool] = None, limit: Optional[int] = None):
+        """Get the first tasks matching a completion filter along with the overall total and completed counts"""
+        rows = (await self.session.execute(task_list_statement(self.list_id, completed=completed, limit=limit))).all()
+        return split_task_list_rows(rows)
+
+    async def get_tasks_page(
+        self, completed: Optional[bool] = None, after_id: Optional[int] = None, limit: Optional[int] = None
+    ):
+        """Get the tasks matching a completion filter that follow the ``after_id`` cursor"""
+        statement = tasks_page_statement(self.list_id, completed=completed, after_id=after_id, limit=limit)
+        return (await self.session.execute(statement)).all()
+
+    async def get_task_counts(self):
+        """Get the overall total and completed counts"""
+        return tuple((await self.session.execute(task_counts_statement(self.list_id))).one())
+
+    async def iter_tasks(self, completed: Optional[bool] = None):
+        """Iterate over the tasks matching a completion filter without loading them all at once"""
+        statement = tasks_page_statement(self.list_id, completed=completed).execution_options(yield_per=YIELD_PER)
+        async for task in await self.session.stream(statement):
+            yield task
+
+    async def search_tasks(
+        self, query: str, completed: Optional[bool] = None, limit: Optional[int] = None, offset: int = 0
+    ):
+        """Get the tasks whose description matches every word of a query, best ranked first"""
+        terms = SEARCH_TERM_PATTERN.findall(query)
+        if not terms:
+            return []
+        dialect_name = self.session.get_bind().dialect.name
+        statement = search_tasks_statement(
+            dialect_name, self.list_id, terms, completed=completed, limit=limit, offset=offset
+        )
+        return (await self.session.execute(statement)).all()
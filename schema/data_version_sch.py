@@ -0,0 +1,17 @@
+"""Database data version schemas"""
+
+from db.sqlalchemy_database import Base
+from sqlalchemy import Column
+from sqlalchemy import DateTime
+from sqlalchemy import Integer
+from sqlalchemy import String
+
+
+class SQLAlchemyDataVersion(Base):
+    """Relational data versions database schema, bumped on every write to the versioned data"""
+
+    __tablename__ = 'data_versions'
+
+    name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True))
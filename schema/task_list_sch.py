@@ -0,0 +1,21 @@
+"""Database task list schemas"""
+
+from db.sqlalchemy_database import Base
+from schema.user_sch import SQLAlchemyUser
+from sqlalchemy import Column
+from sqlalchemy import ForeignKey
+from sqlalchemy import Index
+from sqlalchemy import Integer
+from sqlalchemy import String
+
+
+class SQLAlchemyTaskList(Base):
+    """Relational task lists database schema, each list being owned by a user"""
+
+    __tablename__ = 'task_lists'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey(SQLAlchemyUser.id, ondelete='CASCADE'), nullable=False)
+    name = Column(String, nullable=False)
+
+    __table_args__ = (Index('ix_task_lists_user_id', user_id),)
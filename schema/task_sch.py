@@ -1,17 +1,80 @@
 """Database Task schemas"""
 
 from db.sqlalchemy_database import Base
+from schema.task_list_sch import SQLAlchemyTaskList
 from sqlalchemy import Boolean
 from sqlalchemy import Column
+from sqlalchemy import DDL
+from sqlalchemy import event
+from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import String
+from sqlalchemy import true
+
+
+TEXT_SEARCH_CONFIGURATION = 'english'
+"""PostgreSQL text search configuration of the task descriptions"""
+
+TASKS_SEARCH_VECTOR = 'search_vector'
+"""PostgreSQL stored ``tsvector`` column of the task descriptions, left unmapped so task loads never fetch it"""
+
+TASKS_SEARCH_VECTOR_DDL = (
+    f'ALTER TABLE tasks ADD COLUMN {TASKS_SEARCH_VECTOR} tsvector GENERATED ALWAYS AS '
+    f"(to_tsvector('{TEXT_SEARCH_CONFIGURATION}', coalesce(description, ''))) STORED",
+    f'CREATE INDEX ix_tasks_{TASKS_SEARCH_VECTOR} ON tasks USING gin ({TASKS_SEARCH_VECTOR})',
+)
+"""Statements adding the PostgreSQL search column of the tasks and its index"""
+
+TASKS_FTS_TABLE = 'tasks_fts'
+"""SQLite FTS5 table indexing the task descriptions"""
+
+TASKS_FTS_DDL = (
+    f"CREATE VIRTUAL TABLE {TASKS_FTS_TABLE} USING fts5("
+    "description, content='tasks', content_rowid='id', tokenize='porter unicode61', prefix='2 3')",
+    f"CREATE TRIGGER {TASKS_FTS_TABLE}_insert AFTER INSERT ON tasks BEGIN "
+    f"INSERT INTO {TASKS_FTS_TABLE}(rowid, description) VALUES (new.id, new.description); END",
+    f"CREATE TRIGGER {TASKS_FTS_TABLE}_delete AFTER DELETE ON tasks BEGIN "
+    f"INSERT INTO {TASKS_FTS_TABLE}({TASKS_FTS_TABLE}, rowid, description) "
+    "VALUES ('delete', old.id, old.description); END",
+    f"CREATE TRIGGER {TASKS_FTS_TABLE}_update AFTER UPDATE OF description ON tasks BEGIN "
+    f"INSERT INTO {TASKS_FTS_TABLE}({TASKS_FTS_TABLE}, rowid, description) "
+    "VALUES ('delete', old.id, old.description); "
+    f"INSERT INTO {TASKS_FTS_TABLE}(rowid, description) VALUES (new.id, new.description); END",
+)
+"""Statements creating the SQLite FTS5 table and the triggers keeping it in sync with the tasks"""
 
 
 class SQLAlchemyTask(Base):
-    """Relational Tasks database schema"""
+    """Relational Tasks database schema, every task belonging to a list
+
+    The indexes all lead on the list, so the queries of a list only ever read its own tasks.
+    """
 
     __tablename__ = 'tasks'
 
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    description = Column(String, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    list_id = Column(Integer, ForeignKey(SQLAlchemyTaskList.id, ondelete='CASCADE'), nullable=False)
+    description = Column(String)
     completed = Column(Boolean, default=False)
+
+    __table_args__ = (
+        Index('ix_tasks_list_id_id', list_id, id),
+        Index('ix_tasks_list_id_completed_id', list_id, completed, id),
+        Index(
+            'ix_tasks_list_id_completed',
+            list_id,
+            id,
+            sqlite_where=completed == true(),
+            postgresql_where=completed == true(),
+        ).ddl_if(dialect=('sqlite', 'postgresql')),
+    )
+
+
+for statement in TASKS_FTS_DDL:
+    event.listen(SQLAlchemyTask.__table__, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+for statement in TASKS_SEARCH_VECTOR_DDL:
+    event.listen(SQLAlchemyTask.__table__, 'after_create', DDL(statement).execute_if(dialect='postgresql'))
+event.listen(
+    SQLAlchemyTask.__table__, 'after_drop', DDL(f'DROP TABLE IF EXISTS {TASKS_FTS_TABLE}').execute_if(dialect='sqlite')
+)
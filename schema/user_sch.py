@@ -0,0 +1,15 @@
+"""Database user schemas"""
+
+from db.sqlalchemy_database import Base
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import String
+
+
+class SQLAlchemyUser(Base):
+    """Relational users database schema"""
+
+    __tablename__ = 'users'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String, nullable=False, unique=True)
@@ -0,0 +1,73 @@
+"""Service dependencies module"""
+import importlib
+from functools import lru_cache
+from typing import Any
+from typing import get_type_hints
+from typing import Protocol
+
+from fastapi import Depends
+from fastapi import Request
+from fastapi_injector import get_injector_instance
+from injector import Injector
+from starlette.concurrency import run_in_threadpool
+
+
+class AwaitableService(Protocol):
+    """Service awaited by the routes, whichever flavour serves it"""
+
+    async def execute(self, *args, **kwargs) -> Any:
+        """Service execution operations"""
+
+
+class ThreadpoolService:
+    """Awaitable facade running a synchronous service on the threadpool"""
+
+    def __init__(self, service: Any) -> None:
+        self.service = service
+
+    async def execute(self, *args, **kwargs):
+        """Service execution operations"""
+        return await run_in_threadpool(self.service.execute, *args, **kwargs)
+
+
+@lru_cache
+def load_service_class(service_path: str) -> type:
+    """Import a service class from its ``module.Class`` path"""
+    module_name, _, class_name = service_path.rpartition('.')
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+@lru_cache
+def service_interfaces(service_class: type) -> dict:
+    """Get the injected interface of each service constructor parameter"""
+    interfaces = get_type_hints(service_class.__init__)
+    interfaces.pop('return', None)
+    return interfaces
+
+
+def build_service(service_class: type, injector: Injector) -> Any:
+    """Instantiate a service with its dependencies resolved by the injector"""
+    return service_class(
+        **{name: injector.get(interface) for name, interface in service_interfaces(service_class).items()}
+    )
+
+
+def use_service(service_path: str) -> Any:
+    """Depend on a service in the flavour matching the settings of the app
+
+    The service is given as a ``module.Class`` path and its module is only imported by the
+    first request needing it. The asyncio flavour is the ``Async`` prefixed class of that module.
+    Both paths are kept as the ``service_paths`` of the dependency, so they can be checked
+    without serving a request.
+    """
+    module_name, _, class_name = service_path.rpartition('.')
+    async_service_path = f'{module_name}.Async{class_name}'
+
+    async def resolve_service(request: Request) -> AwaitableService:
+        injector = get_injector_instance(request.app)
+        if request.app.state.settings.use_async:
+            return build_service(load_service_class(async_service_path), injector)
+        return ThreadpoolService(build_service(load_service_class(service_path), injector))
+
+    resolve_service.service_paths = (service_path, async_service_path)
+    return Depends(resolve_service)
@@ -2,6 +2,7 @@
 from fastapi_injector import Injected
 from models.task_mdl import Task
 from orm.mappings import ORMBase
+from repositories.tasks_repo import AsyncBaseTasksRepository
 from repositories.tasks_repo import BaseTasksRepository
 
 
@@ -18,3 +19,20 @@ class AddTaskService:
         """Service execution operations"""
         schema_db_task = self.orm.to_schema_db_task(task=task)
         return self.task_repository.add_task(task=schema_db_task)
+
+
+class AsyncAddTaskService:
+    """Asyncio add a task service"""
+
+    def __init__(
+        self,
+        task_repository: AsyncBaseTasksRepository = Injected(AsyncBaseTasksRepository),
+        orm: ORMBase = Injected(ORMBase),
+    ) -> None:
+        self.task_repository = task_repository
+        self.orm = orm
+
+    async def execute(self, task: Task):
+        """Service execution operations"""
+        schema_db_task = self.orm.to_schema_db_task(task=task)
+        return await self.task_repository.add_task(task=schema_db_task)
@@ -0,0 +1,40 @@
+"""Bulk task addition service module"""
+from typing import Iterable
+
+from fastapi_injector import Injected
+from models.task_mdl import Task
+from orm.mappings import ORMBase
+from repositories.tasks_repo import AsyncBaseTasksRepository
+from repositories.tasks_repo import BaseTasksRepository
+
+
+class BulkAddTasksService:
+    """Add many tasks at once service"""
+
+    def __init__(
+        self, task_repository: BaseTasksRepository = Injected(BaseTasksRepository), orm: ORMBase = Injected(ORMBase)
+    ) -> None:
+        self.task_repository = task_repository
+        self.orm = orm
+
+    def execute(self, tasks: Iterable[Task]):
+        """Service execution operations"""
+        values = (self.orm.to_schema_db_values(task=task) for task in tasks)
+        return self.task_repository.bulk_add_tasks(tasks=values)
+
+
+class AsyncBulkAddTasksService:
+    """Asyncio add many tasks at once service"""
+
+    def __init__(
+        self,
+        task_repository: AsyncBaseTasksRepository = Injected(AsyncBaseTasksRepository),
+        orm: ORMBase = Injected(ORMBase),
+    ) -> None:
+        self.task_repository = task_repository
+        self.orm = orm
+
+    async def execute(self, tasks: Iterable[Task]):
+        """Service execution operations"""
+        values = (self.orm.to_schema_db_values(task=task) for task in tasks)
+        return await self.task_repository.bulk_add_tasks(tasks=values)
@@ -1,26 +1,26 @@
 """Deletion ofcompleted tasks service"""
 from fastapi_injector import Injected
-from orm.mappings import ORMBase
+from repositories.tasks_repo import AsyncBaseTasksRepository
 from repositories.tasks_repo import BaseTasksRepository
 
 
 class DeleteCompletedTasksService:
     """Delete completed tasks service"""
 
-    def __init__(
-        self, task_repository: BaseTasksRepository = Injected(BaseTasksRepository), orm: ORMBase = Injected(ORMBase)
-    ) -> None:
+    def __init__(self, task_repository: BaseTasksRepository = Injected(BaseTasksRepository)) -> None:
         self.task_repository = task_repository
-        self.orm = orm
 
     def execute(self):
         """Service execution operations"""
-        schema_tasks = self.task_repository.get_tasks()
-        tasks = [
-            self.orm.to_task_model(schema_task=schema_task)
-            for schema_task in schema_tasks
-            if schema_task.completed is True
-        ]
-        for task in tasks:
-            self.task_repository.delete_task(task_id=task.id)
-        return True
+        return self.task_repository.delete_completed_tasks()
+
+
+class AsyncDeleteCompletedTasksService:
+    """Asyncio delete completed tasks service"""
+
+    def __init__(self, task_repository: AsyncBaseTasksRepository = Injected(AsyncBaseTasksRepository)) -> None:
+        self.task_repository = task_repository
+
+    async def execute(self):
+        """Service execution operations"""
+        return await self.task_repository.delete_completed_tasks()
@@ -2,6 +2,7 @@
 from typing import Any
 
 from fastapi_injector import Injected
+from repositories.tasks_repo import AsyncBaseTasksRepository
 from repositories.tasks_repo import BaseTasksRepository
 
 
@@ -14,3 +15,14 @@ class DeleteTaskService:
     def execute(self, task_id: Any):
         """Service execution operations"""
         return self.task_repository.delete_task(task_id=task_id)
+
+
+class AsyncDeleteTaskService:
+    """Asyncio service for deleting task"""
+
+    def __init__(self, task_repository: AsyncBaseTasksRepository = Injected(AsyncBaseTasksRepository)) -> None:
+        self.task_repository = task_repository
+
+    async def execute(self, task_id: Any):
+        """Service execution operations"""
+        return await self.task_repository.delete_task(task_id=task_id)
@@ -0,0 +1,29 @@
+"""Obtention of the tasks data version service"""
+from fastapi_injector import Injected
+from models.data_version_mdl import DataVersion
+from repositories.tasks_repo import AsyncBaseTasksRepository
+from repositories.tasks_repo import BaseTasksRepository
+
+
+class GetDataVersionService:
+    """Get the tasks data version service"""
+
+    def __init__(self, task_repository: BaseTasksRepository = Injected(BaseTasksRepository)) -> None:
+        self.task_repository = task_repository
+
+    def execute(self):
+        """Service execution operations"""
+        version, updated_at = self.task_repository.get_data_version()
+        return DataVersion(version=version, updated_at=updated_at)
+
+
+class AsyncGetDataVersionService:
+    """Asyncio get the tasks data version service"""
+
+    def __init__(self, task_repository: AsyncBaseTasksRepository = Injected(AsyncBaseTasksRepository)) -> None:
+        self.task_repository = task_repository
+
+    async def execute(self):
+        """Service execution operations"""
+        version, updated_at = await self.task_repository.get_data_version()
+        return DataVersion(version=version, updated_at=updated_at)
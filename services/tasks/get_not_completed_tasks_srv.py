@@ -2,6 +2,7 @@
 
 from fastapi_injector import Injected
 from orm.mappings import ORMBase
+from repositories.tasks_repo import AsyncBaseTasksRepository
 from repositories.tasks_repo import BaseTasksRepository
 
 
@@ -17,5 +18,23 @@ class GetNotCompletedTasksService:
     def execute(self):
         """Service execution operations"""
         schema_tasks = self.task_repository.get_not_completed_tasks()
-        tasks = [self.orm.to_task_model(schema_task=schema_task) for schema_task in schema_tasks]
+        tasks = [self.orm.to_task_record(schema_task=schema_task) for schema_task in schema_tasks]
+        return tasks
+
+
+class AsyncGetNotCompletedTasksService:
+    """Asyncio get not completed tasks service"""
+
+    def __init__(
+        self,
+        task_repository: AsyncBaseTasksRepository = Injected(AsyncBaseTasksRepository),
+        orm: ORMBase = Injected(ORMBase),
+    ) -> None:
+        self.task_repository = task_repository
+        self.orm = orm
+
+    async def execute(self):
+        """Service execution operations"""
+        schema_tasks = await self.task_repository.get_not_completed_tasks()
+        tasks = [self.orm.to_task_record(schema_task=schema_task) for schema_task in schema_tasks]
         return tasks
@@ -0,0 +1,29 @@
+"""Obtention of the task counts service"""
+from fastapi_injector import Injected
+from models.task_list_mdl import TaskCounts
+from repositories.tasks_repo import AsyncBaseTasksRepository
+from repositories.tasks_repo import BaseTasksRepository
+
+
+class GetTaskCountsService:
+    """Get the total and completed task counts service"""
+
+    def __init__(self, task_repository: BaseTasksRepository = Injected(BaseTasksRepository)) -> None:
+        self.task_repository = task_repository
+
+    def execute(self):
+        """Service execution operations"""
+        total, completed = self.task_repository.get_task_counts()
+        return TaskCounts(total=total, completed=completed)
+
+
+class AsyncGetTaskCountsService:
+    """Asyncio get the total and completed task counts service"""
+
+    def __init__(self, task_repository: AsyncBaseTasksRepository = Injected(AsyncBaseTasksRepository)) -> None:
+        self.task_repository = task_repository
+
+    async def execute(self):
+        """Service execution operations"""
+        total, completed = await self.task_repository.get_task_counts()
+        return TaskCounts(total=total, completed=completed)
@@ -0,0 +1,48 @@
+"""Obtention of the task list view service"""
+from typing import Optional
+
+from fastapi_injector import Injected
+from models.task_list_mdl import TaskList
+from orm.mappings import ORMBase
+from repositories.tasks_repo import AsyncBaseTasksRepository
+from repositories.tasks_repo import BaseTasksRepository
+
+
+class GetTaskListService:
+    """Get the filtered tasks along with the task counts service"""
+
+    def __init__(
+        self, task_repository: BaseTasksRepository = Injected(BaseTasksRepository), orm: ORMBase = Injected(ORMBase)
+    ) -> None:
+        self.task_repository = task_repository
+        self.orm = orm
+
+    def execute(self, completed: Optional[bool] = None, limit: Optional[int] = None):
+        """Service execution operations"""
+        look_ahead = None if limit is None else limit + 1
+        schema_tasks, total, completed_count = self.task_repository.get_task_list(completed=completed, limit=look_ahead)
+        tasks = [self.orm.to_task_record(schema_task=schema_task) for schema_task in schema_tasks[:limit]]
+        next_cursor = tasks[-1].id if len(schema_tasks) > len(tasks) else None
+        return TaskList.model_construct(tasks=tasks, next_cursor=next_cursor, total=total, completed=completed_count)
+
+
+class AsyncGetTaskListService:
+    """Asyncio get the filtered tasks along with the task counts service"""
+
+    def __init__(
+        self,
+        task_repository: AsyncBaseTasksRepository = Injected(AsyncBaseTasksRepository),
+        orm: ORMBase = Injected(ORMBase),
+    ) -> None:
+        self.task_repository = task_repository
+        self.orm = orm
+
+    async def execute(self, completed: Optional[bool] = None, limit: Optional[int] = None):
+        """Service execution operations"""
+        look_ahead = None if limit is None else limit + 1
+        schema_tasks, total, completed_count = await self.task_repository.get_task_list(
+            completed=completed, limit=look_ahead
+        )
+        tasks = [self.orm.to_task_record(schema_task=schema_task) for schema_task in schema_tasks[:limit]]
+        next_cursor = tasks[-1].id if len(schema_tasks) > len(tasks) else None
+        return TaskList.model_construct(tasks=tasks, next_cursor=next_cursor, total=total, completed=completed_count)
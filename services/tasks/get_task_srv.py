@@ -3,6 +3,7 @@ from typing import Any
 
 from fastapi_injector import Injected
 from orm.mappings import ORMBase
+from repositories.tasks_repo import AsyncBaseTasksRepository
 from repositories.tasks_repo import BaseTasksRepository
 
 
@@ -18,5 +19,25 @@ class GetTaskService:
     def execute(self, task_id: Any):
         """Service execution operations"""
         schema_task = self.task_repository.get_task(task_id=task_id)
-        task = self.orm.to_task_model(schema_task=schema_task)
-        return task
+        if schema_task is None:
+            return None
+        return self.orm.to_task_record(schema_task=schema_task)
+
+
+class AsyncGetTaskService:
+    """Asyncio service for getting a task"""
+
+    def __init__(
+        self,
+        task_repository: AsyncBaseTasksRepository = Injected(AsyncBaseTasksRepository),
+        orm: ORMBase = Injected(ORMBase),
+    ) -> None:
+        self.task_repository = task_repository
+        self.orm = orm
+
+    async def execute(self, task_id: Any):
+        """Service execution operations"""
+        schema_task = await self.task_repository.get_task(task_id=task_id)
+        if schema_task is None:
+            return None
+        return self.orm.to_task_record(schema_task=schema_task)
@@ -0,0 +1,46 @@
+"""Obtention of a page of tasks service"""
+from typing import Optional
+
+from fastapi_injector import Injected
+from models.task_list_mdl import TaskPage
+from orm.mappings import ORMBase
+from repositories.tasks_repo import AsyncBaseTasksRepository
+from repositories.tasks_repo import BaseTasksRepository
+
+
+class GetTasksPageService:
+    """Get the page of tasks following a cursor service"""
+
+    def __init__(
+        self, task_repository: BaseTasksRepository = Injected(BaseTasksRepository), orm: ORMBase = Injected(ORMBase)
+    ) -> None:
+        self.task_repository = task_repository
+        self.orm = orm
+
+    def execute(self, limit: int, completed: Optional[bool] = None, after_id: Optional[int] = None):
+        """Service execution operations"""
+        schema_tasks = self.task_repository.get_tasks_page(completed=completed, after_id=after_id, limit=limit + 1)
+        tasks = [self.orm.to_task_record(schema_task=schema_task) for schema_task in schema_tasks[:limit]]
+        next_cursor = tasks[-1].id if len(schema_tasks) > limit else None
+        return TaskPage.model_construct(tasks=tasks, next_cursor=next_cursor)
+
+
+class AsyncGetTasksPageService:
+    """Asyncio get the page of tasks following a cursor service"""
+
+    def __init__(
+        self,
+        task_repository: AsyncBaseTasksRepository = Injected(AsyncBaseTasksRepository),
+        orm: ORMBase = Injected(ORMBase),
+    ) -> None:
+        self.task_repository = task_repository
+        self.orm = orm
+
+    async def execute(self, limit: int, completed: Optional[bool] = None, after_id: Optional[int] = None):
+        """Service execution operations"""
+        schema_tasks = await self.task_repository.get_tasks_page(
+            completed=completed, after_id=after_id, limit=limit + 1
+        )
+        tasks = [self.orm.to_task_record(schema_task=schema_task) for schema_task in schema_tasks[:limit]]
+        next_cursor = tasks[-1].id if len(schema_tasks) > limit else None
+        return TaskPage.model_construct(tasks=tasks, next_cursor=next_cursor)
@@ -1,6 +1,7 @@
 """Obtention of all tasks service"""
 from fastapi_injector import Injected
 from orm.mappings import ORMBase
+from repositories.tasks_repo import AsyncBaseTasksRepository
 from repositories.tasks_repo import BaseTasksRepository
 
 
@@ -16,5 +17,23 @@ class GetTasksService:
     def execute(self):
         """Service execution operations"""
         schema_tasks = self.task_repository.get_tasks()
-        tasks = [self.orm.to_task_model(schema_task=schema_task) for schema_task in schema_tasks]
+        tasks = [self.orm.to_task_record(schema_task=schema_task) for schema_task in schema_tasks]
+        return tasks
+
+
+class AsyncGetTasksService:
+    """Asyncio get tasks service"""
+
+    def __init__(
+        self,
+        task_repository: AsyncBaseTasksRepository = Injected(AsyncBaseTasksRepository),
+        orm: ORMBase = Injected(ORMBase),
+    ) -> None:
+        self.task_repository = task_repository
+        self.orm = orm
+
+    async def execute(self):
+        """Service execution operations"""
+        schema_tasks = await self.task_repository.get_tasks()
+        tasks = [self.orm.to_task_record(schema_task=schema_task) for schema_task in schema_tasks]
         return tasks
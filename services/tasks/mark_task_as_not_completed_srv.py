@@ -2,15 +2,42 @@
 from typing import Any
 
 from fastapi_injector import Injected
+from orm.mappings import ORMBase
+from repositories.tasks_repo import AsyncBaseTasksRepository
 from repositories.tasks_repo import BaseTasksRepository
 
 
 class MarkTaskAsNotCompletedService:
     """Service for mark a task as not completed"""
 
-    def __init__(self, task_repository: BaseTasksRepository = Injected(BaseTasksRepository)) -> None:
+    def __init__(
+        self, task_repository: BaseTasksRepository = Injected(BaseTasksRepository), orm: ORMBase = Injected(ORMBase)
+    ) -> None:
         self.task_repository = task_repository
+        self.orm = orm
 
     def execute(self, task_id: Any):
         """Service execution operations"""
-        return self.task_repository.mark_task_as_not_completed(task_id=task_id)
+        schema_task = self.task_repository.mark_task_as_not_completed(task_id=task_id)
+        if schema_task is None:
+            return None
+        return self.orm.to_task_model(schema_task=schema_task)
+
+
+class AsyncMarkTaskAsNotCompletedService:
+    """Asyncio service for mark a task as not completed"""
+
+    def __init__(
+        self,
+        task_repository: AsyncBaseTasksRepository = Injected(AsyncBaseTasksRepository),
+        orm: ORMBase = Injected(ORMBase),
+    ) -> None:
+        self.task_repository = task_repository
+        self.orm = orm
+
+    async def execute(self, task_id: Any):
+        """Service execution operations"""
+        schema_task = await self.task_repository.mark_task_as_not_completed(task_id=task_id)
+        if schema_task is None:
+            return None
+        return self.orm.to_task_model(schema_task=schema_task)
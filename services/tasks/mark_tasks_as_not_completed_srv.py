@@ -1,5 +1,6 @@
 """All tasks completion reversal service"""
 from fastapi_injector import Injected
+from repositories.tasks_repo import AsyncBaseTasksRepository
 from repositories.tasks_repo import BaseTasksRepository
 
 
@@ -12,3 +13,14 @@ class MarkTasksAsNotCompletedService:
     def execute(self):
         """Service execution operations"""
         return self.task_repository.mark_tasks_as_not_completed()
+
+
+class AsyncMarkTasksAsNotCompletedService:
+    """Asyncio service for mark all tasks as not completed"""
+
+    def __init__(self, task_repository: AsyncBaseTasksRepository = Injected(AsyncBaseTasksRepository)) -> None:
+        self.task_repository = task_repository
+
+    async def execute(self):
+        """Service execution operations"""
+        return await self.task_repository.mark_tasks_as_not_completed()
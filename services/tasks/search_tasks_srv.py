@@ -0,0 +1,48 @@
+"""Task search service"""
+from typing import Optional
+
+from fastapi_injector import Injected
+from models.task_list_mdl import TaskPage
+from orm.mappings import ORMBase
+from repositories.tasks_repo import AsyncBaseTasksRepository
+from repositories.tasks_repo import BaseTasksRepository
+
+
+class SearchTasksService:
+    """Search tasks by description service, paginated by offset"""
+
+    def __init__(
+        self, task_repository: BaseTasksRepository = Injected(BaseTasksRepository), orm: ORMBase = Injected(ORMBase)
+    ) -> None:
+        self.task_repository = task_repository
+        self.orm = orm
+
+    def execute(self, query: str, limit: int, completed: Optional[bool] = None, offset: int = 0):
+        """Service execution operations"""
+        schema_tasks = self.task_repository.search_tasks(
+            query=query, completed=completed, limit=limit + 1, offset=offset
+        )
+        tasks = [self.orm.to_task_record(schema_task=schema_task) for schema_task in schema_tasks[:limit]]
+        next_cursor = offset + limit if len(schema_tasks) > limit else None
+        return TaskPage.model_construct(tasks=tasks, next_cursor=next_cursor)
+
+
+class AsyncSearchTasksService:
+    """Asyncio search tasks by description service, paginated by offset"""
+
+    def __init__(
+        self,
+        task_repository: AsyncBaseTasksRepository = Injected(AsyncBaseTasksRepository),
+        orm: ORMBase = Injected(ORMBase),
+    ) -> None:
+        self.task_repository = task_repository
+        self.orm = orm
+
+    async def execute(self, query: str, limit: int, completed: Optional[bool] = None, offset: int = 0):
+        """Service execution operations"""
+        schema_tasks = await self.task_repository.search_tasks(
+            query=query, completed=completed, limit=limit + 1, offset=offset
+        )
+        tasks = [self.orm.to_task_record(schema_task=schema_task) for schema_task in schema_tasks[:limit]]
+        next_cursor = offset + limit if len(schema_tasks) > limit else None
+        return TaskPage.model_construct(tasks=tasks, next_cursor=next_cursor)
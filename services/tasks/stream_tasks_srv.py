@@ -0,0 +1,39 @@
+"""Streaming of tasks service"""
+from typing import Optional
+
+from fastapi_injector import Injected
+from orm.mappings import ORMBase
+from repositories.tasks_repo import AsyncBaseTasksRepository
+from repositories.tasks_repo import BaseTasksRepository
+
+
+class StreamTasksService:
+    """Lazily get the tasks matching a completion filter service"""
+
+    def __init__(
+        self, task_repository: BaseTasksRepository = Injected(BaseTasksRepository), orm: ORMBase = Injected(ORMBase)
+    ) -> None:
+        self.task_repository = task_repository
+        self.orm = orm
+
+    def execute(self, completed: Optional[bool] = None):
+        """Service execution operations"""
+        schema_tasks = self.task_repository.iter_tasks(completed=completed)
+        return (self.orm.to_task_record(schema_task=schema_task) for schema_task in schema_tasks)
+
+
+class AsyncStreamTasksService:
+    """Asyncio lazily get the tasks matching a completion filter service"""
+
+    def __init__(
+        self,
+        task_repository: AsyncBaseTasksRepository = Injected(AsyncBaseTasksRepository),
+        orm: ORMBase = Injected(ORMBase),
+    ) -> None:
+        self.task_repository = task_repository
+        self.orm = orm
+
+    async def execute(self, completed: Optional[bool] = None):
+        """Service execution operations"""
+        schema_tasks = self.task_repository.iter_tasks(completed=completed)
+        return (self.orm.to_task_record(schema_task=schema_task) async for schema_task in schema_tasks)
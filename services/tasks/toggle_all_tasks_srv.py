@@ -0,0 +1,26 @@
+"""All tasks completion toggle service"""
+from fastapi_injector import Injected
+from repositories.tasks_repo import AsyncBaseTasksRepository
+from repositories.tasks_repo import BaseTasksRepository
+
+
+class ToggleAllTasksService:
+    """Service for complete all the active tasks, or reopen them all when none is active"""
+
+    def __init__(self, task_repository: BaseTasksRepository = Injected(BaseTasksRepository)) -> None:
+        self.task_repository = task_repository
+
+    def execute(self):
+        """Service execution operations"""
+        return self.task_repository.toggle_all()
+
+
+class AsyncToggleAllTasksService:
+    """Asyncio service for complete all the active tasks, or reopen them all when none is active"""
+
+    def __init__(self, task_repository: AsyncBaseTasksRepository = Injected(AsyncBaseTasksRepository)) -> None:
+        self.task_repository = task_repository
+
+    async def execute(self):
+        """Service execution operations"""
+        return await self.task_repository.toggle_all()
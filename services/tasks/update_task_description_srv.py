@@ -2,6 +2,7 @@
 from fastapi_injector import Injected
 from models.task_mdl import Task
 from orm.mappings import ORMBase
+from repositories.tasks_repo import AsyncBaseTasksRepository
 from repositories.tasks_repo import BaseTasksRepository
 
 
@@ -17,6 +18,27 @@ class UpdateTaskDescriptionService:
     def execute(self, task: Task):
         """Service execution operations"""
         schema_task = self.orm.to_schema_db_task(task=task)
-        self.task_repository.update_task_description(task=schema_task)
-        schema_task = self.task_repository.get_task(task_id=task.id)
+        schema_task = self.task_repository.update_task_description(task=schema_task)
+        if schema_task is None:
+            return None
+        return self.orm.to_task_model(schema_task=schema_task)
+
+
+class AsyncUpdateTaskDescriptionService:
+    """Asyncio service for updating a task description"""
+
+    def __init__(
+        self,
+        task_repository: AsyncBaseTasksRepository = Injected(AsyncBaseTasksRepository),
+        orm: ORMBase = Injected(ORMBase),
+    ) -> None:
+        self.task_repository = task_repository
+        self.orm = orm
+
+    async def execute(self, task: Task):
+        """Service execution operations"""
+        schema_task = self.orm.to_schema_db_task(task=task)
+        schema_task = await self.task_repository.update_task_description(task=schema_task)
+        if schema_task is None:
+            return None
         return self.orm.to_task_model(schema_task=schema_task)
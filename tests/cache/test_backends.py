@@ -0,0 +1,35 @@
+import time
+
+from cache.backends import LRUCacheBackend
+
+
+def test_lru_cache_backend_evicts_least_recently_used():
+    """Assert LRUCacheBackend eviction behaviour"""
+    # arrange
+    backend = LRUCacheBackend(max_entries=2)
+    backend.set('a', 1)
+    backend.set('b', 2)
+
+    # act
+    backend.get('a')
+    backend.set('c', 3)
+
+    # assert
+    assert backend.get('a') == 1
+    assert backend.get('b') is None
+    assert backend.get('c') == 3
+
+
+def test_lru_cache_backend_expires_entries():
+    """Assert LRUCacheBackend expiration behaviour"""
+    # arrange
+    backend = LRUCacheBackend()
+    backend.set('a', 1, ttl=0.01)
+    backend.set('b', 2)
+
+    # act
+    time.sleep(0.02)
+
+    # assert
+    assert backend.get('a') is None
+    assert backend.get('b') == 2
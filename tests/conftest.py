@@ -1,11 +1,27 @@
 import os
 
 import pytest
+from db.query_count import count_queries
+from db.query_count import time_queries
 from db.sqlalchemy_database import Base
+from schema.task_list_sch import SQLAlchemyTaskList
+from schema.user_sch import SQLAlchemyUser
 from sqlalchemy import create_engine
+from sqlalchemy import insert
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 
+def task_list_statements() -> list:
+    """Build the statements adding the user and the task list with id 1 that the test tasks belong to"""
+    return [
+        insert(SQLAlchemyUser).values(id=1, name='test'),
+        insert(SQLAlchemyTaskList).values(id=1, user_id=1, name='Tasks'),
+    ]
+
+
 @pytest.fixture(scope='function')
 def test_db_session():
     """Creates a test database session"""
@@ -13,6 +29,56 @@ def test_db_session():
 
     engine = create_engine(test_database_url, connect_args={'check_same_thread': False})
     Base.metadata.create_all(bind=engine)
-    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    for statement in task_list_statements():
+        session.execute(statement)
+    session.commit()
+    yield session
 
     os.remove('test_db_app.db')
+
+
+@pytest.fixture(name='query_count')
+def session_query_count(test_db_session):
+    """Count the queries run on the test database session within a block, as in ``with query_count() as counted:``"""
+    time_queries(test_db_session.get_bind())
+    return count_queries
+
+
+@pytest.fixture(scope='function')
+async def test_async_db_session():
+    """Creates a test asyncio database session"""
+    test_database_url = 'sqlite+aiosqlite:///./test_async_db_app.db'
+
+    engine = create_async_engine(test_database_url)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)() as session:
+        for statement in task_list_statements():
+            await session.execute(statement)
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+    os.remove('test_async_db_app.db')
+
+
+@pytest.fixture(scope='function')
+def test_postgres_db_session():
+    """Creates a test PostgreSQL database session on the throwaway database of TODO_TEST_POSTGRES_URL"""
+    test_database_url = os.environ.get('TODO_TEST_POSTGRES_URL')
+    if not test_database_url:
+        pytest.skip('TODO_TEST_POSTGRES_URL is not set')
+
+    try:
+        engine = create_engine(test_database_url)
+        Base.metadata.create_all(bind=engine)
+    except (ImportError, OperationalError) as exc:
+        pytest.skip(f'PostgreSQL is not available: {exc}')
+    with sessionmaker(autocommit=False, autoflush=False, bind=engine)() as session:
+        for statement in task_list_statements():
+            session.execute(statement)
+        session.commit()
+        yield session
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
@@ -0,0 +1,137 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import pytest
+from db.group_commit import GroupCommitWriter
+from schema.task_sch import SQLAlchemyTask
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture(name='session_factory')
+def writer_session_factory(test_db_session):
+    """Session factory of the test database"""
+    return sessionmaker(autoflush=False, bind=test_db_session.get_bind())
+
+
+def add_task(description: str):
+    """Build a write adding a task and returning its id"""
+    return lambda session: session.execute(
+        insert(SQLAlchemyTask).values(list_id=1, description=description).returning(SQLAlchemyTask.id)
+    ).scalar_one()
+
+
+def test_group_commit_writer_commits_concurrent_writes_together(test_db_session, session_factory):
+    """Assert GroupCommitWriter commits the writes submitted within its latency in a single batch"""
+    # arrange
+    writer = GroupCommitWriter(session_factory, max_latency=1, max_batch_size=4)
+    barrier = threading.Barrier(4)
+
+    def submit(number):
+        barrier.wait()
+        return writer.submit(add_task(f'Task number {number}'))
+
+    # act
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        task_ids = list(executor.map(submit, range(4)))
+    writer.stop()
+
+    # assert
+    assert sorted(task_ids) == [1, 2, 3, 4]
+    assert writer.stats() == {'batches': 1, 'writes': 4}
+    assert len(test_db_session.query(SQLAlchemyTask).all()) == 4
+
+
+def test_group_commit_writer_isolates_failing_writes(test_db_session, session_factory):
+    """Assert a failing write of a batch raises to its caller only"""
+    # arrange
+    writer = GroupCommitWriter(session_factory, max_latency=1, max_batch_size=2)
+
+    def fail(session):
+        add_task('Rolled back task')(session)
+        raise ValueError('Invalid write')
+
+    # act
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        failed = executor.submit(writer.submit, fail)
+        added = executor.submit(writer.submit, add_task('Committed task'))
+        with pytest.raises(ValueError):
+            failed.result()
+        added.result()
+    writer.stop()
+
+    # assert
+    assert [task.description for task in test_db_session.query(SQLAlchemyTask).all()] == ['Committed task']
+    assert writer.stats() == {'batches': 1, 'writes': 1}
+
+
+def test_group_commit_writer_rejects_writes_once_stopped(session_factory):
+    """Assert GroupCommitWriter raises instead of waiting forever for a write submitted after it stopped"""
+    # arrange
+    writer = GroupCommitWriter(session_factory)
+    writer.submit(add_task('This is a test task'))
+    writer.stop()
+
+    # act
+    with pytest.raises(RuntimeError):
+        writer.submit(add_task('This is another test task'))
+
+
+def test_group_commit_writer_times_out_waiting_writes(session_factory):
+    """Assert a write waiting longer than the timeout raises to its caller and is never run"""
+    # arrange
+    writer = GroupCommitWriter(session_factory, timeout=0.01)
+    started = threading.Event()
+    release = threading.Event()
+    blocked = ThreadPoolExecutor(max_workers=1).submit(writer.submit, lambda session: started.set() or release.wait())
+    started.wait(timeout=5)
+    ran = []
+
+    # act
+    with pytest.raises(FutureTimeoutError):
+        writer.submit(lambda session: ran.append(1))
+    release.set()
+    blocked.exception()
+    writer.stop()
+
+    # assert
+    assert ran == []
+
+
+class WriterCrash(BaseException):
+    """Error escaping the error handling of the writer thread"""
+
+
+@pytest.mark.filterwarnings('ignore::pytest.PytestUnhandledThreadExceptionWarning')
+def test_group_commit_writer_fails_pending_writes_when_its_thread_ends(session_factory):
+    """Assert the writes left when the writer thread ends raise to their callers, as do the later ones"""
+    # arrange
+    writer = GroupCommitWriter(session_factory, max_latency=1, max_batch_size=2)
+
+    def crash(session):
+        raise WriterCrash()
+
+    # act
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        writes = [executor.submit(writer.submit, crash), executor.submit(writer.submit, add_task('Test task'))]
+        errors = [write.exception(timeout=5) for write in writes]
+
+    # assert
+    assert all(isinstance(error, RuntimeError) for error in errors)
+    with pytest.raises(RuntimeError):
+        writer.submit(add_task('This is another test task'))
+
+
+def test_group_commit_writer_counts_queries_in_the_submitting_context(session_factory, query_count):
+    """Assert the queries of a write count in the query count of the request that submitted it"""
+    # arrange
+    writer = GroupCommitWriter(session_factory)
+
+    # act
+    with query_count() as counted:
+        writer.submit(add_task('This is a test task'))
+    writer.stop()
+
+    # assert
+    assert counted.queries == 1
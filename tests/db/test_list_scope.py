@@ -0,0 +1,58 @@
+from db.list_scope import current_list_id
+from db.list_scope import TaskListMiddleware
+
+
+async def test_task_list_middleware_binds_the_cookie_list():
+    """Assert TaskListMiddleware binds the list of the cookie when the caller owns it, or their first list"""
+    # arrange
+    list_ids = []
+    lookups = []
+
+    async def app(scope, receive, send):
+        list_ids.append(current_list_id())
+
+    async def find_list(list_id, user_name, default_list_id):
+        lookups.append((list_id, user_name, default_list_id))
+        return 7 if list_id in (None, 7) else None
+
+    middleware = TaskListMiddleware(app, default_list_id=1, find_list=find_list)
+
+    # act
+    await middleware({'type': 'http', 'headers': [(b'cookie', b'list_id=7')]}, None, None)
+    await middleware({'type': 'http', 'headers': [(b'cookie', b'list_id=other')]}, None, None)
+    await middleware({'type': 'http', 'headers': [(b'cookie', b'list_id=1')]}, None, None)
+    await middleware({'type': 'http', 'headers': []}, None, None)
+
+    # assert
+    assert list_ids == [7, 1, 1, 1]
+    assert lookups == [(7, None, 1)]
+
+
+async def test_task_list_middleware_rejects_the_lists_of_other_users():
+    """Assert TaskListMiddleware answers 401 without the user header and 404 for a list the user does not own"""
+    # arrange
+    list_ids = []
+    statuses = []
+
+    async def app(scope, receive, send):
+        list_ids.append(current_list_id())
+
+    async def find_list(list_id, user_name, default_list_id):
+        return {(None, 'alice'): 2, (2, 'alice'): 2}.get((list_id, user_name))
+
+    async def send(message):
+        if message['type'] == 'http.response.start':
+            statuses.append(message['status'])
+
+    middleware = TaskListMiddleware(app, default_list_id=1, find_list=find_list, user_header='x-forwarded-user')
+    alice = (b'x-forwarded-user', b'alice')
+
+    # act
+    await middleware({'type': 'http', 'headers': []}, None, send)
+    await middleware({'type': 'http', 'headers': [alice]}, None, send)
+    await middleware({'type': 'http', 'headers': [alice, (b'cookie', b'list_id=2')]}, None, send)
+    await middleware({'type': 'http', 'headers': [alice, (b'cookie', b'list_id=3')]}, None, send)
+
+    # assert
+    assert list_ids == [2, 2]
+    assert statuses == [401, 404]
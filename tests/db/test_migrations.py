@@ -0,0 +1,48 @@
+import schema.data_version_sch  # noqa: F401
+import schema.task_sch  # noqa: F401
+from db.migrations import downgrade_database
+from db.migrations import upgrade_database
+from db.sqlalchemy_database import Base
+from sqlalchemy import create_engine
+from sqlalchemy import inspect
+
+
+def schema_indexes(engine) -> dict:
+    """Get the index definitions of every application table"""
+    inspector = inspect(engine)
+    return {
+        table: sorted((index['name'], tuple(index['column_names'])) for index in inspector.get_indexes(table))
+        for table in Base.metadata.tables
+    }
+
+
+def test_migrations_match_models(tmp_path):
+    """Assert upgrading to the latest migration builds the schema of the models"""
+    # arrange
+    migrated_engine = create_engine(f'sqlite:///{tmp_path}/migrated.db')
+    models_engine = create_engine(f'sqlite:///{tmp_path}/models.db')
+    Base.metadata.create_all(bind=models_engine)
+
+    # act
+    with migrated_engine.connect() as connection:
+        upgrade_database('head', connection=connection)
+        connection.commit()
+
+    # assert
+    assert schema_indexes(migrated_engine) == schema_indexes(models_engine)
+
+
+def test_migrations_downgrade(tmp_path):
+    """Assert every migration can be reverted"""
+    # arrange
+    engine = create_engine(f'sqlite:///{tmp_path}/app.db')
+    with engine.connect() as connection:
+        upgrade_database('head', connection=connection)
+        connection.commit()
+
+        # act
+        downgrade_database('base', connection=connection)
+        connection.commit()
+
+    # assert
+    assert set(inspect(engine).get_table_names()) == {'alembic_version'}
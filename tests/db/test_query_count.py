@@ -0,0 +1,81 @@
+import logging
+
+from db.query_count import count_queries
+from db.query_count import MAX_RECORDED_STATEMENTS
+from db.query_count import QueryCountMiddleware
+from db.query_count import time_queries
+from sqlalchemy import create_engine
+from sqlalchemy import text
+
+
+async def test_query_count_middleware_adds_the_request_queries_header():
+    """Assert QueryCountMiddleware exposes the queries run by a request, and only by it, in a Server-Timing header"""
+    # arrange
+    engine = create_engine('sqlite://')
+    time_queries(engine)
+    messages = []
+
+    async def app(scope, receive, send):
+        with engine.connect() as connection:
+            connection.execute(text('SELECT 1'))
+            connection.execute(text('SELECT 2'))
+        await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+
+    async def send(message):
+        messages.append(message)
+
+    middleware = QueryCountMiddleware(app)
+
+    # act
+    with count_queries() as outer_count:
+        await middleware({'type': 'http', 'method': 'GET', 'path': '/'}, None, send)
+        with engine.connect() as connection:
+            connection.execute(text('SELECT 3'))
+
+    # assert
+    name, value = messages[0]['headers'][0]
+    assert name == b'server-timing'
+    assert value.startswith(b'db;desc="2 queries";dur=')
+    assert outer_count.queries == 1
+
+
+async def test_query_count_middleware_logs_the_request_statements(caplog):
+    """Assert QueryCountMiddleware logs the statements of every request when asked to, the streamed ones included"""
+    # arrange
+    engine = create_engine('sqlite://')
+    time_queries(engine)
+    messages = []
+
+    async def app(scope, receive, send):
+        await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+        with engine.connect() as connection:
+            connection.execute(text('SELECT\n    1'))
+
+    async def send(message):
+        messages.append(message)
+
+    middleware = QueryCountMiddleware(app, header=False, log_statements=True)
+    caplog.set_level(logging.INFO, logger='db.query_count')
+
+    # act
+    await middleware({'type': 'http', 'method': 'GET', 'path': '/tasks'}, None, send)
+
+    # assert
+    assert messages[0]['headers'] == []
+    assert caplog.messages == ['GET /tasks ran 1 queries\nSELECT 1']
+
+
+def test_query_count_records_a_bounded_number_of_statements():
+    """Assert a query count records the statements of its first queries only"""
+    # arrange
+    engine = create_engine('sqlite://')
+    time_queries(engine)
+
+    # act
+    with count_queries() as counted, engine.connect() as connection:
+        for number in range(MAX_RECORDED_STATEMENTS + 2):
+            connection.execute(text(f'SELECT {number}'))
+
+    # assert
+    assert len(counted.statements) == MAX_RECORDED_STATEMENTS
+    assert counted.format_statements().endswith('SELECT 99\n... 2 more')
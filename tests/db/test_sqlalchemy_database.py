@@ -0,0 +1,46 @@
+import pytest
+from config.settings import Settings
+from db.sqlalchemy_database import create_database_engine
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+
+def test_sqlite_engine_applies_pragmas(tmp_path):
+    """Assert create_database_engine tunes every SQLite connection"""
+    # arrange
+    engine = create_database_engine(f'sqlite:///{tmp_path}/app.db', Settings(sqlite_busy_timeout=1234))
+
+    # act
+    with engine.connect() as connection:
+        journal_mode = connection.execute(text('PRAGMA journal_mode')).scalar()
+        synchronous = connection.execute(text('PRAGMA synchronous')).scalar()
+        busy_timeout = connection.execute(text('PRAGMA busy_timeout')).scalar()
+        foreign_keys = connection.execute(text('PRAGMA foreign_keys')).scalar()
+    engine.dispose()
+
+    # assert
+    assert journal_mode == 'wal'
+    assert synchronous == 1
+    assert busy_timeout == 1234
+    assert foreign_keys == 1
+
+
+def test_read_only_sqlite_engine_rejects_writes(tmp_path):
+    """Assert read-only engines can read but not write"""
+    # arrange
+    database_url = f'sqlite:///{tmp_path}/app.db'
+    engine = create_database_engine(database_url, Settings())
+    read_engine = create_database_engine(database_url, Settings(), read_only=True)
+    with engine.begin() as connection:
+        connection.execute(text('CREATE TABLE items (id INTEGER PRIMARY KEY)'))
+
+    # act
+    with read_engine.connect() as connection:
+        count = connection.execute(text('SELECT count(*) FROM items')).scalar()
+        with pytest.raises(OperationalError):
+            connection.execute(text('INSERT INTO items DEFAULT VALUES'))
+    engine.dispose()
+    read_engine.dispose()
+
+    # assert
+    assert count == 0
@@ -0,0 +1,120 @@
+from unittest.mock import Mock
+
+import pytest
+from db.unit_of_work import current_session
+from db.unit_of_work import UnitOfWork
+from db.unit_of_work import UnitOfWorkMiddleware
+from schema.task_sch import SQLAlchemyTask
+from sqlalchemy.exc import OperationalError
+
+
+def test_unit_of_work_is_lazy():
+    """Assert UnitOfWork does not open a session until it is used"""
+    # arrange
+    opened_sessions = []
+    unit_of_work = UnitOfWork(session_factory=lambda: opened_sessions.append(1))
+
+    # act
+    unit_of_work.complete(commit=True)
+
+    # assert
+    assert not opened_sessions
+
+
+def test_unit_of_work_commits_on_success(test_db_session):
+    """Assert UnitOfWork commits the pending work"""
+    # arrange
+    unit_of_work = UnitOfWork(session_factory=lambda: test_db_session)
+    unit_of_work.session.add(SQLAlchemyTask(list_id=1, description='This is a test task'))
+
+    # act
+    unit_of_work.complete(commit=True)
+
+    # assert
+    assert len(test_db_session.query(SQLAlchemyTask).all()) == 1
+
+
+def test_unit_of_work_rolls_back_on_failure(test_db_session):
+    """Assert UnitOfWork discards the pending work"""
+    # arrange
+    unit_of_work = UnitOfWork(session_factory=lambda: test_db_session)
+    unit_of_work.session.add(SQLAlchemyTask(list_id=1, description='This is a test task'))
+
+    # act
+    unit_of_work.complete(commit=False)
+
+    # assert
+    assert len(test_db_session.query(SQLAlchemyTask).all()) == 0
+
+
+async def test_unit_of_work_middleware_uses_read_sessions_for_safe_methods():
+    """Assert UnitOfWorkMiddleware binds read sessions to GET requests only"""
+    # arrange
+    sessions = []
+    read_session = Mock()
+    write_session = Mock()
+
+    async def app(scope, receive, send):
+        sessions.append(current_session())
+
+    middleware = UnitOfWorkMiddleware(
+        app, session_factory=lambda: write_session, read_session_factory=lambda: read_session
+    )
+
+    # act
+    await middleware({'type': 'http', 'method': 'GET'}, None, None)
+    await middleware({'type': 'http', 'method': 'POST'}, None, None)
+
+    # assert
+    assert sessions == [read_session, write_session]
+
+
+async def test_unit_of_work_middleware_commits_before_the_response_starts():
+    """Assert UnitOfWorkMiddleware commits the work of a write request before its response is sent"""
+    # arrange
+    events = []
+    session = Mock()
+    session.commit.side_effect = lambda: events.append('commit')
+
+    async def app(scope, receive, send):
+        current_session().add(SQLAlchemyTask(list_id=1, description='This is a test task'))
+        await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+        await send({'type': 'http.response.body', 'body': b''})
+
+    async def send(message):
+        events.append(message['type'])
+
+    middleware = UnitOfWorkMiddleware(app, session_factory=lambda: session)
+
+    # act
+    await middleware({'type': 'http', 'method': 'POST'}, None, send)
+
+    # assert
+    assert events[:3] == ['commit', 'http.response.start', 'http.response.body']
+    session.close.assert_called_once()
+
+
+async def test_unit_of_work_middleware_does_not_answer_a_failed_commit():
+    """Assert UnitOfWorkMiddleware raises without sending the response when the commit fails"""
+    # arrange
+    sent = []
+    session = Mock()
+    session.commit.side_effect = OperationalError('COMMIT', {}, Exception('database is locked'))
+
+    async def app(scope, receive, send):
+        current_session().add(SQLAlchemyTask(list_id=1, description='This is a test task'))
+        await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+
+    async def send(message):
+        sent.append(message)
+
+    middleware = UnitOfWorkMiddleware(app, session_factory=lambda: session)
+
+    # act
+    with pytest.raises(OperationalError):
+        await middleware({'type': 'http', 'method': 'POST'}, None, send)
+
+    # assert
+    assert sent == []
+    session.rollback.assert_called_once()
+    session.close.assert_called_once()
@@ -0,0 +1,103 @@
+import asyncio
+import threading
+
+from events.brokers import InProcessEventBroker
+from models.task_event_mdl import TaskEvent
+
+
+async def test_in_process_event_broker_delivers_channel_events():
+    """Assert InProcessEventBroker delivers events to the subscribers of their channel only"""
+    # arrange
+    broker = InProcessEventBroker()
+    subscription = broker.subscribe(1)
+    other_subscription = broker.subscribe(2)
+
+    # act
+    broker.publish(1, TaskEvent.task_changed(3))
+    event = await asyncio.wait_for(subscription.get(), timeout=1)
+
+    # assert
+    assert event == TaskEvent(name='task-3', task_id=3)
+    await asyncio.sleep(0)
+    assert not other_subscription._pending
+
+
+async def test_in_process_event_broker_drops_pending_duplicates():
+    """Assert InProcessSubscription keeps a single pending copy of an event"""
+    # arrange
+    broker = InProcessEventBroker()
+    subscription = broker.subscribe(1)
+
+    # act
+    for event in (TaskEvent(), TaskEvent.task_changed(3), TaskEvent()):
+        broker.publish(1, event)
+    events = [await asyncio.wait_for(subscription.get(), timeout=1) for _ in range(2)]
+
+    # assert
+    assert events == [TaskEvent(), TaskEvent.task_changed(3)]
+    assert not subscription._pending
+
+
+async def test_in_process_event_broker_collapses_overflowing_events():
+    """Assert InProcessSubscription replaces too many pending events by a change of the list"""
+    # arrange
+    broker = InProcessEventBroker(max_pending=2)
+    subscription = broker.subscribe(1)
+
+    # act
+    for task_id in range(3):
+        broker.publish(1, TaskEvent.task_changed(task_id))
+    event = await asyncio.wait_for(subscription.get(), timeout=1)
+
+    # assert
+    assert event == TaskEvent()
+    assert not subscription._pending
+
+
+async def test_in_process_event_broker_publishes_from_other_threads():
+    """Assert InProcessEventBroker delivers the events published by another thread"""
+    # arrange
+    broker = InProcessEventBroker()
+    subscription = broker.subscribe(1)
+
+    # act
+    thread = threading.Thread(target=broker.publish, args=(1, TaskEvent()))
+    thread.start()
+    event = await asyncio.wait_for(subscription.get(), timeout=1)
+    thread.join()
+
+    # assert
+    assert event == TaskEvent()
+
+
+async def test_in_process_event_broker_unsubscribes_closed_subscriptions():
+    """Assert closed subscriptions stop receiving events"""
+    # arrange
+    broker = InProcessEventBroker()
+    subscription = broker.subscribe(1)
+
+    # act
+    subscription.close()
+    broker.publish(1, TaskEvent())
+    await asyncio.sleep(0)
+
+    # assert
+    assert broker.subscriber_count(1) == 0
+    assert not subscription._pending
+
+
+async def test_in_process_event_broker_skips_the_origin_subscriber():
+    """Assert InProcessEventBroker does not send an event back to the subscriber that published it"""
+    # arrange
+    broker = InProcessEventBroker()
+    subscription = broker.subscribe(1, subscriber='a')
+    other_subscription = broker.subscribe(1, subscriber='b')
+
+    # act
+    broker.publish(1, TaskEvent.task_changed(3), origin='a')
+    event = await asyncio.wait_for(other_subscription.get(), timeout=1)
+
+    # assert
+    assert event == TaskEvent.task_changed(3)
+    await asyncio.sleep(0)
+    assert not subscription._pending
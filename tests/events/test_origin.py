@@ -0,0 +1,63 @@
+from typing import Hashable
+from typing import Optional
+
+from events.brokers import EventBroker
+from events.origin import CLIENT_HEADER
+from events.origin import ClientIdMiddleware
+from events.origin import current_client_id
+from events.origin import deferred_events
+from events.origin import new_client_id
+from events.origin import publish_event
+from models.task_event_mdl import TaskEvent
+
+
+class RecordingEventBroker(EventBroker):
+    """Broker recording the published events along with their origin"""
+
+    def __init__(self) -> None:
+        self.events = []
+
+    def publish(self, channel: Hashable, event: TaskEvent, origin: Optional[str] = None):
+        self.events.append((channel, event, origin))
+
+    def subscribe(self, channel: Hashable, subscriber: Optional[str] = None):
+        raise NotImplementedError()
+
+
+async def test_client_id_middleware_binds_well_formed_client_ids():
+    """Assert ClientIdMiddleware binds the client id of the request header, ignoring malformed ones"""
+    # arrange
+    client_ids = []
+    client_id = new_client_id()
+
+    async def app(scope, receive, send):
+        client_ids.append(current_client_id())
+
+    middleware = ClientIdMiddleware(app)
+    header = CLIENT_HEADER.lower().encode()
+
+    # act
+    await middleware({'type': 'http', 'headers': [(header, client_id.encode())]}, None, None)
+    await middleware({'type': 'http', 'headers': [(header, b'<script>')]}, None, None)
+    await middleware({'type': 'http', 'headers': []}, None, None)
+
+    # assert
+    assert client_ids == [client_id, None, None]
+
+
+def test_deferred_events_publish_each_event_once():
+    """Assert the events published within deferred_events are published once each when the block ends"""
+    # arrange
+    broker = RecordingEventBroker()
+
+    # act
+    with deferred_events():
+        for _ in range(3):
+            publish_event(broker, 1, TaskEvent())
+        publish_event(broker, 2, TaskEvent())
+        deferred = list(broker.events)
+    publish_event(broker, 1, TaskEvent())
+
+    # assert
+    assert deferred == []
+    assert broker.events == [(1, TaskEvent(), None), (2, TaskEvent(), None), (1, TaskEvent(), None)]
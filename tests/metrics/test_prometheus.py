@@ -0,0 +1,50 @@
+import os
+
+from db.query_count import time_queries
+from metrics.prometheus import Metrics
+from metrics.prometheus import stats_samples
+from sqlalchemy import create_engine
+from sqlalchemy import text
+
+
+def test_observe_query_counts_queries_by_operation():
+    """Assert observe_query times the queries of an engine and counts them in the operation running them"""
+    # arrange
+    metrics = Metrics()
+    engine = create_engine('sqlite://')
+    time_queries(engine, metrics.observe_query)
+    metrics.add_pool(engine, 'write')
+
+    # act
+    with engine.connect() as connection:
+        with metrics.operation('get_tasks') as operation:
+            connection.execute(text('SELECT 1'))
+            connection.execute(text('SELECT 2'))
+        connection.execute(text('SELECT 3'))
+
+    # assert
+    assert operation.queries == 2
+    assert metrics.registry.get_sample_value('db_query_duration_seconds_count', {'operation': 'get_tasks'}) == 2
+    assert metrics.registry.get_sample_value('db_query_duration_seconds_count', {'operation': 'other'}) == 1
+    assert metrics.registry.get_sample_value('db_queries_per_operation_sum', {'operation': 'get_tasks'}) == 2
+    assert metrics.registry.get_sample_value('db_pool_connections', {'pool': 'write', 'state': 'checked_out'}) is None
+
+
+def test_render_exposes_pools_and_stats():
+    """Assert render exposes the state of the instrumented pools and the added stats"""
+    # arrange
+    metrics = Metrics()
+    engine = create_engine('sqlite:///./test_metrics.db')
+    metrics.add_pool(engine, 'write')
+    metrics.add_stats('cache_lookups', 'Cache lookups', ['result'], stats_samples(lambda: {'hits': 3, 'misses': 1}))
+
+    # act
+    with engine.connect():
+        output = metrics.render().decode()
+    engine.dispose()
+    os.remove('test_metrics.db')
+
+    # assert
+    assert 'db_pool_connections{pool="write",state="checked_out"} 1.0' in output
+    assert 'cache_lookups_total{result="hits"} 3.0' in output
+    assert 'cache_lookups_total{result="misses"} 1.0' in output
@@ -0,0 +1,70 @@
+from jinja2 import DictLoader
+from jinja2 import Environment
+from metrics.prometheus import Metrics
+from metrics.timing import MetricsMiddleware
+from metrics.timing import TimedTemplate
+from starlette.routing import Route
+
+
+async def test_metrics_middleware_times_requests_by_route():
+    """Assert MetricsMiddleware labels the requests with the path template of their route and their status"""
+    # arrange
+    metrics = Metrics()
+    route = Route('/tasks/{task_id}', endpoint=lambda request: None)
+
+    async def app(scope, receive, send):
+        if scope['path'] != '/missing':
+            scope['route'] = route
+        await send({'type': 'http.response.start', 'status': 200 if scope['path'] != '/missing' else 404})
+
+    async def send(message):
+        pass
+
+    middleware = MetricsMiddleware(app, metrics=metrics)
+
+    # act
+    for path in ('/tasks/1', '/tasks/2', '/missing'):
+        await middleware({'type': 'http', 'method': 'GET', 'path': path}, None, send)
+
+    # assert
+    assert (
+        metrics.registry.get_sample_value(
+            'http_request_duration_seconds_count', {'method': 'GET', 'route': '/tasks/{task_id}', 'status': '200'}
+        )
+        == 2
+    )
+    assert (
+        metrics.registry.get_sample_value(
+            'http_request_duration_seconds_count', {'method': 'GET', 'route': 'unmatched', 'status': '404'}
+        )
+        == 1
+    )
+
+
+async def test_timed_template_records_render_time_of_the_current_request():
+    """Assert TimedTemplate renders are timed by template within a request, and only there"""
+    # arrange
+    metrics = Metrics()
+    loader = DictLoader({'row.html': '{{ task }}'})
+    environment = Environment(loader=loader)
+    async_environment = Environment(loader=loader, enable_async=True)
+    environment.template_class = async_environment.template_class = TimedTemplate
+    template = environment.get_template('row.html')
+    async_template = async_environment.get_template('row.html')
+    rendered = []
+
+    async def app(scope, receive, send):
+        rendered.append(template.render(task='First task'))
+        rendered.append(''.join(template.generate(task='Second task')))
+        rendered.append(await async_template.render_async(task='Third task'))
+        rendered.append(''.join([chunk async for chunk in async_template.generate_async(task='Fourth task')]))
+
+    middleware = MetricsMiddleware(app, metrics=metrics)
+
+    # act
+    await middleware({'type': 'http', 'method': 'GET', 'path': '/'}, None, None)
+    template.render(task='Outside of a request')
+
+    # assert
+    assert rendered == ['First task', 'Second task', 'Third task', 'Fourth task']
+    assert metrics.registry.get_sample_value('template_render_seconds_count', {'template': 'row.html'}) == 4
@@ -0,0 +1,276 @@
+import pytest
+from models.task_mdl import Task
+from orm.mappings import SQLAlchemyORM
+from repositories.tasks_repo import AsyncSQLAlchemyTaskRepository
+from schema.task_sch import SQLAlchemyTask
+from services.tasks.add_task_srv import AsyncAddTaskService
+from services.tasks.bulk_add_tasks_srv import AsyncBulkAddTasksService
+from services.tasks.delete_completed_tasks_srv import AsyncDeleteCompletedTasksService
+from services.tasks.get_completed_tasks_srv import AsyncGetCompletedTasksService
+from services.tasks.get_data_version_srv import AsyncGetDataVersionService
+from services.tasks.get_not_completed_tasks_srv import AsyncGetNotCompletedTasksService
+from services.tasks.get_task_counts_srv import AsyncGetTaskCountsService
+from services.tasks.get_task_list_srv import AsyncGetTaskListService
+from services.tasks.get_task_srv import AsyncGetTaskService
+from services.tasks.get_tasks_page_srv import AsyncGetTasksPageService
+from services.tasks.get_tasks_srv import AsyncGetTasksService
+from services.tasks.mark_task_as_completed_srv import AsyncMarkTaskAsCompletedService
+from services.tasks.mark_tasks_as_not_completed_srv import AsyncMarkTasksAsNotCompletedService
+from services.tasks.search_tasks_srv import AsyncSearchTasksService
+from services.tasks.stream_tasks_srv import AsyncStreamTasksService
+from services.tasks.toggle_all_tasks_srv import AsyncToggleAllTasksService
+from services.tasks.update_task_description_srv import AsyncUpdateTaskDescriptionService
+from sqlalchemy import select
+
+
+@pytest.fixture(name='repository')
+def task_repository(test_async_db_session):
+    """Asyncio task repository fixture"""
+    return AsyncSQLAlchemyTaskRepository(session=test_async_db_session, list_id=1)
+
+
+@pytest.fixture(name='orm')
+def orm_implementation():
+    """ORM fixture"""
+    return SQLAlchemyORM()
+
+
+async def test_add_task_service(test_async_db_session, repository, orm):
+    """Assert AsyncAddTaskService behaviour"""
+    # arrange
+    add_task_service = AsyncAddTaskService(task_repository=repository, orm=orm)
+    test_task = Task(description='This is a test task')
+
+    # act
+    await add_task_service.execute(task=test_task)
+
+    # assert
+    row_task = (await test_async_db_session.scalars(select(SQLAlchemyTask))).all()[0]
+    assert row_task.description == 'This is a test task'
+
+
+async def test_get_tasks_service(test_async_db_session, repository, orm):
+    """Assert AsyncGetTasksService behaviour"""
+    # arrange
+    test_async_db_session.add(SQLAlchemyTask(list_id=1, description='This is a test task no 1'))
+    test_async_db_session.add(SQLAlchemyTask(list_id=1, description='This is a test task no 2'))
+    await test_async_db_session.commit()
+
+    # act
+    get_tasks_service = AsyncGetTasksService(task_repository=repository, orm=orm)
+    tasks_rows = await get_tasks_service.execute()
+
+    # assert
+    assert len(tasks_rows) == 2
+
+
+async def test_get_task_service(test_async_db_session, repository, orm):
+    """Assert AsyncGetTaskService behaviour"""
+    # arrange
+    test_async_db_session.add(SQLAlchemyTask(list_id=1, description='This is a test task no 1', id=1))
+    test_async_db_session.add(SQLAlchemyTask(list_id=1, description='This is a test task no 2', id=2))
+    await test_async_db_session.commit()
+
+    # act
+    get_task_service = AsyncGetTaskService(task_repository=repository, orm=orm)
+    task_row = await get_task_service.execute(task_id=1)
+
+    # assert
+    assert task_row.description == 'This is a test task no 1'
+    assert task_row.id == 1
+    assert task_row.completed is False
+
+
+async def test_update_task_description_service(test_async_db_session, repository, orm):
+    """Assert AsyncUpdateTaskDescriptionService behaviour"""
+    # arrange
+    test_async_db_session.add(SQLAlchemyTask(list_id=1, description='This is a test task no 3', id=1, completed=True))
+    await test_async_db_session.commit()
+
+    # act
+    update_task_description_service = AsyncUpdateTaskDescriptionService(task_repository=repository, orm=orm)
+    task = await update_task_description_service.execute(task=Task(id=1, description='This is another test task 5'))
+
+    # assert
+    assert task.description == 'This is another test task 5'
+
+
+async def test_update_task_description_service_without_task(test_async_db_session, repository, orm):
+    """Assert AsyncUpdateTaskDescriptionService returns nothing for a missing task"""
+    # arrange
+    update_task_description_service = AsyncUpdateTaskDescriptionService(task_repository=repository, orm=orm)
+
+    # act
+    task = await update_task_description_service.execute(task=Task(id=1, description='This is another test task'))
+
+    # assert
+    assert task is None
+
+
+async def test_get_completed_and_not_completed_tasks_services(test_async_db_session, repository, orm):
+    """Assert AsyncGetCompletedTasksService and AsyncGetNotCompletedTasksService behaviour"""
+    # arrange
+    test_async_db_session.add(
+        SQLAlchemyTask(list_id=1, description='This is another test task 7', id=1, completed=True)
+    )
+    test_async_db_session.add(SQLAlchemyTask(list_id=1, description='This is a test task no 9', id=2, completed=False))
+    await test_async_db_session.commit()
+
+    # act
+    completed_tasks = await AsyncGetCompletedTasksService(task_repository=repository, orm=orm).execute()
+    not_completed_tasks = await AsyncGetNotCompletedTasksService(task_repository=repository, orm=orm).execute()
+
+    # assert
+    assert [task.id for task in completed_tasks] == [1]
+    assert [task.id for task in not_completed_tasks] == [2]
+
+
+async def test_mark_and_delete_tasks_services(test_async_db_session, repository, orm):
+    """Assert AsyncMarkTasksAsNotCompletedService, AsyncMarkTaskAsCompletedService and
+    AsyncDeleteCompletedTasksService behaviour"""
+    # arrange
+    test_async_db_session.add(
+        SQLAlchemyTask(list_id=1, description='This is another test task 11', id=1, completed=True)
+    )
+    test_async_db_session.add(
+        SQLAlchemyTask(list_id=1, description='This is another test task no 12', id=2, completed=True)
+    )
+    await test_async_db_session.commit()
+
+    # act
+    await AsyncMarkTasksAsNotCompletedService(task_repository=repository).execute()
+    await AsyncMarkTaskAsCompletedService(task_repository=repository, orm=orm).execute(task_id=2)
+    deleted = await AsyncDeleteCompletedTasksService(task_repository=repository).execute()
+
+    # assert
+    tasks_rows = (await test_async_db_session.scalars(select(SQLAlchemyTask))).all()
+    assert deleted == 1
+    assert [(task.id, task.completed) for task in tasks_rows] == [(1, False)]
+
+
+async def test_toggle_all_tasks_service(test_async_db_session, repository):
+    """Assert AsyncToggleAllTasksService completes the active tasks, then reopens them all when none is active"""
+    # arrange
+    test_async_db_session.add(
+        SQLAlchemyTask(list_id=1, description='This is another test task 11', id=1, completed=True)
+    )
+    test_async_db_session.add(
+        SQLAlchemyTask(list_id=1, description='This is another test task no 12', id=2, completed=False)
+    )
+    await test_async_db_session.commit()
+    toggle_all_tasks_service = AsyncToggleAllTasksService(task_repository=repository)
+
+    # act
+    completed = await toggle_all_tasks_service.execute()
+    reopened = await toggle_all_tasks_service.execute()
+
+    # assert
+    tasks_rows = (await test_async_db_session.execute(select(SQLAlchemyTask.id, SQLAlchemyTask.completed))).all()
+    assert (completed, reopened) == (1, 2)
+    assert sorted(tasks_rows) == [(1, False), (2, False)]
+
+
+async def test_get_task_list_and_counts_services(test_async_db_session, repository, orm):
+    """Assert AsyncGetTaskListService and AsyncGetTaskCountsService behaviour"""
+    # arrange
+    test_async_db_session.add(
+        SQLAlchemyTask(list_id=1, description='This is another test task 13', id=1, completed=True)
+    )
+    test_async_db_session.add(
+        SQLAlchemyTask(list_id=1, description='This is another test task no 14', id=2, completed=False)
+    )
+    await test_async_db_session.commit()
+
+    # act
+    task_list = await AsyncGetTaskListService(task_repository=repository, orm=orm).execute(completed=True)
+    task_counts = await AsyncGetTaskCountsService(task_repository=repository).execute()
+
+    # assert
+    assert [task.id for task in task_list.tasks] == [1]
+    assert (task_list.total, task_list.completed) == (2, 1)
+    assert (task_counts.total, task_counts.completed) == (2, 1)
+
+
+async def test_get_tasks_page_service(test_async_db_session, repository, orm):
+    """Assert AsyncGetTasksPageService behaviour"""
+    # arrange
+    for task_id in range(1, 5):
+        test_async_db_session.add(SQLAlchemyTask(list_id=1, description=f'This is test task no {task_id}', id=task_id))
+    await test_async_db_session.commit()
+
+    # act
+    task_page = await AsyncGetTasksPageService(task_repository=repository, orm=orm).execute(limit=2, after_id=1)
+
+    # assert
+    assert [task.id for task in task_page.tasks] == [2, 3]
+    assert task_page.next_cursor == 3
+
+
+async def test_search_tasks_service(test_async_db_session, repository, orm):
+    """Assert AsyncSearchTasksService behaviour"""
+    # arrange
+    test_async_db_session.add(
+        SQLAlchemyTask(list_id=1, description='Pick up the kids and buy milk on the way back', id=1)
+    )
+    test_async_db_session.add(SQLAlchemyTask(list_id=1, description='Buy milk', id=2, completed=True))
+    test_async_db_session.add(SQLAlchemyTask(list_id=1, description='Walk the dog', id=3))
+    await test_async_db_session.commit()
+
+    # act
+    search_tasks_service = AsyncSearchTasksService(task_repository=repository, orm=orm)
+    task_page = await search_tasks_service.execute(query='milk', limit=1)
+    active_page = await search_tasks_service.execute(query='milk', limit=5, completed=False)
+
+    # assert
+    assert [task.id for task in task_page.tasks] == [2]
+    assert task_page.next_cursor == 1
+    assert [task.id for task in active_page.tasks] == [1]
+
+
+async def test_stream_tasks_service(test_async_db_session, repository, orm):
+    """Assert AsyncStreamTasksService behaviour"""
+    # arrange
+    test_async_db_session.add(
+        SQLAlchemyTask(list_id=1, description='This is another test task 19', id=1, completed=True)
+    )
+    test_async_db_session.add(
+        SQLAlchemyTask(list_id=1, description='This is another test task no 20', id=2, completed=False)
+    )
+    await test_async_db_session.commit()
+
+    # act
+    tasks = await AsyncStreamTasksService(task_repository=repository, orm=orm).execute()
+
+    # assert
+    assert [task.id async for task in tasks] == [1, 2]
+
+
+async def test_get_data_version_service(test_async_db_session, repository, orm):
+    """Assert AsyncGetDataVersionService behaviour"""
+    # arrange
+    get_data_version_service = AsyncGetDataVersionService(task_repository=repository)
+    initial_version = await get_data_version_service.execute()
+
+    # act
+    await AsyncAddTaskService(task_repository=repository, orm=orm).execute(task=Task(description='This is a test task'))
+    await AsyncMarkTasksAsNotCompletedService(task_repository=repository).execute()
+    data_version = await get_data_version_service.execute()
+
+    # assert
+    assert (initial_version.version, initial_version.updated_at) == (0, None)
+    assert data_version.version == 1
+    assert data_version.updated_at is not None
+
+
+async def test_bulk_add_tasks_service(test_async_db_session, repository, orm):
+    """Assert AsyncBulkAddTasksService behaviour"""
+    # arrange
+    tasks = [Task(description=f'This is test task no {number}', completed=number % 2 == 0) for number in range(5)]
+    bulk_add_tasks_service = AsyncBulkAddTasksService(task_repository=repository, orm=orm)
+
+    # act
+    added = await bulk_add_tasks_service.execute(tasks=tasks)
+
+    # assert
+    assert added == 5
+    assert await repository.get_task_counts() == (5, 3)
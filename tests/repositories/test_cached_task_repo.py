@@ -0,0 +1,130 @@
+import pytest
+from cache.backends import FakeCacheBackend
+from cache.read_through import ReadThroughCache
+from models.task_mdl import Task
+from orm.mappings import SQLAlchemyORM
+from repositories.cached_tasks_repo import CachedTaskRepository
+from repositories.tasks_repo import SQLAlchemyTaskRepository
+from schema.task_list_sch import SQLAlchemyTaskList
+from schema.task_sch import SQLAlchemyTask
+from services.tasks.get_data_version_srv import GetDataVersionService
+from services.tasks.get_task_counts_srv import GetTaskCountsService
+from services.tasks.get_task_list_srv import GetTaskListService
+from services.tasks.mark_task_as_completed_srv import MarkTaskAsCompletedService
+from services.tasks.update_task_description_srv import UpdateTaskDescriptionService
+
+
+@pytest.fixture(name='cache')
+def read_through_cache():
+    """Read-through cache fixture"""
+    return ReadThroughCache(FakeCacheBackend())
+
+
+@pytest.fixture(name='repository')
+def task_repository(test_db_session, cache):
+    """Caching task repository fixture"""
+    return CachedTaskRepository(
+        task_repository=SQLAlchemyTaskRepository(session=test_db_session, list_id=1), cache=cache
+    )
+
+
+@pytest.fixture(name='orm')
+def orm_implementation():
+    """ORM fixture"""
+    return SQLAlchemyORM()
+
+
+def test_get_task_list_service_is_cached(test_db_session, repository, orm, cache):
+    """Assert GetTaskListService results are served from the cache"""
+    # arrange
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is a test task no 1', id=1))
+    test_db_session.commit()
+    get_task_list_service = GetTaskListService(task_repository=repository, orm=orm)
+    get_task_list_service.execute()
+
+    # act
+    test_db_session.expire_all()
+    test_db_session.close()
+    task_list = get_task_list_service.execute()
+
+    # assert
+    assert [task.description for task in task_list.tasks] == ['This is a test task no 1']
+    assert cache.stats() == {'hits': 1, 'misses': 1}
+
+
+def test_mark_task_as_completed_service_invalidates_cache(test_db_session, repository, orm, cache):
+    """Assert MarkTaskAsCompletedService invalidates the cached lists and counts"""
+    # arrange
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is a test task no 1', id=1))
+    test_db_session.commit()
+    GetTaskListService(task_repository=repository, orm=orm).execute(completed=False)
+
+    # act
+    MarkTaskAsCompletedService(task_repository=repository, orm=orm).execute(task_id=1)
+    task_list = GetTaskListService(task_repository=repository, orm=orm).execute(completed=False)
+
+    # assert
+    assert task_list.tasks == []
+    assert task_list.completed == 1
+    assert cache.stats() == {'hits': 0, 'misses': 2}
+
+
+def test_update_task_description_service_keeps_cached_counts(test_db_session, repository, orm, cache):
+    """Assert UpdateTaskDescriptionService invalidates the cached lists only"""
+    # arrange
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is a test task no 1', id=1))
+    test_db_session.commit()
+    get_task_list_service = GetTaskListService(task_repository=repository, orm=orm)
+    get_task_counts_service = GetTaskCountsService(task_repository=repository)
+    get_task_list_service.execute()
+    get_task_counts_service.execute()
+
+    # act
+    UpdateTaskDescriptionService(task_repository=repository, orm=orm).execute(
+        task=Task(id=1, description='This is another test task')
+    )
+    task_list = get_task_list_service.execute()
+    get_task_counts_service.execute()
+
+    # assert
+    assert [task.description for task in task_list.tasks] == ['This is another test task']
+    assert cache.stats() == {'hits': 1, 'misses': 3}
+
+
+def test_mark_task_as_completed_service_keeps_other_lists_cached(test_db_session, repository, orm, cache):
+    """Assert MarkTaskAsCompletedService only invalidates the cached results of its own list"""
+    # arrange
+    test_db_session.add(SQLAlchemyTaskList(id=2, user_id=1, name='Other tasks'))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is a test task no 1', id=1))
+    test_db_session.add(SQLAlchemyTask(list_id=2, description='This is a test task no 2', id=2))
+    test_db_session.commit()
+    other_repository = CachedTaskRepository(
+        task_repository=SQLAlchemyTaskRepository(session=test_db_session, list_id=2), cache=cache
+    )
+    get_other_task_list_service = GetTaskListService(task_repository=other_repository, orm=orm)
+    get_other_task_list_service.execute()
+
+    # act
+    MarkTaskAsCompletedService(task_repository=repository, orm=orm).execute(task_id=1)
+    task_list = get_other_task_list_service.execute()
+
+    # assert
+    assert [task.description for task in task_list.tasks] == ['This is a test task no 2']
+    assert cache.stats() == {'hits': 1, 'misses': 1}
+
+
+def test_get_data_version_service_is_not_cached(test_db_session, repository, cache):
+    """Assert GetDataVersionService sees the writes of other processes, which never invalidate this cache"""
+    # arrange
+    get_data_version_service = GetDataVersionService(task_repository=repository)
+    get_data_version_service.execute()
+
+    # act
+    SQLAlchemyTaskRepository(session=test_db_session, list_id=1).add_task(
+        task=SQLAlchemyTask(description='This is a test task no 1')
+    )
+    data_version = get_data_version_service.execute()
+
+    # assert
+    assert data_version.version == 1
+    assert cache.stats() == {'hits': 0, 'misses': 0}
@@ -0,0 +1,29 @@
+from db.group_commit import GroupCommitWriter
+from models.task_mdl import Task
+from orm.mappings import SQLAlchemyORM
+from repositories.group_commit_tasks_repo import GroupCommitTaskRepository
+from services.tasks.add_task_srv import AddTaskService
+from services.tasks.get_task_list_srv import GetTaskListService
+from services.tasks.mark_task_as_completed_srv import MarkTaskAsCompletedService
+from sqlalchemy.orm import sessionmaker
+
+
+def test_group_commit_task_repository_reads_its_writes(test_db_session):
+    """Assert GroupCommitTaskRepository writes through its writer and reads them back on the request session"""
+    # arrange
+    writer = GroupCommitWriter(sessionmaker(autoflush=False, bind=test_db_session.get_bind()))
+    repository = GroupCommitTaskRepository(session=test_db_session, list_id=1, writer=writer)
+    orm = SQLAlchemyORM()
+    get_task_list_service = GetTaskListService(task_repository=repository, orm=orm)
+    get_task_list_service.execute()
+
+    # act
+    task = AddTaskService(task_repository=repository, orm=orm).execute(task=Task(description='This is a test task'))
+    MarkTaskAsCompletedService(task_repository=repository, orm=orm).execute(task_id=task.id)
+    task_list = get_task_list_service.execute()
+    writer.stop()
+
+    # assert
+    assert [(task.description, task.completed) for task in task_list.tasks] == [('This is a test task', True)]
+    assert (task_list.total, task_list.completed) == (1, 1)
+    assert writer.stats() == {'batches': 2, 'writes': 2}
@@ -0,0 +1,73 @@
+import pytest
+from db.query_count import time_queries
+from metrics.prometheus import Metrics
+from models.task_mdl import Task
+from orm.mappings import SQLAlchemyORM
+from repositories.metered_tasks_repo import AsyncMeteredTaskRepository
+from repositories.metered_tasks_repo import MeteredTaskRepository
+from repositories.tasks_repo import AsyncSQLAlchemyTaskRepository
+from repositories.tasks_repo import SQLAlchemyTaskRepository
+from schema.task_sch import SQLAlchemyTask
+from services.tasks.add_task_srv import AsyncAddTaskService
+from services.tasks.get_task_list_srv import GetTaskListService
+from services.tasks.stream_tasks_srv import AsyncStreamTasksService
+from services.tasks.stream_tasks_srv import StreamTasksService
+
+
+@pytest.fixture(name='metrics')
+def prometheus_metrics():
+    """Metrics fixture"""
+    return Metrics()
+
+
+@pytest.fixture(name='orm')
+def orm_implementation():
+    """ORM fixture"""
+    return SQLAlchemyORM()
+
+
+def queries(metrics: Metrics, operation: str) -> tuple:
+    """Get how many calls of a repository method were metered and how many queries they ran"""
+    labels = {'operation': operation}
+    return (
+        metrics.registry.get_sample_value('db_queries_per_operation_count', labels),
+        metrics.registry.get_sample_value('db_queries_per_operation_sum', labels),
+    )
+
+
+def test_repository_methods_are_metered(test_db_session, metrics, orm):
+    """Assert MeteredTaskRepository counts the queries of every method call, iterated tasks included"""
+    # arrange
+    test_db_session.add_all(SQLAlchemyTask(list_id=1, description=f'Test task no {number}') for number in (1, 2))
+    test_db_session.commit()
+    time_queries(test_db_session.get_bind(), metrics.observe_query)
+    repository = MeteredTaskRepository(SQLAlchemyTaskRepository(session=test_db_session, list_id=1), metrics)
+
+    # act
+    GetTaskListService(task_repository=repository, orm=orm).execute(limit=1)
+    tasks = list(StreamTasksService(task_repository=repository, orm=orm).execute())
+
+    # assert
+    assert len(tasks) == 2
+    assert queries(metrics, 'get_task_list')[0] == 1
+    assert queries(metrics, 'get_task_list')[1] >= 1
+    assert queries(metrics, 'iter_tasks') == (3, 1)
+
+
+async def test_async_repository_methods_are_metered(test_async_db_session, metrics, orm):
+    """Assert AsyncMeteredTaskRepository counts the queries of every method call"""
+    # arrange
+    time_queries(test_async_db_session.bind.sync_engine, metrics.observe_query)
+    repository = AsyncMeteredTaskRepository(
+        AsyncSQLAlchemyTaskRepository(session=test_async_db_session, list_id=1), metrics
+    )
+
+    # act
+    await AsyncAddTaskService(task_repository=repository, orm=orm).execute(task=Task(description='Test task'))
+    tasks = [task async for task in await AsyncStreamTasksService(task_repository=repository, orm=orm).execute()]
+
+    # assert
+    assert [task.description for task in tasks] == ['Test task']
+    assert queries(metrics, 'add_task')[0] == 1
+    assert queries(metrics, 'add_task')[1] >= 1
+    assert queries(metrics, 'iter_tasks') == (2, 1)
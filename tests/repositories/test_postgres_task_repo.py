@@ -0,0 +1,153 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from models.task_mdl import Task
+from orm.mappings import SQLAlchemyORM
+from repositories.tasks_repo import SQLAlchemyTaskRepository
+from schema.task_sch import SQLAlchemyTask
+from services.tasks.add_task_srv import AddTaskService
+from services.tasks.get_data_version_srv import GetDataVersionService
+from services.tasks.get_task_list_srv import GetTaskListService
+from services.tasks.mark_task_as_completed_srv import MarkTaskAsCompletedService
+from services.tasks.search_tasks_srv import SearchTasksService
+from services.tasks.stream_tasks_srv import StreamTasksService
+from services.tasks.toggle_all_tasks_srv import ToggleAllTasksService
+from services.tasks.update_task_description_srv import UpdateTaskDescriptionService
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture(name='repository')
+def task_repository(test_postgres_db_session):
+    """PostgreSQL task repository fixture"""
+    return SQLAlchemyTaskRepository(session=test_postgres_db_session, list_id=1)
+
+
+@pytest.fixture(name='orm')
+def orm_implementation():
+    """ORM fixture"""
+    return SQLAlchemyORM()
+
+
+def test_add_task_service_returns_stored_task(repository, orm):
+    """Assert AddTaskService returns the row stored by PostgreSQL"""
+    # act
+    task = AddTaskService(task_repository=repository, orm=orm).execute(task=Task(description='This is a test task'))
+
+    # assert
+    assert task.id is not None
+    assert (task.description, task.completed) == ('This is a test task', False)
+
+
+def test_update_services_return_stored_task(test_postgres_db_session, repository, orm):
+    """Assert UpdateTaskDescriptionService and MarkTaskAsCompletedService return the updated rows"""
+    # arrange
+    test_postgres_db_session.add(
+        SQLAlchemyTask(list_id=1, description='This is a test task no 1', id=1, completed=False)
+    )
+    test_postgres_db_session.commit()
+
+    # act
+    updated_task = UpdateTaskDescriptionService(task_repository=repository, orm=orm).execute(
+        task=Task(id=1, description='This is another test task')
+    )
+    completed_task = MarkTaskAsCompletedService(task_repository=repository, orm=orm).execute(task_id=1)
+    missing_task = MarkTaskAsCompletedService(task_repository=repository, orm=orm).execute(task_id=2)
+
+    # assert
+    assert updated_task.description == 'This is another test task'
+    assert completed_task.completed is True
+    assert missing_task is None
+
+
+def test_get_task_list_service_counts(test_postgres_db_session, repository, orm):
+    """Assert GetTaskListService gets integer counts and the filtered tasks from PostgreSQL"""
+    # arrange
+    for task_id in range(1, 4):
+        test_postgres_db_session.add(
+            SQLAlchemyTask(list_id=1, description=f'This is test task no {task_id}', id=task_id, completed=task_id == 2)
+        )
+    test_postgres_db_session.commit()
+
+    # act
+    task_list = GetTaskListService(task_repository=repository, orm=orm).execute(completed=False, limit=1)
+    completed_list = GetTaskListService(task_repository=repository, orm=orm).execute(completed=True)
+
+    # assert
+    assert [task.id for task in task_list.tasks] == [1]
+    assert task_list.next_cursor == 1
+    assert (task_list.total, task_list.completed) == (3, 1)
+    assert [task.id for task in completed_list.tasks] == [2]
+    assert completed_list.next_cursor is None
+
+
+def test_search_tasks_service(test_postgres_db_session, repository, orm):
+    """Assert SearchTasksService ranks the matches of the PostgreSQL text search"""
+    # arrange
+    test_postgres_db_session.add(
+        SQLAlchemyTask(list_id=1, description='Pick up the kids and buy milk on the way back', id=1)
+    )
+    test_postgres_db_session.add(SQLAlchemyTask(list_id=1, description='Buy milk', id=2, completed=True))
+    test_postgres_db_session.add(SQLAlchemyTask(list_id=1, description='Walk the dog', id=3))
+    test_postgres_db_session.commit()
+
+    # act
+    search_tasks_service = SearchTasksService(task_repository=repository, orm=orm)
+    task_page = search_tasks_service.execute(query='buying mil', limit=5)
+    active_page = search_tasks_service.execute(query='milk', limit=5, completed=False)
+
+    # assert
+    assert [task.id for task in task_page.tasks] == [2, 1]
+    assert [task.id for task in active_page.tasks] == [1]
+
+
+def test_stream_tasks_service_and_data_version(repository, orm):
+    """Assert StreamTasksService iterates a server-side cursor and writes bump an aware data version"""
+    # arrange
+    repository.bulk_add_tasks(tasks=({'description': f'task {number}'} for number in range(10)), chunk_size=4)
+
+    # act
+    tasks = list(StreamTasksService(task_repository=repository, orm=orm).execute())
+    data_version = GetDataVersionService(task_repository=repository).execute()
+
+    # assert
+    assert len(tasks) == 10
+    assert data_version.version == 3
+    assert data_version.updated_at.tzinfo is not None
+
+
+def test_toggle_all_tasks_service(test_postgres_db_session, repository):
+    """Assert ToggleAllTasksService only updates the tasks of its list whose state changes on PostgreSQL"""
+    # arrange
+    test_postgres_db_session.add(
+        SQLAlchemyTask(list_id=1, description='This is a test task no 1', id=1, completed=True)
+    )
+    test_postgres_db_session.add(SQLAlchemyTask(list_id=1, description='This is a test task no 2', id=2))
+    test_postgres_db_session.commit()
+    toggle_all_tasks_service = ToggleAllTasksService(task_repository=repository)
+
+    # act
+    toggled = [toggle_all_tasks_service.execute() for _ in range(3)]
+
+    # assert
+    assert toggled == [1, 2, 2]
+    assert repository.get_data_version()[0] == 3
+
+
+def test_concurrent_first_writes_bump_the_data_version(test_postgres_db_session, repository, orm):
+    """Assert two transactions writing to a list for the first time both bump its data version"""
+    # arrange
+    other_session = sessionmaker(bind=test_postgres_db_session.get_bind())()
+    other_repository = SQLAlchemyTaskRepository(session=other_session, list_id=1)
+    repository.bump_data_version()
+
+    # act
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other_write = executor.submit(
+            AddTaskService(task_repository=other_repository, orm=orm).execute, task=Task(description='Other task')
+        )
+        AddTaskService(task_repository=repository, orm=orm).execute(task=Task(description='This is a test task'))
+        other_write.result(timeout=10)
+    other_session.close()
+
+    # assert
+    assert repository.get_data_version()[0] == 3
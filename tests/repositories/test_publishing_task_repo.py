@@ -0,0 +1,88 @@
+from typing import Hashable
+from typing import Optional
+
+import pytest
+from events.brokers import EventBroker
+from models.task_event_mdl import TaskEvent
+from models.task_mdl import Task
+from orm.mappings import SQLAlchemyORM
+from repositories.publishing_tasks_repo import AsyncPublishingTaskRepository
+from repositories.publishing_tasks_repo import PublishingTaskRepository
+from repositories.tasks_repo import AsyncSQLAlchemyTaskRepository
+from repositories.tasks_repo import SQLAlchemyTaskRepository
+from schema.task_sch import SQLAlchemyTask
+from services.tasks.add_task_srv import AsyncAddTaskService
+from services.tasks.delete_completed_tasks_srv import DeleteCompletedTasksService
+from services.tasks.get_task_list_srv import GetTaskListService
+from services.tasks.mark_task_as_completed_srv import AsyncMarkTaskAsCompletedService
+from services.tasks.mark_task_as_completed_srv import MarkTaskAsCompletedService
+
+
+class RecordingEventBroker(EventBroker):
+    """Broker recording the published events"""
+
+    def __init__(self) -> None:
+        self.events = []
+
+    def publish(self, channel: Hashable, event: TaskEvent, origin: Optional[str] = None):
+        self.events.append((channel, event))
+
+    def subscribe(self, channel: Hashable, subscriber: Optional[str] = None):
+        raise NotImplementedError()
+
+
+@pytest.fixture(name='broker')
+def recording_event_broker():
+    """Recording event broker fixture"""
+    return RecordingEventBroker()
+
+
+@pytest.fixture(name='orm')
+def orm_implementation():
+    """ORM fixture"""
+    return SQLAlchemyORM()
+
+
+def test_single_task_writes_publish_task_events(test_db_session, broker, orm):
+    """Assert writes to a single task publish an event naming it"""
+    # arrange
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is a test task no 1', id=1))
+    test_db_session.commit()
+    repository = PublishingTaskRepository(SQLAlchemyTaskRepository(session=test_db_session, list_id=1), broker)
+
+    # act
+    MarkTaskAsCompletedService(task_repository=repository, orm=orm).execute(task_id=1)
+
+    # assert
+    assert broker.events == [(1, TaskEvent.task_changed(1))]
+
+
+def test_list_writes_publish_list_events(test_db_session, broker, orm):
+    """Assert writes to many tasks publish an event of the whole list, and reads publish nothing"""
+    # arrange
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is a test task no 1', completed=True))
+    test_db_session.commit()
+    repository = PublishingTaskRepository(SQLAlchemyTaskRepository(session=test_db_session, list_id=1), broker)
+
+    # act
+    GetTaskListService(task_repository=repository, orm=orm).execute()
+    DeleteCompletedTasksService(task_repository=repository).execute()
+
+    # assert
+    assert broker.events == [(1, TaskEvent())]
+
+
+async def test_async_writes_publish_events(test_async_db_session, broker, orm):
+    """Assert AsyncPublishingTaskRepository publishes after every write"""
+    # arrange
+    repository = AsyncPublishingTaskRepository(
+        AsyncSQLAlchemyTaskRepository(session=test_async_db_session, list_id=1), broker
+    )
+
+    # act
+    await AsyncAddTaskService(task_repository=repository, orm=orm).execute(task=Task(description='Test task'))
+    task_id = (await repository.get_tasks())[0].id
+    await AsyncMarkTaskAsCompletedService(task_repository=repository, orm=orm).execute(task_id=task_id)
+
+    # assert
+    assert broker.events == [(1, TaskEvent()), (1, TaskEvent.task_changed(task_id))]
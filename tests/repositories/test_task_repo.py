@@ -1,25 +1,38 @@
 import pytest
 from models.task_mdl import Task
+from models.task_mdl import TaskRecord
 from orm.mappings import SQLAlchemyORM
 from repositories.tasks_repo import SQLAlchemyTaskRepository
+from repositories.tasks_repo import UPSERT_INSERTS
+from schema.task_list_sch import SQLAlchemyTaskList
 from schema.task_sch import SQLAlchemyTask
 from services.tasks.add_task_srv import AddTaskService
+from services.tasks.bulk_add_tasks_srv import BulkAddTasksService
+from services.tasks.delete_completed_tasks_srv import DeleteCompletedTasksService
 from services.tasks.delete_task_srv import DeleteTaskService
 from services.tasks.get_completed_tasks_srv import GetCompletedTasksService
+from services.tasks.get_data_version_srv import GetDataVersionService
 from services.tasks.get_not_completed_tasks_srv import GetNotCompletedTasksService
+from services.tasks.get_task_counts_srv import GetTaskCountsService
+from services.tasks.get_task_list_srv import GetTaskListService
 from services.tasks.get_task_srv import GetTaskService
+from services.tasks.get_tasks_page_srv import GetTasksPageService
 from services.tasks.get_tasks_srv import GetTasksService
 from services.tasks.mark_task_as_completed_srv import MarkTaskAsCompletedService
 from services.tasks.mark_task_as_not_completed_srv import MarkTaskAsNotCompletedService
 from services.tasks.mark_tasks_as_completed_srv import MarkTasksAsCompletedService
 from services.tasks.mark_tasks_as_not_completed_srv import MarkTasksAsNotCompletedService
+from services.tasks.search_tasks_srv import SearchTasksService
+from services.tasks.stream_tasks_srv import StreamTasksService
+from services.tasks.toggle_all_tasks_srv import ToggleAllTasksService
 from services.tasks.update_task_description_srv import UpdateTaskDescriptionService
+from sqlalchemy import update
 
 
 @pytest.fixture(autouse=True, name='repository')
 def task_repository(test_db_session):
     """Task repository fixture"""
-    return SQLAlchemyTaskRepository(session=test_db_session)
+    return SQLAlchemyTaskRepository(session=test_db_session, list_id=1)
 
 
 @pytest.fixture(name='orm')
@@ -28,6 +41,144 @@ def orm_implementation():
     return SQLAlchemyORM()
 
 
+def add_query_count_tasks(session):
+    """Add the three tasks of the list the query counts are checked on, the second one completed"""
+    session.add(SQLAlchemyTask(list_id=1, description='This is a test task no 1', id=1))
+    session.add(SQLAlchemyTask(list_id=1, description='This is a test task no 2', id=2, completed=True))
+    session.add(SQLAlchemyTask(list_id=1, description='This is a test task no 3', id=3))
+    session.commit()
+
+
+def test_get_task_list_service_query_count(test_db_session, repository, orm, query_count):
+    """Assert GetTaskListService reads the tasks and their counts in a single query"""
+    # arrange
+    add_query_count_tasks(test_db_session)
+    get_task_list_service = GetTaskListService(task_repository=repository, orm=orm)
+
+    # act
+    with query_count() as counted:
+        task_list = get_task_list_service.execute()
+        descriptions = [task.description for task in task_list.tasks]
+
+    # assert
+    assert len(descriptions) == 3
+    assert counted.queries == 1, counted.format_statements()
+
+
+def test_get_tasks_page_service_query_count(test_db_session, repository, orm, query_count):
+    """Assert GetTasksPageService reads a page of tasks in a single query"""
+    # arrange
+    add_query_count_tasks(test_db_session)
+    get_tasks_page_service = GetTasksPageService(task_repository=repository, orm=orm)
+
+    # act
+    with query_count() as counted:
+        task_page = get_tasks_page_service.execute(limit=2, after_id=1)
+        descriptions = [task.description for task in task_page.tasks]
+
+    # assert
+    assert len(descriptions) == 2
+    assert counted.queries == 1, counted.format_statements()
+
+
+def test_get_task_counts_service_query_count(test_db_session, repository, query_count):
+    """Assert GetTaskCountsService computes the counts in a single query"""
+    # arrange
+    add_query_count_tasks(test_db_session)
+    get_task_counts_service = GetTaskCountsService(task_repository=repository)
+
+    # act
+    with query_count() as counted:
+        get_task_counts_service.execute()
+
+    # assert
+    assert counted.queries == 1, counted.format_statements()
+
+
+def test_get_task_service_query_count(test_db_session, repository, orm, query_count):
+    """Assert GetTaskService reads a task in a single query"""
+    # arrange
+    add_query_count_tasks(test_db_session)
+    get_task_service = GetTaskService(task_repository=repository, orm=orm)
+
+    # act
+    with query_count() as counted:
+        get_task_service.execute(task_id=1)
+
+    # assert
+    assert counted.queries == 1, counted.format_statements()
+
+
+def test_add_task_service_query_count(test_db_session, repository, orm, query_count):
+    """Assert AddTaskService runs the insert and the data version bump only"""
+    # arrange
+    add_query_count_tasks(test_db_session)
+    add_task_service = AddTaskService(task_repository=repository, orm=orm)
+
+    # act
+    with query_count() as counted:
+        add_task_service.execute(task=Task(description='This is a test task no 4'))
+
+    # assert
+    assert counted.queries == 2, counted.format_statements()
+
+
+def test_mark_task_as_completed_service_query_count(test_db_session, repository, orm, query_count):
+    """Assert MarkTaskAsCompletedService runs the update and the data version bump only"""
+    # arrange
+    add_query_count_tasks(test_db_session)
+    mark_task_as_completed_service = MarkTaskAsCompletedService(task_repository=repository, orm=orm)
+
+    # act
+    with query_count() as counted:
+        mark_task_as_completed_service.execute(task_id=1)
+
+    # assert
+    assert counted.queries == 2, counted.format_statements()
+
+
+def test_mark_tasks_as_completed_service_query_count(test_db_session, repository, query_count):
+    """Assert MarkTasksAsCompletedService updates every task in a single query besides the data version bump"""
+    # arrange
+    add_query_count_tasks(test_db_session)
+    mark_tasks_as_completed_service = MarkTasksAsCompletedService(task_repository=repository)
+
+    # act
+    with query_count() as counted:
+        mark_tasks_as_completed_service.execute()
+
+    # assert
+    assert counted.queries == 2, counted.format_statements()
+
+
+def test_delete_completed_tasks_service_query_count(test_db_session, repository, query_count):
+    """Assert DeleteCompletedTasksService deletes every completed task in a single query besides the version bump"""
+    # arrange
+    add_query_count_tasks(test_db_session)
+    delete_completed_tasks_service = DeleteCompletedTasksService(task_repository=repository)
+
+    # act
+    with query_count() as counted:
+        delete_completed_tasks_service.execute()
+
+    # assert
+    assert counted.queries == 2, counted.format_statements()
+
+
+def test_toggle_all_tasks_service_query_count(test_db_session, repository, query_count):
+    """Assert ToggleAllTasksService toggles every task in a single query besides the data version bump"""
+    # arrange
+    add_query_count_tasks(test_db_session)
+    toggle_all_tasks_service = ToggleAllTasksService(task_repository=repository)
+
+    # act
+    with query_count() as counted:
+        toggle_all_tasks_service.execute()
+
+    # assert
+    assert counted.queries == 2, counted.format_statements()
+
+
 def test_add_task_service(test_db_session, repository, orm):
     """Assert AddTaskService behaviour"""
     # arrange
@@ -46,8 +197,8 @@ def test_add_task_service(test_db_session, repository, orm):
 def test_get_tasks_service(test_db_session, repository, orm):
     """Assert GetTasksService behaviour"""
     # arrange
-    test_db_session.add(SQLAlchemyTask(description='This is a test task no 1'))
-    test_db_session.add(SQLAlchemyTask(description='This is a test task no 2'))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is a test task no 1'))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is a test task no 2'))
     test_db_session.commit()
 
     # act
@@ -61,8 +212,8 @@ def test_get_tasks_service(test_db_session, repository, orm):
 def test_get_task_service(test_db_session, repository, orm):
     """Assert GetTaskService behaviour"""
     # arrange
-    test_db_session.add(SQLAlchemyTask(description='This is a test task no 1', id=1))
-    test_db_session.add(SQLAlchemyTask(description='This is a test task no 2', id=2))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is a test task no 1', id=1))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is a test task no 2', id=2))
     test_db_session.commit()
 
     # act
@@ -79,7 +230,7 @@ def test_get_task_service(test_db_session, repository, orm):
 def test_update_task_description_service(test_db_session, repository, orm):
     """Assert UpdateTaskDescriptionService behaviour"""
     # arrange
-    test_db_session.add(SQLAlchemyTask(description='This is a test task no 3', id=1, completed=True))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is a test task no 3', id=1, completed=True))
     test_db_session.commit()
 
     # act
@@ -91,11 +242,30 @@ def test_update_task_description_service(test_db_session, repository, orm):
     assert task_row.description == 'This is another test task 5'
 
 
+def test_update_task_description_service_outside_the_list(test_db_session, repository, orm):
+    """Assert UpdateTaskDescriptionService returns nothing for a missing task or a task of another list"""
+    # arrange
+    test_db_session.add(SQLAlchemyTaskList(id=2, user_id=1, name='Other tasks'))
+    test_db_session.add(SQLAlchemyTask(list_id=2, description='This is a test task no 1', id=1))
+    test_db_session.commit()
+    update_task_description_service = UpdateTaskDescriptionService(task_repository=repository, orm=orm)
+
+    # act
+    missing_task = update_task_description_service.execute(task=Task(id=2, description='This is another test task'))
+    other_list_task = update_task_description_service.execute(task=Task(id=1, description='This is another test task'))
+
+    # assert
+    assert missing_task is None
+    assert other_list_task is None
+    test_db_session.expire_all()
+    assert test_db_session.get(SQLAlchemyTask, 1).description == 'This is a test task no 1'
+
+
 def test_get_completed_tasks_service(test_db_session, repository, orm):
     """Assert GetCompletedTasksService behaviour"""
     # arrange
-    test_db_session.add(SQLAlchemyTask(description='This is another test task 7', id=1, completed=True))
-    test_db_session.add(SQLAlchemyTask(description='This is a test task no 9', id=2, completed=False))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task 7', id=1, completed=True))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is a test task no 9', id=2, completed=False))
     test_db_session.commit()
 
     # act
@@ -112,8 +282,8 @@ def test_get_completed_tasks_service(test_db_session, repository, orm):
 def test_get_no_completed_tasks(test_db_session, repository, orm):
     """Assert GetNotCompletedTasksService behaviour"""
     # arrange
-    test_db_session.add(SQLAlchemyTask(description='This is another test task 8', id=1, completed=True))
-    test_db_session.add(SQLAlchemyTask(description='This is another test task no 3', id=2, completed=False))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task 8', id=1, completed=True))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task no 3', id=2, completed=False))
     test_db_session.commit()
 
     # act
@@ -130,8 +300,8 @@ def test_get_no_completed_tasks(test_db_session, repository, orm):
 def test_delete_task_service(test_db_session, repository):
     """Assert DeleteTaskService behaviour"""
     # arrange
-    test_db_session.add(SQLAlchemyTask(description='This is another test task 9', id=1, completed=True))
-    test_db_session.add(SQLAlchemyTask(description='This is another test task no 10', id=2, completed=False))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task 9', id=1, completed=True))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task no 10', id=2, completed=False))
     test_db_session.commit()
 
     # act
@@ -147,31 +317,53 @@ def test_delete_task_service(test_db_session, repository):
     assert tasks_rows[0].completed is False
 
 
-def test_mark_task_as_completed_service(test_db_session, repository):
+def test_delete_completed_tasks_service(test_db_session, repository):
+    """Assert DeleteCompletedTasksService behaviour"""
+    # arrange
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task 9', id=1, completed=True))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task no 10', id=2, completed=False))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task no 11', id=3, completed=True))
+    test_db_session.commit()
+
+    # act
+    delete_completed_tasks_service = DeleteCompletedTasksService(task_repository=repository)
+    deleted = delete_completed_tasks_service.execute()
+
+    # assert
+    tasks_rows = test_db_session.query(SQLAlchemyTask).all()
+    assert deleted == 2
+    assert len(tasks_rows) == 1
+    assert tasks_rows[0].id == 2
+
+
+def test_mark_task_as_completed_service(test_db_session, repository, orm):
     """Assert MarkTaskAsCompletedService behaviour"""
     # arrange
-    test_db_session.add(SQLAlchemyTask(description='This is another test task 11', id=1, completed=True))
-    test_db_session.add(SQLAlchemyTask(description='This is another test task no 12', id=2, completed=False))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task 11', id=1, completed=True))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task no 12', id=2, completed=False))
     test_db_session.commit()
 
     # act
-    mark_task_as_completed_service = MarkTaskAsCompletedService(task_repository=repository)
-    mark_task_as_completed_service.execute(task_id=2)
+    mark_task_as_completed_service = MarkTaskAsCompletedService(task_repository=repository, orm=orm)
+    task = mark_task_as_completed_service.execute(task_id=2)
+    missing_task = mark_task_as_completed_service.execute(task_id=3)
 
     # assert
     tasks_rows = test_db_session.query(SQLAlchemyTask).filter_by(completed=True).all()
     assert len(tasks_rows) == 2
+    assert (task.id, task.description, task.completed) == (2, 'This is another test task no 12', True)
+    assert missing_task is None
 
 
-def test_mark_task_as_not_completed_service(test_db_session, repository):
+def test_mark_task_as_not_completed_service(test_db_session, repository, orm):
     """Assert MarkTaskAsNotCompletedService behaviour"""
     # arrange
-    test_db_session.add(SQLAlchemyTask(description='This is another test task 11', id=1, completed=True))
-    test_db_session.add(SQLAlchemyTask(description='This is another test task no 12', id=2, completed=True))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task 11', id=1, completed=True))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task no 12', id=2, completed=True))
     test_db_session.commit()
 
     # act
-    mark_task_as_not_completed_service = MarkTaskAsNotCompletedService(task_repository=repository)
+    mark_task_as_not_completed_service = MarkTaskAsNotCompletedService(task_repository=repository, orm=orm)
     mark_task_as_not_completed_service.execute(task_id=2)
 
     # assert
@@ -182,8 +374,8 @@ def test_mark_task_as_not_completed_service(test_db_session, repository):
 def test_mark_tasks_as_completed_service(test_db_session, repository):
     """Assert MarkTasksAsCompletedService behaviour"""
     # arrange
-    test_db_session.add(SQLAlchemyTask(description='This is another test task 11', id=1, completed=False))
-    test_db_session.add(SQLAlchemyTask(description='This is another test task no 12', id=2, completed=False))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task 11', id=1, completed=False))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task no 12', id=2, completed=False))
     test_db_session.commit()
 
     # act
@@ -198,8 +390,8 @@ def test_mark_tasks_as_completed_service(test_db_session, repository):
 def test_mark_tasks_as_not_completed_service(test_db_session, repository):
     """Assert MarkTasksAsNotCompletedService behaviour"""
     # arrange
-    test_db_session.add(SQLAlchemyTask(description='This is another test task 11', id=1, completed=True))
-    test_db_session.add(SQLAlchemyTask(description='This is another test task no 12', id=2, completed=True))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task 11', id=1, completed=True))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task no 12', id=2, completed=True))
     test_db_session.commit()
 
     # act
@@ -209,3 +401,320 @@ def test_mark_tasks_as_not_completed_service(test_db_session, repository):
     # assert
     tasks_rows = test_db_session.query(SQLAlchemyTask).filter_by(completed=False).all()
     assert len(tasks_rows) == 2
+
+
+def test_no_op_writes_keep_the_data_version(test_db_session, repository):
+    """Assert the writes that change no task do not bump the data version"""
+    # arrange
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task 11', id=1, completed=False))
+    test_db_session.commit()
+
+    # act
+    repository.update_task_description(SQLAlchemyTask(id=2, description='This is a missing task'))
+    repository.mark_task_as_completed(task_id=2)
+    repository.mark_tasks_as_not_completed()
+    repository.delete_task(task_id=2)
+    repository.delete_completed_tasks()
+
+    # assert
+    assert repository.get_data_version()[0] == 0
+
+
+def test_data_version_without_upsert(test_db_session, repository, monkeypatch):
+    """Assert the data version is created, then incremented, on a dialect without an upsert"""
+    # arrange
+    monkeypatch.delitem(UPSERT_INSERTS, 'sqlite')
+
+    # act
+    repository.add_task(task=SQLAlchemyTask(description='This is a test task no 1'))
+    first_version = repository.get_data_version()[0]
+    repository.add_task(task=SQLAlchemyTask(description='This is a test task no 2'))
+    second_version = repository.get_data_version()[0]
+
+    # assert
+    assert first_version == 1
+    assert second_version == 2
+
+
+def test_toggle_all_tasks_service(test_db_session, repository):
+    """Assert ToggleAllTasksService completes the active tasks, then reopens them all when none is active"""
+    # arrange
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task 11', id=1, completed=True))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task no 12', id=2, completed=False))
+    test_db_session.commit()
+    toggle_all_tasks_service = ToggleAllTasksService(task_repository=repository)
+
+    # act
+    completed = toggle_all_tasks_service.execute()
+    completed_rows = test_db_session.query(SQLAlchemyTask).filter_by(completed=True).count()
+    reopened = toggle_all_tasks_service.execute()
+    reopened_rows = test_db_session.query(SQLAlchemyTask).filter_by(completed=False).count()
+
+    # assert
+    assert completed == 1
+    assert completed_rows == 2
+    assert reopened == 2
+    assert reopened_rows == 2
+    assert repository.get_data_version()[0] == 2
+
+
+def test_toggle_all_tasks_service_with_null_completion(test_db_session, repository):
+    """Assert ToggleAllTasksService counts a task stored without a completion state as active and toggles it"""
+    # arrange
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task 11', id=1, completed=True))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task no 12', id=2))
+    test_db_session.commit()
+    test_db_session.execute(update(SQLAlchemyTask).where(SQLAlchemyTask.id == 2).values(completed=None))
+    test_db_session.commit()
+    toggle_all_tasks_service = ToggleAllTasksService(task_repository=repository)
+
+    # act
+    completed = toggle_all_tasks_service.execute()
+    completed_rows = test_db_session.query(SQLAlchemyTask).filter_by(completed=True).count()
+    reopened = toggle_all_tasks_service.execute()
+    reopened_rows = test_db_session.query(SQLAlchemyTask).filter_by(completed=False).count()
+
+    # assert
+    assert completed == 1
+    assert completed_rows == 2
+    assert reopened == 2
+    assert reopened_rows == 2
+
+
+def test_toggle_all_tasks_service_without_tasks(repository):
+    """Assert ToggleAllTasksService changes nothing, not even the data version, on an empty list"""
+    # act
+    toggled = ToggleAllTasksService(task_repository=repository).execute()
+
+    # assert
+    assert toggled == 0
+    assert repository.get_data_version()[0] == 0
+
+
+def test_get_task_list_service(test_db_session, repository, orm):
+    """Assert GetTaskListService behaviour"""
+    # arrange
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task 13', id=1, completed=True))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task no 14', id=2, completed=False))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task no 15', id=3, completed=False))
+    test_db_session.commit()
+
+    # act
+    get_task_list_service = GetTaskListService(task_repository=repository, orm=orm)
+    task_list = get_task_list_service.execute(completed=False)
+
+    # assert
+    assert [task.id for task in task_list.tasks] == [2, 3]
+    assert task_list.total == 3
+    assert task_list.completed == 1
+    assert task_list.active == 2
+
+
+def test_get_task_list_service_without_matches(test_db_session, repository, orm):
+    """Assert GetTaskListService behaviour when no task matches the filter"""
+    # arrange
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task 16', id=1, completed=False))
+    test_db_session.commit()
+
+    # act
+    get_task_list_service = GetTaskListService(task_repository=repository, orm=orm)
+    task_list = get_task_list_service.execute(completed=True)
+
+    # assert
+    assert task_list.tasks == []
+    assert task_list.total == 1
+    assert task_list.completed == 0
+
+
+def test_get_task_counts_service(test_db_session, repository):
+    """Assert GetTaskCountsService behaviour"""
+    # arrange
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task 17', id=1, completed=True))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task no 18', id=2, completed=False))
+    test_db_session.commit()
+
+    # act
+    get_task_counts_service = GetTaskCountsService(task_repository=repository)
+    task_counts = get_task_counts_service.execute()
+
+    # assert
+    assert task_counts.total == 2
+    assert task_counts.completed == 1
+    assert task_counts.active == 1
+
+
+def test_get_task_list_service_first_page(test_db_session, repository, orm):
+    """Assert GetTaskListService behaviour when limiting the list to its first page"""
+    # arrange
+    for task_id in range(1, 6):
+        test_db_session.add(SQLAlchemyTask(list_id=1, description=f'This is test task no {task_id}', id=task_id))
+    test_db_session.commit()
+
+    # act
+    get_task_list_service = GetTaskListService(task_repository=repository, orm=orm)
+    task_list = get_task_list_service.execute(limit=2)
+
+    # assert
+    assert [task.id for task in task_list.tasks] == [1, 2]
+    assert task_list.next_cursor == 2
+    assert task_list.total == 5
+
+
+def test_get_tasks_page_service(test_db_session, repository, orm):
+    """Assert GetTasksPageService behaviour"""
+    # arrange
+    for task_id in range(1, 8):
+        test_db_session.add(
+            SQLAlchemyTask(
+                list_id=1, description=f'This is test task no {task_id}', id=task_id, completed=task_id % 2 == 0
+            )
+        )
+    test_db_session.commit()
+
+    # act
+    get_tasks_page_service = GetTasksPageService(task_repository=repository, orm=orm)
+    middle_page = get_tasks_page_service.execute(limit=2, completed=False, after_id=1)
+    last_page = get_tasks_page_service.execute(limit=2, completed=False, after_id=middle_page.next_cursor)
+
+    # assert
+    assert [task.id for task in middle_page.tasks] == [3, 5]
+    assert middle_page.next_cursor == 5
+    assert [task.id for task in last_page.tasks] == [7]
+    assert last_page.next_cursor is None
+
+
+def test_search_tasks_service(test_db_session, repository, orm):
+    """Assert SearchTasksService behaviour"""
+    # arrange
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='Pick up the kids and buy milk on the way back', id=1))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='Buy milk', id=2, completed=True))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='Walk the dog', id=3))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='Buy dog food', id=4))
+    test_db_session.commit()
+    repository.update_task_description(SQLAlchemyTask(list_id=1, id=3, description='Walk the cat'))
+    repository.delete_task(task_id=4)
+
+    # act
+    search_tasks_service = SearchTasksService(task_repository=repository, orm=orm)
+    first_page = search_tasks_service.execute(query='mil', limit=1)
+    last_page = search_tasks_service.execute(query='mil', limit=1, offset=first_page.next_cursor)
+    active_page = search_tasks_service.execute(query='buy MILK', limit=5, completed=False)
+    renamed_page = search_tasks_service.execute(query='cat', limit=5)
+    deleted_page = search_tasks_service.execute(query='dog', limit=5)
+    blank_page = search_tasks_service.execute(query=' "* ', limit=5)
+
+    # assert
+    assert [task.id for task in first_page.tasks] == [2]
+    assert first_page.next_cursor == 1
+    assert [task.id for task in last_page.tasks] == [1]
+    assert last_page.next_cursor is None
+    assert [task.id for task in active_page.tasks] == [1]
+    assert [task.id for task in renamed_page.tasks] == [3]
+    assert deleted_page.tasks == []
+    assert blank_page.tasks == []
+
+
+def test_stream_tasks_service(test_db_session, repository, orm):
+    """Assert StreamTasksService behaviour"""
+    # arrange
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task 19', id=1, completed=True))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is another test task no 20', id=2, completed=False))
+    test_db_session.commit()
+
+    # act
+    stream_tasks_service = StreamTasksService(task_repository=repository, orm=orm)
+    tasks = stream_tasks_service.execute(completed=True)
+
+    # assert
+    assert not isinstance(tasks, list)
+    assert [task.id for task in tasks] == [1]
+
+
+def test_get_data_version_service(repository, orm):
+    """Assert GetDataVersionService behaviour"""
+    # arrange
+    get_data_version_service = GetDataVersionService(task_repository=repository)
+    initial_version = get_data_version_service.execute()
+
+    # act
+    AddTaskService(task_repository=repository, orm=orm).execute(task=Task(description='This is a test task'))
+    MarkTasksAsCompletedService(task_repository=repository).execute()
+    data_version = get_data_version_service.execute()
+
+    # assert
+    assert (initial_version.version, initial_version.updated_at) == (0, None)
+    assert data_version.version == 2
+    assert data_version.updated_at is not None
+
+
+def test_bulk_add_tasks_service(test_db_session, repository, orm):
+    """Assert BulkAddTasksService behaviour"""
+    # arrange
+    tasks = (Task(description=f'This is test task no {number}', completed=number % 2 == 0) for number in range(5))
+    bulk_add_tasks_service = BulkAddTasksService(task_repository=repository, orm=orm)
+
+    # act
+    added = bulk_add_tasks_service.execute(tasks=tasks)
+
+    # assert
+    tasks_rows = test_db_session.query(SQLAlchemyTask).order_by(SQLAlchemyTask.id).all()
+    assert added == 5
+    assert [task.completed for task in tasks_rows] == [True, False, True, False, True]
+
+
+def test_bulk_add_tasks_commits_in_chunks(test_db_session, repository):
+    """Assert SQLAlchemyTaskRepository.bulk_add_tasks commits one transaction per chunk"""
+    # arrange
+    tasks = ({'description': f'This is test task no {number}', 'completed': False} for number in range(5))
+
+    # act
+    added = repository.bulk_add_tasks(tasks=tasks, chunk_size=2)
+
+    # assert
+    assert added == 5
+    assert repository.get_task_counts() == (5, 0)
+    assert repository.get_data_version()[0] == 3
+
+
+def test_read_services_return_task_records(test_db_session, repository, orm):
+    """Assert the read services return task records, while the writes return validated task models"""
+    # arrange
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='This is a test task no 1', id=1))
+    test_db_session.commit()
+
+    # act
+    task_list = GetTaskListService(task_repository=repository, orm=orm).execute(limit=10)
+    streamed = list(StreamTasksService(task_repository=repository, orm=orm).execute())
+    task = GetTaskService(task_repository=repository, orm=orm).execute(task_id=1)
+    completed = MarkTaskAsCompletedService(task_repository=repository, orm=orm).execute(task_id=1)
+
+    # assert
+    assert task_list.tasks == [TaskRecord(id=1, description='This is a test task no 1', completed=False)]
+    assert streamed == task_list.tasks
+    assert task == task_list.tasks[0]
+    assert completed == Task(id=1, description='This is a test task no 1', completed=True)
+
+
+def test_services_are_scoped_by_list(test_db_session, repository, orm):
+    """Assert the services only read and write the tasks of the repository list"""
+    # arrange
+    test_db_session.add(SQLAlchemyTaskList(id=2, user_id=1, name='Other tasks'))
+    test_db_session.add(SQLAlchemyTask(list_id=1, description='Buy milk', id=1))
+    test_db_session.add(SQLAlchemyTask(list_id=2, description='Buy bread', id=2, completed=True))
+    test_db_session.commit()
+    other_repository = SQLAlchemyTaskRepository(session=test_db_session, list_id=2)
+
+    # act
+    MarkTasksAsCompletedService(task_repository=repository).execute()
+    DeleteCompletedTasksService(task_repository=repository).execute()
+    renamed = repository.update_task_description(task=SQLAlchemyTask(id=2, description='Buy rice'))
+    DeleteTaskService(task_repository=repository).execute(task_id=2)
+    task_list = GetTaskListService(task_repository=other_repository, orm=orm).execute()
+
+    # assert
+    assert renamed is None
+    assert repository.get_task(task_id=2) is None
+    assert SearchTasksService(task_repository=repository, orm=orm).execute(query='buy', limit=10).tasks == []
+    assert [task.description for task in task_list.tasks] == ['Buy bread']
+    assert (task_list.total, task_list.completed) == (1, 1)
+    assert GetDataVersionService(task_repository=other_repository).execute().version == 0
@@ -0,0 +1,514 @@
+import asyncio
+import inspect
+import logging
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from config.settings import Settings
+from db.migrations import upgrade_database
+from events.brokers import InProcessEventBroker
+from fastapi import params
+from fastapi.testclient import TestClient
+from main import create_app
+from main import iter_server_sent_events
+from main import router
+from manage import add_task_list
+from models.task_event_mdl import TaskEvent
+from services.dependencies import load_service_class
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+
+MAIN_IMPORT_SHARE = 0.35
+"""Largest share of the cumulative import time of FastAPI that ``import main`` may take on top of it"""
+
+DEFERRED_MODULES = ('sqlalchemy', 'services.tasks', 'repositories.tasks_repo', 'orm', 'uvicorn', 'alembic')
+"""Modules only imported once an app is built or a request is served"""
+
+
+@pytest.fixture(name='settings')
+def app_settings(tmp_path):
+    """Settings of an app on a migrated SQLite file"""
+    database_path = tmp_path / 'app.db'
+    engine = create_engine(f'sqlite:///{database_path}')
+    with engine.connect() as connection:
+        upgrade_database(connection=connection)
+        connection.commit()
+    engine.dispose()
+    return Settings(
+        database_url=f'sqlite:///{database_path}',
+        async_database_url=f'sqlite+aiosqlite:///{database_path}',
+        page_size=1,
+    )
+
+
+QUERY_COUNT_PATTERN = re.compile(r'db;desc="(\d+) quer(?:y|ies)";dur=[\d.]+')
+
+
+@pytest.fixture(name='query_count_client', params=[False, True], ids=['threadpool', 'asyncio'])
+def query_counting_client(request, settings, caplog):
+    """Client of an app counting the queries of every request, on a list of three tasks, the first one completed"""
+    caplog.set_level(logging.INFO, logger='db.query_count')
+    update = {'use_async': request.param, 'query_count_header': True, 'query_log': True, 'page_size': 50}
+    with TestClient(create_app(settings.model_copy(update=update))) as client:
+        for description in ('First task', 'Second task', 'Third task'):
+            client.post('/tasks', data={'description': description})
+        client.put('/tasks/1/complete')
+        caplog.clear()
+        yield client
+
+
+def request_queries(response) -> int:
+    """Get the number of queries a response reports in its Server-Timing header"""
+    assert response.status_code == 200
+    return int(QUERY_COUNT_PATTERN.fullmatch(response.headers['server-timing']).group(1))
+
+
+def test_import_time():
+    """Assert importing main stays within its share of the FastAPI import time and defers the heavy modules"""
+    # arrange
+    command = [sys.executable, '-X', 'importtime', '-c', 'import fastapi; import main']
+
+    # act
+    result = subprocess.run(command, cwd=Path(__file__).parents[1], capture_output=True, text=True, check=True)
+
+    # assert
+    imports = {}
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative, name = line.split('|')
+        imports[name.strip()] = int(cumulative)
+    assert imports['main'] < imports['fastapi'] * MAIN_IMPORT_SHARE
+    deferred = [
+        name for name in imports if any(name == module or name.startswith(f'{module}.') for module in DEFERRED_MODULES)
+    ]
+    assert not deferred
+
+
+def test_service_paths_resolve():
+    """Assert every service a route depends on resolves to a class in both flavours"""
+    # arrange
+    dependencies = [
+        parameter.default.dependency
+        for route in router.routes
+        for parameter in inspect.signature(route.endpoint).parameters.values()
+        if isinstance(parameter.default, params.Depends)
+    ]
+    service_paths = [path for dependency in dependencies for path in getattr(dependency, 'service_paths', ())]
+
+    # act
+    service_classes = [load_service_class(service_path) for service_path in service_paths]
+
+    # assert
+    assert 'services.tasks.get_task_list_srv.AsyncGetTaskListService' in service_paths
+    assert all(callable(getattr(service_class, 'execute', None)) for service_class in service_classes)
+
+
+@pytest.mark.parametrize(
+    'update',
+    [
+        {},
+        {'use_async': True},
+        {'group_commit': True},
+        {'cache_ttl': 60},
+        {'use_async': True, 'cache_ttl': 60},
+        {'metrics': True, 'group_commit': True, 'cache_ttl': 60},
+        {'metrics': True, 'use_async': True},
+    ],
+)
+def test_create_app(settings, update):
+    """Assert create_app behaviour"""
+    # arrange
+    app = create_app(settings.model_copy(update=update))
+
+    # act
+    with TestClient(app) as client:
+        client.post('/tasks', data={'description': 'First task'})
+        client.post('/tasks', data={'description': 'Second task'})
+        response = client.get('/tasks')
+
+    # assert
+    assert response.status_code == 200
+    assert 'First task' in response.text
+    assert 'Second task' not in response.text
+    assert '/tasks/page?after=' in response.text
+
+
+def test_metrics(settings):
+    """Assert the metrics route exposes the request, query and template metrics, unless they are disabled"""
+    # arrange
+    app = create_app(settings.model_copy(update={'metrics': True}))
+    disabled_app = create_app(settings)
+
+    # act
+    with TestClient(app) as client:
+        client.get('/tasks/1')
+        response = client.get('/metrics')
+    with TestClient(disabled_app) as client:
+        disabled_response = client.get('/metrics')
+
+    # assert
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/plain')
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/tasks/{task_id}",status="200"} 1.0' in response.text
+    )
+    assert 'db_queries_per_operation_count{operation="get_task"} 1.0' in response.text
+    assert 'template_render_seconds_count{template="/task_input.html"} 1.0' in response.text
+    assert 'db_pool_connections{pool="write"' in response.text
+    assert disabled_response.status_code == 404
+
+
+def test_home_page_query_count(query_count_client, caplog):
+    """Assert the home page reads its tasks and their counts in a single query"""
+    # act
+    response = query_count_client.get('/')
+
+    # assert
+    assert request_queries(response) == 1, '\n'.join(caplog.messages)
+
+
+def test_get_tasks_query_count(query_count_client, caplog):
+    """Assert the task list reads its data version, then its tasks and their counts"""
+    # act
+    response = query_count_client.get('/tasks')
+
+    # assert
+    assert request_queries(response) == 2, '\n'.join(caplog.messages)
+
+
+def test_get_tasks_page_query_count(query_count_client, caplog):
+    """Assert a page of tasks is read in a single query"""
+    # act
+    response = query_count_client.get('/tasks/page', params={'after': 1})
+
+    # assert
+    assert request_queries(response) == 1, '\n'.join(caplog.messages)
+
+
+def test_search_tasks_query_count(query_count_client, caplog):
+    """Assert a search reads its matching tasks in a single query"""
+    # act
+    response = query_count_client.get('/tasks/search', params={'q': 'task'})
+
+    # assert
+    assert request_queries(response) == 1, '\n'.join(caplog.messages)
+
+
+def test_get_task_query_count(query_count_client, caplog):
+    """Assert the task input reads its task in a single query"""
+    # act
+    response = query_count_client.get('/tasks/2')
+
+    # assert
+    assert request_queries(response) == 1, '\n'.join(caplog.messages)
+
+
+def test_get_task_row_query_count(query_count_client, caplog):
+    """Assert a task row reads its task, then the counts of the footer"""
+    # act
+    response = query_count_client.get('/tasks/2/row')
+
+    # assert
+    assert request_queries(response) == 2, '\n'.join(caplog.messages)
+
+
+def test_get_status_query_count(query_count_client, caplog):
+    """Assert the footer reads its data version, then its counts"""
+    # act
+    response = query_count_client.get('/status')
+
+    # assert
+    assert request_queries(response) == 2, '\n'.join(caplog.messages)
+
+
+def test_get_header_query_count(query_count_client, caplog):
+    """Assert the header reads its data version only"""
+    # act
+    response = query_count_client.get('/header')
+
+    # assert
+    assert request_queries(response) == 1, '\n'.join(caplog.messages)
+
+
+def test_add_task_query_count(query_count_client, caplog):
+    """Assert adding a task inserts it and bumps the data version, then reads the list in a single query"""
+    # act
+    response = query_count_client.post('/tasks', data={'description': 'Fourth task'})
+
+    # assert
+    assert request_queries(response) == 3, '\n'.join(caplog.messages)
+
+
+def test_update_task_description_query_count(query_count_client, caplog):
+    """Assert updating a task description runs the update and the data version bump only"""
+    # act
+    response = query_count_client.post('/tasks/2', data={'description': 'New description'})
+
+    # assert
+    assert request_queries(response) == 2, '\n'.join(caplog.messages)
+
+
+def test_mark_task_as_completed_query_count(query_count_client, caplog):
+    """Assert completing a task updates it and bumps the data version, then reads the footer counts"""
+    # act
+    response = query_count_client.put('/tasks/2/complete')
+
+    # assert
+    assert request_queries(response) == 3, '\n'.join(caplog.messages)
+
+
+def test_mark_task_as_not_completed_query_count(query_count_client, caplog):
+    """Assert reopening a task updates it and bumps the data version, then reads the footer counts"""
+    # act
+    response = query_count_client.put('/tasks/1/uncomplete')
+
+    # assert
+    assert request_queries(response) == 3, '\n'.join(caplog.messages)
+
+
+def test_toggle_all_tasks_query_count(query_count_client, caplog):
+    """Assert toggling every task takes one update and the data version bump, then reads the list in a single query"""
+    # act
+    response = query_count_client.post('/tasks/toggle')
+
+    # assert
+    assert request_queries(response) == 3, '\n'.join(caplog.messages)
+
+
+def test_clear_completed_query_count(query_count_client, caplog):
+    """Assert clearing the completed tasks takes one delete and the version bump, then reads the list in one query"""
+    # act
+    response = query_count_client.post('/tasks/clear')
+
+    # assert
+    assert request_queries(response) == 3, '\n'.join(caplog.messages)
+
+
+def test_delete_task_query_count(query_count_client, caplog):
+    """Assert deleting a task deletes it and bumps the data version, then reads the footer counts"""
+    # act
+    response = query_count_client.delete('/task/2')
+
+    # assert
+    assert request_queries(response) == 3, '\n'.join(caplog.messages)
+
+
+@pytest.mark.parametrize('url', ['/tasks', '/status', '/header'])
+def test_cache_validators_are_scoped_to_the_list(settings, url):
+    """Assert the validators of one list never answer a conditional request for another list at the same version"""
+    # arrange
+    engine = create_engine(settings.database_url)
+    with Session(engine) as session:
+        other_list_id = add_task_list(session, 'default', 'Other tasks')
+    engine.dispose()
+    app = create_app(settings)
+
+    # act
+    with TestClient(app) as client:
+        response = client.get(url)
+        cached_response = client.get(url, headers={'If-None-Match': response.headers['etag']})
+        client.cookies.set('list_id', str(other_list_id))
+        other_response = client.get(url, headers={'If-None-Match': response.headers['etag']})
+
+    # assert
+    assert cached_response.status_code == 304
+    assert other_response.status_code == 200
+    assert other_response.headers['etag'] != response.headers['etag']
+    assert response.headers['vary'] == 'Cookie'
+    assert response.headers['cache-control'] == 'private, no-cache'
+
+
+@pytest.mark.parametrize('use_async', [False, True])
+def test_cached_lists_match_their_validators_across_workers(settings, use_async):
+    """Assert a worker never sends a cached list under the validators of a write made by another worker"""
+    # arrange
+    update = {'use_async': use_async, 'cache_ttl': 60, 'page_size': 50}
+    worker_app = create_app(settings.model_copy(update=update))
+    other_worker_app = create_app(settings.model_copy(update=update))
+
+    # act
+    with TestClient(worker_app) as client, TestClient(other_worker_app) as other_client:
+        client.post('/tasks', data={'description': 'First task'})
+        cached_response = client.get('/tasks')
+        other_client.post('/tasks', data={'description': 'Second task'})
+        response = client.get('/tasks')
+        revalidated_response = client.get('/tasks', headers={'If-None-Match': cached_response.headers['etag']})
+
+    # assert
+    assert 'Second task' not in cached_response.text
+    assert response.headers['etag'] != cached_response.headers['etag']
+    assert 'Second task' in response.text
+    assert revalidated_response.status_code == 200
+    assert 'Second task' in revalidated_response.text
+
+
+@pytest.mark.parametrize('use_async', [False, True])
+def test_task_lists_are_restricted_to_their_owner(settings, use_async):
+    """Assert a client only works on the lists of the user named by the trusted header"""
+    # arrange
+    engine = create_engine(settings.database_url)
+    with Session(engine) as session:
+        alice_list_id = add_task_list(session, 'alice', 'Groceries')
+        bob_list_id = add_task_list(session, 'bob', 'Chores')
+    engine.dispose()
+    app = create_app(settings.model_copy(update={'use_async': use_async, 'user_header': 'X-Forwarded-User'}))
+
+    # act
+    with TestClient(app) as client:
+        anonymous_response = client.get('/tasks')
+        client.headers['X-Forwarded-User'] = 'alice'
+        client.post('/tasks', data={'description': 'Buy milk'})
+        client.cookies.set('list_id', str(bob_list_id))
+        foreign_response = client.post('/tasks', data={'description': 'Walk the dog'})
+        client.cookies.set('list_id', '999')
+        unknown_response = client.get('/tasks')
+        client.cookies.set('list_id', str(alice_list_id))
+        own_response = client.get('/tasks')
+        client.headers['X-Forwarded-User'] = 'bob'
+        client.cookies.delete('list_id')
+        bob_response = client.get('/tasks')
+
+    # assert
+    assert anonymous_response.status_code == 401
+    assert foreign_response.status_code == 404
+    assert unknown_response.status_code == 404
+    assert 'Buy milk' in own_response.text
+    assert own_response.headers['vary'] == 'Cookie, X-Forwarded-User'
+    assert own_response.headers['cache-control'] == 'private, no-cache'
+    assert bob_response.status_code == 200
+    assert 'Buy milk' not in bob_response.text
+    assert 'Walk the dog' not in bob_response.text
+
+
+@pytest.mark.parametrize('use_async', [False, True])
+def test_update_task_description_outside_the_list(settings, use_async):
+    """Assert updating the description of a missing task or of a task of another list answers 404"""
+    # arrange
+    engine = create_engine(settings.database_url)
+    with Session(engine) as session:
+        other_list_id = add_task_list(session, 'default', 'Other tasks')
+    engine.dispose()
+    app = create_app(settings.model_copy(update={'use_async': use_async}))
+
+    # act
+    with TestClient(app) as client:
+        client.cookies.set('list_id', str(other_list_id))
+        client.post('/tasks', data={'description': 'Buy milk'})
+        client.cookies.delete('list_id')
+        other_list_response = client.post('/tasks/1', data={'description': 'Walk the dog'})
+        missing_response = client.post('/tasks/2', data={'description': 'Walk the dog'})
+        client.cookies.set('list_id', str(other_list_id))
+        export_response = client.get('/tasks/export')
+
+    # assert
+    assert other_list_response.status_code == 404
+    assert missing_response.status_code == 404
+    assert 'Buy milk' in export_response.text
+
+
+@pytest.mark.parametrize('use_async', [False, True])
+def test_export_tasks(settings, use_async):
+    """Assert the tasks are exported as JSON Lines and CSV files"""
+    # arrange
+    app = create_app(settings.model_copy(update={'use_async': use_async}))
+
+    # act
+    with TestClient(app) as client:
+        client.post('/tasks', data={'description': 'Buy "café", milk'})
+        client.put('/tasks/1/complete')
+        client.post('/tasks', data={'description': 'Walk the dog'})
+        jsonl_response = client.get('/tasks/export')
+        csv_response = client.get('/tasks/export', params={'format': 'csv', 'completed': False})
+
+    # assert
+    assert jsonl_response.text == (
+        '{"id":1,"description":"Buy \\"café\\", milk","completed":true}\n'
+        '{"id":2,"description":"Walk the dog","completed":false}\n'
+    )
+    assert csv_response.text == 'id,description,completed\r\n2,Walk the dog,false\r\n'
+
+
+def test_home_page_identifies_its_client(settings):
+    """Assert the home page sends a client id of its own with its requests and its event stream"""
+    # arrange
+    app = create_app(settings)
+
+    # act
+    with TestClient(app) as client:
+        responses = [client.get('/') for _ in range(2)]
+
+    # assert
+    client_ids = [
+        re.search(r'connect:/events\?client=([0-9a-f]{32})', response.text).group(1) for response in responses
+    ]
+    assert client_ids[0] != client_ids[1]
+    assert f'{{"X-Client-Id": "{client_ids[0]}"}}' in responses[0].text
+
+
+async def test_iter_server_sent_events():
+    """Assert iter_server_sent_events formats the channel events and keeps idle streams alive"""
+    # arrange
+    broker = InProcessEventBroker()
+    events = iter_server_sent_events(broker, 1, keepalive=0.01)
+
+    # act
+    keepalive = await events.__anext__()
+    broker.publish(1, TaskEvent.task_changed(2))
+    message = await events.__anext__()
+    await events.aclose()
+
+    # assert
+    assert keepalive == ': keepalive\n\n'
+    assert message == 'event: task-2\ndata: {"name":"task-2","task_id":2}\n\n'
+    assert broker.subscriber_count(1) == 0
+
+
+@pytest.mark.parametrize('use_async', [False, True])
+async def test_event_stream_releases_its_connection(settings, use_async):
+    """Assert an open event stream holds no pooled connection, so a one-connection pool still serves other reads"""
+    # arrange
+    engine = create_engine(settings.database_url)
+    with Session(engine) as session:
+        add_task_list(session, 'alice', 'Groceries')
+    engine.dispose()
+    update = {'use_async': use_async, 'user_header': 'X-Forwarded-User', 'pool_size': 1, 'pool_max_overflow': 0}
+    app = create_app(settings.model_copy(update=update))
+    headers = [(b'x-forwarded-user', b'alice')]
+    scope = {
+        'type': 'http',
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': '/events',
+        'raw_path': b'/events',
+        'root_path': '',
+        'query_string': b'',
+        'headers': headers,
+        'client': ('testclient', 50000),
+        'server': ('testserver', 80),
+    }
+    disconnected = asyncio.Event()
+    started = asyncio.Event()
+
+    async def receive():
+        await disconnected.wait()
+        return {'type': 'http.disconnect'}
+
+    async def send(message):
+        if message['type'] == 'http.response.start':
+            started.set()
+
+    # act
+    stream = asyncio.create_task(app(scope, receive, send))
+    await asyncio.wait_for(started.wait(), 5)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://testserver') as client:
+        response = await asyncio.wait_for(client.get('/', headers=dict(headers)), 5)
+    disconnected.set()
+    await asyncio.wait_for(stream, 5)
+
+    # assert
+    assert response.status_code == 200
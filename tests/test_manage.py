@@ -0,0 +1,34 @@
+from manage import add_task_list
+from manage import load_sample_data
+from schema.task_list_sch import SQLAlchemyTaskList
+from schema.task_sch import SQLAlchemyTask
+from sqlalchemy import func
+from sqlalchemy import select
+
+
+def test_load_sample_data(test_db_session):
+    """Assert load_sample_data behaviour"""
+    # arrange
+    added = load_sample_data(test_db_session, 1)
+
+    # act
+    added_again = load_sample_data(test_db_session, 1)
+
+    # assert
+    assert added == 2
+    assert added_again == 0
+    assert test_db_session.scalar(select(func.count()).select_from(SQLAlchemyTask)) == 2
+
+
+def test_add_task_list(test_db_session):
+    """Assert add_task_list behaviour"""
+    # arrange
+    first_list_id = add_task_list(test_db_session, 'alice', 'Groceries')
+
+    # act
+    second_list_id = add_task_list(test_db_session, 'alice', 'Work')
+
+    # assert
+    task_lists = test_db_session.scalars(select(SQLAlchemyTaskList).order_by(SQLAlchemyTaskList.id)).all()
+    assert [task_list.id for task_list in task_lists] == [1, first_list_id, second_list_id]
+    assert task_lists[1].user_id == task_lists[2].user_id != task_lists[0].user_id